@@ -0,0 +1,777 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# Minimal pure Python stand-in for the Blender modules (bpy, mathutils, bmesh, addon_utils).
+# Only what the addon uses at import time and in the benchmarked functions is implemented.
+# The timings measure the Python side of the addon, not the cost of the real RNA calls.
+
+import sys
+import types
+import numpy
+
+
+# ---------------------------------------------------------------------------
+# Generic helpers
+
+
+class Permissive():
+    """
+    Object accepting any attribute or call, used for the parts of bpy the benchmarks do not measure.
+    """
+
+    def __init__(self, name="bpy"):
+        self._name = name
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = Permissive(f"{self._name}.{name}")
+        setattr(self, name, value)
+        return value
+
+    def __call__(self, *args, **kwargs):
+        return {'FINISHED'}
+
+    def poll(self, *args, **kwargs):
+        return True
+
+
+class DataCollection(list):
+    """
+    bpy_prop_collection like list: access by index or by name.
+    """
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            for item in self:
+                if item.name == key:
+                    return item
+            raise KeyError(key)
+        return list.__getitem__(self, key)
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return any(item.name == key for item in self)
+        return list.__contains__(self, key)
+
+    def get(self, key, default=None):
+        for item in self:
+            if item.name == key:
+                return item
+        return default
+
+    def find(self, key):
+        for index, item in enumerate(self):
+            if item.name == key:
+                return index
+        return -1
+
+
+class Vector(list):
+
+    def __init__(self, values=(0.0, 0.0, 0.0)):
+        list.__init__(self, [float(value) for value in values])
+
+    def copy(self):
+        return Vector(self)
+
+    @property
+    def x(self):
+        return self[0]
+
+    @property
+    def y(self):
+        return self[1]
+
+
+class Quaternion(list):
+
+    def __init__(self, axis=(0.0, 0.0, 0.0), angle=0.0):
+        list.__init__(self, [1.0, 0.0, 0.0, 0.0])
+
+
+class bpy_prop_array(list):
+    pass
+
+
+# ---------------------------------------------------------------------------
+# Animation data
+
+
+ENUM_ITEMS = {
+    "interpolation": [
+        'CONSTANT', 'LINEAR', 'BEZIER', 'SINE', 'QUAD', 'CUBIC', 'QUART', 'QUINT', 'EXPO', 'CIRC', 'BACK', 'BOUNCE',
+        'ELASTIC',
+    ],
+    "easing": ['AUTO', 'EASE_IN', 'EASE_OUT', 'EASE_IN_OUT'],
+    "handle_left_type": ['FREE', 'AUTO', 'VECTOR', 'ALIGNED', 'AUTO_CLAMPED'],
+    "handle_right_type": ['FREE', 'AUTO', 'VECTOR', 'ALIGNED', 'AUTO_CLAMPED'],
+    "type": ['KEYFRAME', 'BREAKDOWN', 'MOVING_HOLD', 'EXTREME', 'JITTER', 'GENERATED'],
+}
+
+# Blender DNA codes of the interpolation enum, the RNA order is different.
+INTERPOLATION_CODES = {
+    'CONSTANT': 0, 'LINEAR': 1, 'BEZIER': 2, 'BACK': 3, 'BOUNCE': 4, 'CIRC': 5, 'CUBIC': 6,
+    'ELASTIC': 7, 'EXPO': 8, 'QUAD': 9, 'QUART': 10, 'QUINT': 11, 'SINE': 12,
+}
+
+
+def get_enum_code(attr, value):
+    if attr == "interpolation":
+        return INTERPOLATION_CODES[value]
+    return ENUM_ITEMS[attr].index(value)
+
+
+def get_enum_value(attr, code):
+    if attr == "interpolation":
+        for name, name_code in INTERPOLATION_CODES.items():
+            if name_code == code:
+                return name
+    return ENUM_ITEMS[attr][int(code)]
+
+
+class Keyframe():
+
+    def __init__(self, frame=0.0, value=0.0):
+        self.co = Vector((frame, value))
+        self.handle_left = Vector((frame - 0.5, value))
+        self.handle_right = Vector((frame + 0.5, value))
+        self.interpolation = 'BEZIER'
+        self.easing = 'AUTO'
+        self.handle_left_type = 'AUTO_CLAMPED'
+        self.handle_right_type = 'AUTO_CLAMPED'
+        self.type = 'KEYFRAME'
+        self.back = 1.70158
+        self.amplitude = 0.8
+        self.period = 4.1
+        self.select_control_point = False
+
+
+class FCurveKeyframePoints(list):
+
+    def add(self, count=1):
+        for index in range(count):
+            self.append(Keyframe())
+
+    def clear(self):
+        del self[:]
+
+    def insert(self, frame, value, options=set(), keyframe_type='KEYFRAME'):
+        key = Keyframe(frame, value)
+        key.type = keyframe_type
+        for index, other in enumerate(self):
+            if other.co[0] == frame:
+                self[index] = key
+                return key
+            if other.co[0] > frame:
+                list.insert(self, index, key)
+                return key
+        self.append(key)
+        return key
+
+    def foreach_get(self, attr, buffer):
+        if attr in ENUM_ITEMS:
+            values = [get_enum_code(attr, getattr(key, attr)) for key in self]
+        elif attr in ("co", "handle_left", "handle_right"):
+            values = [component for key in self for component in getattr(key, attr)]
+        else:
+            values = [getattr(key, attr) for key in self]
+        buffer[:] = values
+
+    def foreach_set(self, attr, buffer):
+        if attr in ENUM_ITEMS:
+            for key, code in zip(self, buffer):
+                setattr(key, attr, get_enum_value(attr, code))
+        elif attr in ("co", "handle_left", "handle_right"):
+            for index, key in enumerate(self):
+                setattr(key, attr, Vector((buffer[index * 2], buffer[index * 2 + 1])))
+        else:
+            for key, value in zip(self, buffer):
+                setattr(key, attr, float(value))
+
+
+class FModifier():
+
+    def __init__(self, modifier_type='GENERATOR'):
+        self.type = modifier_type
+        self.mute = False
+        self.active = False
+        self.influence = 1.0
+
+
+class FModifierGenerator(FModifier):
+    pass
+
+
+class FCurveModifiers(list):
+
+    def new(self, type='GENERATOR'):
+        modifier = FModifierGenerator(type)
+        self.append(modifier)
+        return modifier
+
+
+class DriverTarget():
+
+    def __init__(self):
+        self.id_type = 'OBJECT'
+        self.id = None
+        self.data_path = ""
+        self.bone_target = ""
+        self.transform_type = 'LOC_X'
+        self.transform_space = 'WORLD_SPACE'
+        self.rotation_mode = 'AUTO'
+
+
+class DriverVariable():
+
+    def __init__(self):
+        self.name = "var"
+        self.type = 'SINGLE_PROP'
+        self.targets = [DriverTarget(), DriverTarget()]
+
+
+class DriverVariables(list):
+
+    def new(self):
+        variable = DriverVariable()
+        self.append(variable)
+        return variable
+
+
+class Driver():
+
+    def __init__(self):
+        self.type = 'SCRIPTED'
+        self.expression = "var"
+        self.use_self = False
+        self.variables = DriverVariables()
+
+
+class FCurve():
+
+    def __init__(self, data_path="", array_index=0, id_data=None):
+        self.data_path = data_path
+        self.array_index = array_index
+        self.id_data = id_data
+        self.keyframe_points = FCurveKeyframePoints()
+        self.modifiers = FCurveModifiers()
+        self.driver = None
+        self.group = None
+        self.extrapolation = 'CONSTANT'
+        self.lock = False
+        self.mute = False
+        self.hide = False
+        self.select = False
+        self.color_mode = 'AUTO_RAINBOW'
+
+    def range(self):
+        if len(self.keyframe_points) == 0:
+            return Vector((0.0, 0.0))
+        return Vector((self.keyframe_points[0].co[0], self.keyframe_points[-1].co[0]))
+
+    def evaluate(self, frame):
+        frames = [key.co[0] for key in self.keyframe_points]
+        values = [key.co[1] for key in self.keyframe_points]
+        return float(numpy.interp(frame, frames, values))
+
+    def update(self):
+        pass
+
+
+class ActionGroup():
+
+    def __init__(self, name):
+        self.name = name
+        self.channels = []
+
+
+class ActionFCurves(list):
+
+    def __init__(self, action):
+        list.__init__(self)
+        self.action = action
+
+    def new(self, data_path, index=0, action_group=""):
+        fcurve = FCurve(data_path, index, self.action)
+        self.append(fcurve)
+        if action_group:
+            group = self.action.groups.get(action_group)
+            if group is None:
+                group = ActionGroup(action_group)
+                self.action.groups.append(group)
+            group.channels.append(fcurve)
+            fcurve.group = group
+        return fcurve
+
+    def find(self, data_path, index=0):
+        for fcurve in self:
+            if fcurve.data_path == data_path and fcurve.array_index == index:
+                return fcurve
+        return None
+
+    def remove(self, fcurve):
+        list.remove(self, fcurve)
+        if fcurve.group is not None:
+            fcurve.group.channels.remove(fcurve)
+
+    def foreach_get(self, attr, buffer):
+        buffer[:] = [getattr(fcurve, attr) for fcurve in self]
+
+    def foreach_set(self, attr, values):
+        for fcurve, value in zip(self, values):
+            setattr(fcurve, attr, value)
+
+
+class ID():
+
+    def __init__(self, name):
+        self.name = name
+        self.library = None
+        self.override_library = None
+        self.users = 1
+        self.use_fake_user = False
+        self.id_properties = {}
+
+    def keys(self):
+        return self.id_properties.keys()
+
+    def __getitem__(self, key):
+        return self.id_properties[key]
+
+    def __setitem__(self, key, value):
+        self.id_properties[key] = value
+
+    def as_pointer(self):
+        return id(self)
+
+
+class Action(ID):
+
+    def __init__(self, name):
+        ID.__init__(self, name)
+        self.fcurves = ActionFCurves(self)
+        self.groups = DataCollection()
+        self.id_root = 'OBJECT'
+        self.pose_markers = DataCollection()
+        self.use_frame_range = False
+        self.frame_start = 0.0
+        self.frame_end = 1.0
+        self.use_cyclic = False
+
+    @property
+    def frame_range(self):
+        ranges = [fcurve.range() for fcurve in self.fcurves if len(fcurve.keyframe_points) > 0]
+        if not ranges:
+            return Vector((0.0, 1.0))
+        return Vector((min(r[0] for r in ranges), max(r[1] for r in ranges)))
+
+
+class AnimDataDrivers(list):
+    pass
+
+
+class AnimData():
+
+    def __init__(self):
+        self.action = None
+        self.drivers = AnimDataDrivers()
+        self.nla_tracks = []
+        self.action_extrapolation = 'HOLD'
+        self.action_blend_type = 'REPLACE'
+        self.action_influence = 1.0
+
+
+# ---------------------------------------------------------------------------
+# Objects
+
+
+class Bone():
+
+    def __init__(self, name, parent=None):
+        self.name = name
+        self.parent = parent
+        self.select = False
+        self.hide = False
+        self.use_deform = True
+
+
+class ArmatureBones(DataCollection):
+    active = None
+
+
+class Armature(ID):
+
+    def __init__(self, name):
+        ID.__init__(self, name)
+        self.bones = ArmatureBones()
+
+
+class PoseBone():
+
+    def __init__(self, bone):
+        self.bone = bone
+        self.name = bone.name
+        self.location = Vector()
+        self.rotation_euler = Vector()
+        self.rotation_quaternion = Quaternion()
+        self.scale = Vector((1.0, 1.0, 1.0))
+
+
+class Pose():
+
+    def __init__(self):
+        self.bones = DataCollection()
+
+
+class VertexGroupElement():
+
+    def __init__(self, group, weight):
+        self.group = group
+        self.weight = weight
+
+
+class MeshVertex():
+
+    def __init__(self, index):
+        self.index = index
+        self.groups = []
+
+
+class Mesh(ID):
+
+    def __init__(self, name, vertex_count=0):
+        ID.__init__(self, name)
+        self.vertices = [MeshVertex(index) for index in range(vertex_count)]
+
+
+class VertexGroup():
+
+    def __init__(self, obj, name, index):
+        self.obj = obj
+        self.name = name
+        self.index = index
+
+    def add(self, indices, weight, type):
+        vertices = self.obj.data.vertices
+        for index in indices:
+            groups = vertices[index].groups
+            for element in groups:
+                if element.group == self.index:
+                    element.weight = weight
+                    break
+            else:
+                groups.append(VertexGroupElement(self.index, weight))
+
+
+class VertexGroups(DataCollection):
+
+    def __init__(self, obj):
+        DataCollection.__init__(self)
+        self.obj = obj
+
+    def new(self, name="Group"):
+        group = VertexGroup(self.obj, name, len(self))
+        self.append(group)
+        return group
+
+    def remove(self, group):
+        index = self.index(group)
+        list.remove(self, group)
+        for vertex in self.obj.data.vertices:
+            vertex.groups = [element for element in vertex.groups if element.group != group.index]
+            for element in vertex.groups:
+                if element.group > index:
+                    element.group -= 1
+        for other in self[index:]:
+            other.index -= 1
+
+
+class Object(ID):
+
+    def __init__(self, name, data=None, object_type='EMPTY'):
+        ID.__init__(self, name)
+        self.data = data
+        self.type = object_type
+        self.mode = 'OBJECT'
+        self.animation_data = None
+        self.pose = Pose() if object_type == 'ARMATURE' else None
+        self.vertex_groups = VertexGroups(self)
+        self.hide_select = False
+        self.hide_viewport = False
+        self.location = bpy_prop_array([0.0, 0.0, 0.0])
+        self.rotation_euler = bpy_prop_array([0.0, 0.0, 0.0])
+        self.scale = bpy_prop_array([1.0, 1.0, 1.0])
+        self._select = False
+        self._hide = False
+
+    def select_get(self):
+        return self._select
+
+    def select_set(self, state):
+        self._select = state
+
+    def hide_get(self):
+        return self._hide
+
+    def hide_set(self, state):
+        self._hide = state
+
+    def animation_data_create(self):
+        if self.animation_data is None:
+            self.animation_data = AnimData()
+        return self.animation_data
+
+    def animation_data_clear(self):
+        self.animation_data = None
+
+    def path_resolve(self, path, coerce=True):
+        if path.startswith('["'):
+            return 0.0
+        return getattr(self, path, 0.0)
+
+    def driver_add(self, path, index=-1):
+        self.animation_data_create()
+        fcurve = FCurve(path, max(index, 0), self)
+        fcurve.driver = Driver()
+        fcurve.modifiers.new()
+        self.animation_data.drivers.append(fcurve)
+        return fcurve
+
+
+class LayerCollection():
+
+    def __init__(self, name):
+        self.name = name
+        self.exclude = False
+        self.hide_viewport = False
+        self.children = []
+
+
+class Collection(ID):
+
+    def __init__(self, name):
+        ID.__init__(self, name)
+        self.hide_select = False
+        self.hide_viewport = False
+
+
+class ViewLayerObjects(DataCollection):
+    active = None
+
+
+class ViewLayer():
+
+    def __init__(self, name):
+        self.name = name
+        self.layer_collection = LayerCollection("Scene Collection")
+        self.objects = ViewLayerObjects()
+
+
+class Scene(ID):
+
+    def __init__(self, name="Scene"):
+        ID.__init__(self, name)
+        self.objects = DataCollection()
+        self.view_layers = DataCollection([ViewLayer("ViewLayer")])
+        self.render = types.SimpleNamespace(use_simplify=False, fps=24, fps_base=1.0)
+        self.frame_start = 1
+        self.frame_end = 250
+        self.use_preview_range = False
+
+
+class Dopesheet():
+
+    def __init__(self):
+        self.filter_text = ""
+        self.use_filter_invert = False
+        self.show_only_selected = False
+
+
+class UILayout():
+    """
+    Layout accepting the calls of the panel draw functions, operator properties are kept on a namespace.
+    """
+
+    def box(self):
+        return UILayout()
+
+    def row(self, **kwargs):
+        return UILayout()
+
+    def column(self, **kwargs):
+        return UILayout()
+
+    def grid_flow(self, **kwargs):
+        return UILayout()
+
+    def label(self, **kwargs):
+        pass
+
+    def prop(self, *args, **kwargs):
+        pass
+
+    def separator(self, **kwargs):
+        pass
+
+    def operator(self, idname, **kwargs):
+        return types.SimpleNamespace(bl_idname=idname)
+
+
+class BlendData():
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.actions = DataCollection()
+        self.objects = DataCollection()
+        self.collections = DataCollection()
+        self.meshes = DataCollection()
+        self.armatures = DataCollection()
+        self.scenes = DataCollection([Scene()])
+        self.filepath = ""
+
+
+class Context():
+
+    def __init__(self, data):
+        self.data = data
+        self.window_manager = None
+        self.preferences = Permissive("bpy.context.preferences")
+        self.space_data = types.SimpleNamespace(type='GRAPH_EDITOR', dopesheet=Dopesheet())
+        self.editable_fcurves = []
+        self.selected_objects = []
+        self.active_object = None
+
+    @property
+    def scene(self):
+        return self.data.scenes[0]
+
+    @property
+    def view_layer(self):
+        return self.scene.view_layers[0]
+
+    @property
+    def object(self):
+        return self.active_object
+
+
+# ---------------------------------------------------------------------------
+# Modules
+
+
+class TypesModule(types.ModuleType):
+    """
+    bpy.types: the classes above, unknown types are created as empty base classes.
+    """
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        cls = type(name, (), {})
+        setattr(self, name, cls)
+        return cls
+
+
+def property_function(*args, **kwargs):
+    return None
+
+
+class PropsModule(types.ModuleType):
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return property_function
+
+
+def install():
+    """
+    Registers the fake modules in sys.modules and returns the fake bpy module.
+    """
+    if "bpy" in sys.modules and getattr(sys.modules["bpy"], "is_fake_bpy", False):
+        return sys.modules["bpy"]
+
+    bpy = types.ModuleType("bpy")
+    bpy.is_fake_bpy = True
+    bpy.__path__ = []
+
+    bpy_types = TypesModule("bpy.types")
+    for cls in (
+        Keyframe, FCurveKeyframePoints, FModifier, FModifierGenerator, DriverTarget, DriverVariable, Driver,
+        FCurve, ActionGroup, ID, Action, AnimData, Bone, Armature, PoseBone, Pose, Mesh, MeshVertex,
+        VertexGroup, Object, Collection, LayerCollection, ViewLayer, Scene, bpy_prop_array, UILayout,
+    ):
+        setattr(bpy_types, cls.__name__, cls)
+    bpy_types.NlaStripFCurves = FCurve
+
+    bpy_props = PropsModule("bpy.props")
+
+    bpy_utils = types.ModuleType("bpy.utils")
+    bpy_utils.register_class = lambda cls: None
+    bpy_utils.unregister_class = lambda cls: None
+    bpy_utils.previews = Permissive("bpy.utils.previews")
+    bpy_utils.user_resource = lambda resource_type, path="", create=False: path
+
+    bpy_app = types.ModuleType("bpy.app")
+    bpy_app.version = (4, 2, 0)
+    bpy_app.version_string = "4.2.0"
+    bpy_app.binary_path = ""
+    bpy_app.background = True
+    bpy_app.timers = Permissive("bpy.app.timers")
+    bpy_app.handlers = types.ModuleType("bpy.app.handlers")
+    bpy_app.handlers.persistent = lambda function: function
+    handler_names = (
+        "load_pre", "load_post", "save_pre", "save_post", "undo_post", "redo_post", "depsgraph_update_post",
+    )
+    for handler_name in handler_names:
+        setattr(bpy_app.handlers, handler_name, [])
+    bpy_app.translations = types.ModuleType("bpy.app.translations")
+    bpy_app.translations.locale = "en_US"
+
+    bpy.types = bpy_types
+    bpy.props = bpy_props
+    bpy.utils = bpy_utils
+    bpy.app = bpy_app
+    bpy.data = BlendData()
+    bpy.context = Context(bpy.data)
+    bpy.ops = Permissive("bpy.ops")
+
+    mathutils = types.ModuleType("mathutils")
+    mathutils.Vector = Vector
+    mathutils.Quaternion = Quaternion
+    mathutils.Matrix = Permissive("mathutils.Matrix")
+    mathutils.Euler = Vector
+
+    addon_utils = types.ModuleType("addon_utils")
+    addon_utils.check = lambda module_name: (False, False)
+    addon_utils.modules = lambda *args, **kwargs: []
+    addon_utils._extension_module_name_decompose = lambda package: ("user_default", package)
+
+    sys.modules["bpy"] = bpy
+    sys.modules["bpy.types"] = bpy_types
+    sys.modules["bpy.props"] = bpy_props
+    sys.modules["bpy.utils"] = bpy_utils
+    sys.modules["bpy.app"] = bpy_app
+    sys.modules["bpy.app.handlers"] = bpy_app.handlers
+    sys.modules["bpy.app.translations"] = bpy_app.translations
+    sys.modules["mathutils"] = mathutils
+    sys.modules["bmesh"] = Permissive("bmesh")
+    sys.modules["addon_utils"] = addon_utils
+    return bpy
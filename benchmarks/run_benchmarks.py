@@ -0,0 +1,485 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# Synthetic benchmarks of the addon hot paths, runs with a plain Python (no Blender):
+# python benchmarks/run_benchmarks.py --output bench_results.json
+# The Blender modules are replaced by fake_bpy, see the note at the top of fake_bpy.py.
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+
+benchmarks_path = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, benchmarks_path)
+sys.path.insert(0, os.path.dirname(benchmarks_path))
+
+import fake_bpy
+bpy = fake_bpy.install()
+
+import graph_curve_filter
+from graph_curve_filter import bbpl
+from graph_curve_filter import gcf_ui
+from graph_curve_filter import gcf_filter_buttons
+from graph_curve_filter import gcf_filter_presets
+from graph_curve_filter import gcf_bone_filter
+from graph_curve_filter import gcf_duplicate_scan
+from graph_curve_filter import gcf_action_diff
+from graph_curve_filter import gcf_curve_stats
+from graph_curve_filter import gcf_derivative_filter
+from graph_curve_filter import gcf_frame_range_filter
+
+
+# ---------------------------------------------------------------------------
+# Synthetic data
+
+
+BONE_CHANNELS = [
+    ("location", 3),
+    ("rotation_euler", 3),
+    ("rotation_quaternion", 4),
+    ("scale", 3),
+]
+
+
+def get_bone_name(index):
+    return f"bone_{index:04d}"
+
+
+def new_action(name, fcurve_count, key_count=0, bone_count=None):
+    """
+    Creates an action with bone transform curves, bones get channels until fcurve_count is reached.
+    """
+    action = bpy.data.actions.get(name)
+    if action is not None:
+        bpy.data.actions.remove(action)
+    action = fake_bpy.Action(name)
+    bpy.data.actions.append(action)
+
+    bone_index = 0
+    while len(action.fcurves) < fcurve_count:
+        bone_name = get_bone_name(bone_index % bone_count if bone_count else bone_index)
+        for prop, array_length in BONE_CHANNELS:
+            for array_index in range(array_length):
+                if len(action.fcurves) >= fcurve_count:
+                    break
+                data_path = f'pose.bones["{bone_name}"].{prop}'
+                fcurve = action.fcurves.new(data_path, index=array_index, action_group=bone_name)
+                for key_index in range(key_count):
+                    fcurve.keyframe_points.insert(float(key_index * 2), float((key_index * 7 + array_index) % 5))
+        bone_index += 1
+    return action
+
+
+def new_armature(name, bone_count):
+    armature = fake_bpy.Armature(name)
+    obj = fake_bpy.Object(name, armature, 'ARMATURE')
+    parent = None
+    for index in range(bone_count):
+        bone = fake_bpy.Bone(get_bone_name(index), parent)
+        armature.bones.append(bone)
+        obj.pose.bones.append(fake_bpy.PoseBone(bone))
+        parent = bone if index % 10 else None
+    bpy.data.armatures.append(armature)
+    bpy.data.objects.append(obj)
+    return obj
+
+
+def new_skinned_mesh(name, vertex_count, group_count=4):
+    mesh = fake_bpy.Mesh(name, vertex_count)
+    obj = fake_bpy.Object(name, mesh, 'MESH')
+    for group_index in range(group_count):
+        obj.vertex_groups.new(name=get_bone_name(group_index))
+    for vertex in mesh.vertices:
+        # Two influences per vertex
+        first = vertex.index % group_count
+        second = (first + 1) % group_count
+        vertex.groups.append(fake_bpy.VertexGroupElement(first, 0.75))
+        vertex.groups.append(fake_bpy.VertexGroupElement(second, 0.25))
+    bpy.data.meshes.append(mesh)
+    bpy.data.objects.append(obj)
+    return obj
+
+
+def new_driven_object(name, driver_count):
+    obj = fake_bpy.Object(name)
+    for index in range(driver_count):
+        fcurve = obj.driver_add(f'["prop_{index}"]')
+        variable = fcurve.driver.variables.new()
+        variable.targets[0].id = obj
+        variable.targets[0].data_path = f'["input_{index}"]'
+        for key_index in range(4):
+            fcurve.keyframe_points.insert(float(key_index), float(key_index))
+    bpy.data.objects.append(obj)
+    return obj
+
+
+def new_scene(object_count, bone_count):
+    scene = bpy.context.scene
+    view_layer = bpy.context.view_layer
+    for index in range(object_count):
+        obj = fake_bpy.Object(f"object_{index:04d}")
+        bpy.data.objects.append(obj)
+        scene.objects.append(obj)
+        view_layer.objects.append(obj)
+        obj.select_set(index % 3 == 0)
+    for index in range(object_count // 10):
+        collection = fake_bpy.Collection(f"collection_{index:04d}")
+        bpy.data.collections.append(collection)
+        view_layer.layer_collection.children.append(fake_bpy.LayerCollection(collection.name))
+
+    armature = new_armature("rig", bone_count)
+    scene.objects.append(armature)
+    view_layer.objects.append(armature)
+    armature.select_set(True)
+    armature.data.bones.active = armature.data.bones[0]
+    bpy.context.active_object = armature
+    bpy.context.selected_objects = [obj for obj in scene.objects if obj.select_get()]
+
+
+def reset_data():
+    bpy.data.clear()
+    bpy.context = fake_bpy.Context(bpy.data)
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# Each benchmark has sizes, a setup(size) returning a state and a run(state) that is timed.
+
+
+CHANNEL_FILTERS = ("Location", "X Euler", "Quaternion", "Z Scale", "")
+
+
+def setup_channel_filter(size):
+    reset_data()
+    gcf_filter_presets.get_channel_name.cache_clear()
+    gcf_filter_presets.matched_channels.clear()
+    compiled_filters = [gcf_filter_presets.CompiledFilter(filter_text, False) for filter_text in CHANNEL_FILTERS]
+    return new_action("filter_action", size), compiled_filters
+
+
+def run_channel_filter(state):
+    # Filter buttons, then the channel counts of the filter presets list
+    action, compiled_filters = state
+    operator = gcf_ui.GCF_PT_GraphCurveFilter.GCF_OT_FilterSet()
+    for preset_index, compiled_filter in enumerate(compiled_filters):
+        operator.filter_name = compiled_filter.filter_text
+        operator.use_filter_invert = compiled_filter.use_filter_invert
+        operator.execute(bpy.context)
+        gcf_filter_presets.get_matched_channels(preset_index, compiled_filter, action)
+
+
+def setup_proxy_copy_fcurve(size):
+    reset_data()
+    source = new_action("source_action", size, key_count=50)
+    target = new_action("target_action", size)
+    return source, target
+
+
+def run_proxy_copy_fcurve(state):
+    source, target = state
+    for source_fcurve, target_fcurve in zip(source.fcurves, target.fcurves):
+        proxy = bbpl.anim_utils.ProxyCopy_FCurve(source_fcurve)
+        proxy.paste_data_on(target_fcurve)
+
+
+def setup_copy_drivers(size):
+    reset_data()
+    return new_driven_object("driven_source", size), fake_bpy.Object("driven_target")
+
+
+def run_copy_drivers(state):
+    source, target = state
+    bbpl.anim_utils.copy_drivers(source, target)
+
+
+def setup_rig_action_updater(size):
+    reset_data()
+    rig = new_armature("rig", size)
+    action = new_action("rig_action", size * 13, key_count=2, bone_count=size)
+    return rig, action
+
+
+def run_rig_action_updater(state):
+    rig, action = state
+    updater = bbpl.backward_compatibility.RigActionUpdater()
+    # Rename one bone out of ten, then remove the curves of another one out of ten.
+    bone_names = [bone.name for bone in rig.data.bones]
+    for bone_name in bone_names[::10]:
+        updater.update_action_curve_data_path(action, [f'"{bone_name}"'], f'"{bone_name}_renamed"')
+    remove_paths = [f'pose.bones["{bone_name}"]' for bone_name in bone_names[5::10]]
+    updater.remove_action_curve_by_data_path(action, remove_paths)
+
+
+def setup_skin_weight_mesh_updater(size):
+    reset_data()
+    return new_skinned_mesh("skinned_mesh", size)
+
+
+def run_skin_weight_mesh_updater(obj):
+    updater = bbpl.backward_compatibility.SkinWeightMeshUpdater()
+    updater.update_mesh_skin_weight(obj, [get_bone_name(0), get_bone_name(1)], "merged_group")
+
+
+def setup_user_scene_save(size):
+    reset_data()
+    new_scene(size, bone_count=size)
+    return None
+
+
+def run_user_scene_save(state):
+    scene_save = bbpl.save_data.scene_save.UserSceneSave()
+    scene_save.save_current_scene()
+    scene_save.reset_select()
+    scene_save.reset_scene_at_save()
+
+
+def setup_bone_channel_filter(size):
+    reset_data()
+    rig = new_armature("rig", size)
+    action = new_action("rig_action", size * 13, bone_count=size)
+    for bone in rig.data.bones[::4]:
+        bone.select = True
+    bbpl.channel_table.clear_channel_table()
+    return rig, action
+
+
+def run_bone_channel_filter(state):
+    # The first call parses the data paths, the next ones use the cached bone name column.
+    rig, action = state
+    for index in range(5):
+        bone_names = gcf_bone_filter.get_selected_bone_names(rig)
+        gcf_bone_filter.filter_action_bone_channels(action, bone_names)
+
+
+def setup_action_association_matrix(size):
+    # size actions against 20 rigs of 50 bones, each action animates the bones of one rig.
+    reset_data()
+    rigs = [new_armature(f"rig_{index:02d}", 50) for index in range(20)]
+    for rig_index, rig in enumerate(rigs):
+        for bone in rig.data.bones:
+            bone.name = f"rig_{rig_index:02d}_{bone.name}"
+    actions = []
+    for index in range(size):
+        action = new_action(f"action_{index:04d}", 50 * 13, bone_count=50)
+        rig_prefix = f"rig_{index % 20:02d}_"
+        for fcurve in action.fcurves:
+            fcurve.data_path = fcurve.data_path.replace('["', f'["{rig_prefix}', 1)
+        actions.append(action)
+    bbpl.channel_table.clear_channel_table()
+    return actions, rigs
+
+
+def run_action_association_matrix(state):
+    actions, rigs = state
+    bone_name_lists = [bbpl.basics.get_armature_bone_names(rig) for rig in rigs]
+    bbpl.basics.get_actions_association_matrix(actions, bone_name_lists)
+    bbpl.basics.get_actions_association_matrix(actions, bone_name_lists, use_ratio=True)
+
+
+def setup_duplicate_scan(size):
+    # size actions of 130 curves with 10 keys, one action out of two is a copy.
+    reset_data()
+    for index in range(size):
+        new_action(f"action_{index:04d}", 130, key_count=10 if index % 2 else 10 + index)
+    return list(bpy.data.actions)
+
+
+def run_duplicate_scan(actions):
+    gcf_duplicate_scan.scan_duplicates(actions)
+
+
+def setup_action_diff(size):
+    # Two versions of an action with size curves of 50 keys, one curve out of ten is edited.
+    reset_data()
+    action = new_action("action_a", size, key_count=50)
+    other_action = new_action("action_b", size, key_count=50)
+    for fcurve in other_action.fcurves[::10]:
+        fcurve.keyframe_points[10].co[1] += 1.0
+    return action, other_action
+
+
+def run_action_diff(actions):
+    action, other_action = actions
+    action_diff = gcf_action_diff.diff_actions(action, other_action)
+    gcf_action_diff.show_only_channels(action, action_diff.get_changed_channels(0.001))
+
+
+def setup_curve_stats(size):
+    reset_data()
+    return list(new_action("action", size, key_count=50).fcurves)
+
+
+def run_curve_stats(fcurves):
+    gcf_curve_stats.compute_fcurves_stats(fcurves)
+
+
+class DerivativeFilterSettings():
+    mode = 'ANY'
+    velocity_threshold = 1.0
+    acceleration_threshold = 2.0
+    frame_step = 1.0
+
+
+def setup_derivative_filter(size):
+    # The peaks are cached by the first filter, the run is one threshold drag of 20 updates.
+    reset_data()
+    action = new_action("action", size, key_count=50)
+    gcf_derivative_filter.clear_action_curve_stats()
+    gcf_derivative_filter.get_action_curve_stats(action)
+    return action
+
+
+def run_derivative_filter(action):
+    settings = DerivativeFilterSettings()
+    for index in range(20):
+        settings.velocity_threshold = index * 0.1
+        gcf_derivative_filter.filter_action_derivatives(action, settings)
+
+
+def setup_frame_range_filter(size):
+    # The key times are indexed by the first filter, the run is a pan of 20 view updates.
+    reset_data()
+    action = new_action("action", size, key_count=50)
+    gcf_frame_range_filter.clear_action_key_times()
+    gcf_frame_range_filter.get_action_key_times(action)
+    return action
+
+
+def run_frame_range_filter(action):
+    for index in range(20):
+        frame_start = index * 4.0
+        gcf_frame_range_filter.filter_action_frame_range(action, frame_start, frame_start + 50.0, index % 2)
+
+
+def setup_panel_draw(size):
+    reset_data()
+    panel = gcf_ui.GCF_PT_GraphCurveFilter()
+    panel.layout = fake_bpy.UILayout()
+    gcf_filter_buttons.filter_layout = gcf_filter_buttons.build_filter_layout()
+    return panel, size
+
+
+def run_panel_draw(state):
+    # Same as the redraws of the sidebar during playback
+    panel, redraw_count = state
+    for index in range(redraw_count):
+        panel.draw(bpy.context)
+
+
+BENCHMARKS = [
+    ("channel_filter", [1000, 10000, 50000], setup_channel_filter, run_channel_filter),
+    ("proxy_copy_fcurve", [100, 1000], setup_proxy_copy_fcurve, run_proxy_copy_fcurve),
+    ("copy_drivers", [50, 500], setup_copy_drivers, run_copy_drivers),
+    ("rig_action_updater", [50, 250, 1000], setup_rig_action_updater, run_rig_action_updater),
+    ("skin_weight_mesh_updater", [10000, 100000], setup_skin_weight_mesh_updater, run_skin_weight_mesh_updater),
+    ("user_scene_save", [100, 1000], setup_user_scene_save, run_user_scene_save),
+    ("panel_draw", [100, 1000], setup_panel_draw, run_panel_draw),
+    ("bone_channel_filter", [100, 1000, 5000], setup_bone_channel_filter, run_bone_channel_filter),
+    ("action_association_matrix", [100, 400], setup_action_association_matrix, run_action_association_matrix),
+    ("duplicate_scan", [20, 50], setup_duplicate_scan, run_duplicate_scan),
+    ("action_diff", [1000, 5000], setup_action_diff, run_action_diff),
+    ("curve_stats", [1000, 5000], setup_curve_stats, run_curve_stats),
+    ("derivative_filter", [1000, 20000], setup_derivative_filter, run_derivative_filter),
+    ("frame_range_filter", [1000, 20000], setup_frame_range_filter, run_frame_range_filter),
+]
+
+# Maximum median duration per size unit, checked with --check-budgets.
+# panel_draw: one redraw of the panel, measured about 0.02ms, far below a 60 fps playback frame (16ms).
+BUDGETS = {
+    "panel_draw": 0.00005,
+}
+
+
+def run_benchmark(name, size, setup, run, repeat):
+    durations = []
+    for index in range(repeat):
+        state = setup(size)
+        start = time.perf_counter()
+        run(state)
+        durations.append(time.perf_counter() - start)
+    result = {
+        "benchmark": name,
+        "size": size,
+        "repeat": repeat,
+        "min": min(durations),
+        "median": statistics.median(durations),
+        "mean": statistics.mean(durations),
+    }
+    if name in BUDGETS:
+        result["budget"] = BUDGETS[name] * size
+        result["over_budget"] = result["median"] > result["budget"]
+    return result
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Graph Curve Filter synthetic benchmarks.")
+    parser.add_argument("--output", default=None, help="Path of the JSON results.")
+    parser.add_argument("--filter", default="", help="Only run the benchmarks with this text in their name.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--quick", action="store_true", help="Only run the smallest size of each benchmark.")
+    parser.add_argument(
+        "--check-budgets", action="store_true", help="Exit with an error when a benchmark is over its budget."
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    # The addon prints on each updated curve or vertex group, keep only the results.
+    print_log = sys.stdout
+    results = []
+    for name, sizes, setup, run in BENCHMARKS:
+        if args.filter not in name:
+            continue
+        for size in sizes[:1] if args.quick else sizes:
+            sys.stdout = open(os.devnull, "w")
+            try:
+                result = run_benchmark(name, size, setup, run, args.repeat)
+            finally:
+                sys.stdout.close()
+                sys.stdout = print_log
+            results.append(result)
+            line = (
+                f"{name:<28} {size:>8} "
+                f"min {result['min'] * 1000:>10.2f}ms  median {result['median'] * 1000:>10.2f}ms"
+            )
+            if result.get("over_budget"):
+                line += f"  OVER BUDGET ({result['budget'] * 1000:.2f}ms)"
+            print(line)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=4)
+        print(f"Results saved to {args.output}")
+
+    if args.check_budgets and any(result.get("over_budget") for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
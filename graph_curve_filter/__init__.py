@@ -34,6 +34,17 @@ from . import bpl
 from . import bbpl
 from . import gcf_addon_pref
 from . import gcf_ui
+from . import gcf_operator_timing
+from . import gcf_filter_presets
+from . import gcf_bone_filter
+from . import gcf_timer_tasks
+from . import gcf_curve_process
+from . import gcf_curve_tools
+from . import gcf_duplicate_scan
+from . import gcf_action_diff
+from . import gcf_curve_stats
+from . import gcf_derivative_filter
+from . import gcf_frame_range_filter
 from . import gcf_basics
 from . import gcf_utils
 
@@ -47,6 +58,28 @@ if "bpy" in locals():
         importlib.reload(gcf_addon_pref)
     if "gcf_ui" in locals():
         importlib.reload(gcf_ui)
+    if "gcf_operator_timing" in locals():
+        importlib.reload(gcf_operator_timing)
+    if "gcf_filter_presets" in locals():
+        importlib.reload(gcf_filter_presets)
+    if "gcf_bone_filter" in locals():
+        importlib.reload(gcf_bone_filter)
+    if "gcf_timer_tasks" in locals():
+        importlib.reload(gcf_timer_tasks)
+    if "gcf_curve_process" in locals():
+        importlib.reload(gcf_curve_process)
+    if "gcf_curve_tools" in locals():
+        importlib.reload(gcf_curve_tools)
+    if "gcf_duplicate_scan" in locals():
+        importlib.reload(gcf_duplicate_scan)
+    if "gcf_action_diff" in locals():
+        importlib.reload(gcf_action_diff)
+    if "gcf_curve_stats" in locals():
+        importlib.reload(gcf_curve_stats)
+    if "gcf_derivative_filter" in locals():
+        importlib.reload(gcf_derivative_filter)
+    if "gcf_frame_range_filter" in locals():
+        importlib.reload(gcf_frame_range_filter)
     if "gcf_basics" in locals():
         importlib.reload(gcf_basics)
     if "gcf_utils" in locals():
@@ -57,6 +90,17 @@ bl_info = {}
 classes = (
 )
 
+# Undo and file load free the actions: a new action can get the pointer or the name of a cached one.
+ACTION_CACHE_HANDLERS = ("load_post", "undo_post", "redo_post")
+
+
+@bpy.app.handlers.persistent
+def clear_action_caches(*args):
+    bbpl.channel_table.clear_channel_table()
+    gcf_filter_presets.clear_compiled_presets()
+    gcf_derivative_filter.clear_action_curve_stats()
+    gcf_frame_range_filter.clear_action_key_times()
+
 
 def register():
     from bpy.utils import register_class
@@ -67,6 +111,20 @@ def register():
     bbpl.register()
     gcf_addon_pref.register()
     gcf_ui.register()
+    gcf_operator_timing.register()
+    gcf_filter_presets.register()
+    gcf_bone_filter.register()
+    gcf_timer_tasks.register()
+    gcf_curve_process.register()
+    gcf_curve_tools.register()
+    gcf_duplicate_scan.register()
+    gcf_action_diff.register()
+    gcf_curve_stats.register()
+    gcf_derivative_filter.register()
+    gcf_frame_range_filter.register()
+
+    for handler_name in ACTION_CACHE_HANDLERS:
+        getattr(bpy.app.handlers, handler_name).append(clear_action_caches)
 
 
 def unregister():
@@ -75,6 +133,21 @@ def unregister():
     for cls in classes:
         unregister_class(cls)
 
+    for handler_name in ACTION_CACHE_HANDLERS:
+        handlers = getattr(bpy.app.handlers, handler_name)
+        if clear_action_caches in handlers:
+            handlers.remove(clear_action_caches)
+    gcf_frame_range_filter.unregister()
+    gcf_derivative_filter.unregister()
+    gcf_curve_stats.unregister()
+    gcf_action_diff.unregister()
+    gcf_duplicate_scan.unregister()
+    gcf_curve_tools.unregister()
+    gcf_curve_process.unregister()
+    gcf_timer_tasks.unregister()
     gcf_addon_pref.unregister()
+    gcf_bone_filter.unregister()
+    gcf_filter_presets.unregister()
+    gcf_operator_timing.unregister()
     gcf_ui.unregister()
     bbpl.unregister()
\ No newline at end of file
@@ -32,8 +32,12 @@ from . import manifest_generate
 from . import bl_info_generate
 from . import addon_file_management
 from . import utils
+from . import path_matcher
 from . import blender_exec
 from . import blender_utils
+from . import build_cache
+from . import blender_worker
+from . import build_pool
 
 # Reloading modules if they're already loaded
 if "config" in locals():
@@ -46,15 +50,26 @@ if "addon_file_management" in locals():
     importlib.reload(addon_file_management)
 if "utils" in locals():
     importlib.reload(utils)
+if "path_matcher" in locals():
+    importlib.reload(path_matcher)
 if "blender_exec" in locals():
     importlib.reload(blender_exec)
 if "blender_utils" in locals():
     importlib.reload(blender_utils)
+if "blender_worker" in locals():
+    importlib.reload(blender_worker)
+if "build_cache" in locals():
+    importlib.reload(build_cache)
+if "build_pool" in locals():
+    importlib.reload(build_pool)
 
-def install_from_blender():
+def install_from_blender(force=False):
     """
     Loads the addon's configuration file to retrieve its manifest data and initiates
     the installation process within Blender.
+
+    Parameters:
+        force (bool): If True, the builds are generated even when the build cache is up to date.
     """
     # Get the path of the current addon's configuration file from `config`
     addon_manifest = config.addon_generate_config
@@ -67,17 +82,18 @@ def install_from_blender():
     if os.path.isfile(search_addon_folder):
         with open(search_addon_folder, 'r', encoding='utf-8') as file:
             data = json.load(file)
-            install_from_blender_with_build_data(addon_path, data)
+            install_from_blender_with_build_data(addon_path, data, force)
     else:
         print(f"Error: '{addon_manifest}' was not found in '{search_addon_folder}'.")
 
-def install_from_blender_with_build_data(addon_path, addon_manifest_data):
+def install_from_blender_with_build_data(addon_path, addon_manifest_data, force=False):
     """
     Manages the addon installation in Blender based on the build data from the manifest.
 
     Parameters:
         addon_path (str): The path to the addon's root directory.
         addon_manifest_data (dict): The data structure containing build specifications.
+        force (bool): If True, the builds are generated even when the build cache is up to date.
     """
     # Import bpy lib here when exec from Blender.
     import bpy
@@ -85,17 +101,21 @@ def install_from_blender_with_build_data(addon_path, addon_manifest_data):
     # Get Blender executable path from bpy
     blender_executable_path = bpy.app.binary_path
 
-    # Process each build specified in the manifest data
-    for target_build_name in addon_manifest_data["builds"]:
-        # Create temporary addon folder
-        temp_addon_path = addon_file_management.create_temp_addon_folder(
-            addon_path, addon_manifest_data, target_build_name, config.show_debug
-        )
-        # Zip the addon folder for installation
-        zip_file = addon_file_management.zip_addon_folder(
-            temp_addon_path, addon_path, addon_manifest_data, target_build_name, blender_executable_path
-        )
-        
+    # Generate all the builds specified in the manifest data at the same time
+    target_build_names = list(addon_manifest_data["builds"])
+    build_results = build_pool.build_targets(
+        addon_path, addon_manifest_data, target_build_names, blender_executable_path, config.build_max_workers, force
+    )
+    build_pool.print_build_logs(build_results)
+    build_pool.print_build_summary(build_results)
+
+    # Install on the main thread, bpy is not thread safe
+    for build_result in build_results:
+        target_build_name = build_result["target"]
+        zip_file = build_result["zip_file"]
+        if not build_result["success"]:
+            continue
+
         build_data = addon_manifest_data["builds"][target_build_name]
         pkg_id = build_data.get("pkg_id")
         module = build_data.get("module")
@@ -24,6 +24,7 @@
 # ----------------------------------------------
 
 import shutil
+import zipfile
 import tempfile
 import sys
 import os
@@ -33,6 +34,7 @@ from . import config
 from . import utils
 from . import blender_exec
 from . import blender_utils
+from . import path_matcher
 
 
 def copy_addon_folder(src, dst, exclude_paths=[], include_paths=[]):
@@ -42,35 +44,63 @@ def copy_addon_folder(src, dst, exclude_paths=[], include_paths=[]):
     Parameters:
         src (str): Source path of the addon.
         dst (str): Destination path for the copied addon.
-        exclude_paths (list): List of file or folder paths to exclude during the copy process.
+        exclude_paths (list): List of file or folder rules to exclude during the copy process (see path_matcher).
+        include_paths (list): List of file or folder rules to keep even if excluded.
     """
-    # Normalize paths for comparison
-    exclude_paths = [os.path.normpath(path) for path in exclude_paths]
-    include_paths = [os.path.normpath(path) for path in include_paths]
+    matcher = path_matcher.PathMatcher(exclude_paths, include_paths)
 
     # Ignore function to exclude specific files/folders during the copy
     def ignore_files(dir, files):
         ignore_list = []
         for file in files:
             file_path = os.path.join(dir, file)
-            relative_path = os.path.normpath(os.path.relpath(file_path, src))
+            relative_path = os.path.relpath(file_path, src)
 
-            # Skip directories if only files should be ignored
             if os.path.isdir(file_path):
-                continue
-
-            # Check if the file path should be included
-            if any(relative_path.startswith(os.path.normpath(path)) for path in include_paths):
-                continue  # Skip excluding this file or folder
-
-            # Check if the file path should be excluded
-            if any(relative_path.startswith(os.path.normpath(path)) for path in exclude_paths):
+                if matcher.is_folder_excluded(relative_path):
+                    ignore_list.append(file)
+            elif matcher.is_file_excluded(relative_path):
                 ignore_list.append(file)
         return set(ignore_list)
 
     shutil.copytree(src, dst, ignore=ignore_files)
 
 
+def iter_addon_files(src, exclude_paths=[], include_paths=[]):
+    """
+    Walks the addon folder and yields the files of the build, with the same rules as copy_addon_folder.
+
+    Parameters:
+        src (str): Source path of the addon.
+        exclude_paths (list): List of file or folder rules to exclude (see path_matcher).
+        include_paths (list): List of file or folder rules to keep even if excluded.
+
+    Yields:
+        tuple: (absolute file path, relative file path with "/" separators)
+    """
+    matcher = path_matcher.PathMatcher(exclude_paths, include_paths)
+
+    for root, dirs, files in os.walk(src):
+        relative_root = os.path.relpath(root, src)
+        relative_root = "" if relative_root == os.curdir else matcher.normalize(relative_root) + "/"
+
+        # Excluded folders are not walked
+        dirs[:] = sorted(dir for dir in dirs if not matcher.is_folder_excluded(relative_root + dir))
+        for file in sorted(files):
+            relative_path = relative_root + file
+            if matcher.is_file_excluded(relative_path):
+                continue
+            yield os.path.join(root, file), relative_path
+
+
+def get_build_exclude_paths(build_data):
+    """
+    Returns the exclude paths of a build, the addon manager itself and Python caches
+    are never part of a build.
+    """
+    return build_data.get("exclude_paths", []) + ["bbam/", "__pycache__/", "*.pyc"]
+
+
 def create_temp_addon_folder(addon_path, addon_manifest_data, target_build_name, show_debug=True):
     """
     Creates a temporary folder for the addon, copies relevant files, and generates the manifest.
@@ -92,9 +122,8 @@ def create_temp_addon_folder(addon_path, addon_manifest_data, target_build_name,
     temp_addon_path = os.path.join(temp_dir, os.path.basename(addon_path))
 
     # Step 2: Copy addon folder to temporary directory, excluding specified paths
-    exclude_paths = build_data.get("exclude_paths", [])
+    exclude_paths = get_build_exclude_paths(build_data)  # Exclude addon manager from the final build
     include_paths = build_data.get("include_paths", [])
-    exclude_paths.append("bbam/")  # Exclude addon manager from the final build
     copy_addon_folder(addon_path, temp_addon_path, exclude_paths, include_paths)
     print(f"Copied build '{target_build_name}' to temporary location: {temp_addon_path}")
 
@@ -130,7 +159,7 @@ def get_zip_output_filename(addon_path, addon_manifest_data, target_build_name):
     output_filepath = os.path.join(output_folder_path, formatted_file_name)
     return output_filepath
 
-def zip_addon_folder(src, addon_path, addon_manifest_data, target_build_name, blender_executable_path):
+def zip_addon_folder(src, addon_path, addon_manifest_data, target_build_name, blender_executable_path, worker=None):
     """
     Creates a ZIP archive of the addon folder, either through Blender's extension command
     or by using a simple ZIP method.
@@ -141,6 +170,7 @@ def zip_addon_folder(src, addon_path, addon_manifest_data, target_build_name, bl
         addon_manifest_data (dict): Manifest data containing build specifications.
         target_build_name (str): Name of the target build configuration.
         blender_executable_path (str): Path to the Blender executable for running commands.
+        worker (blender_worker.BlenderWorker): Running Blender used for the extension commands, optional.
 
     Returns:
         str: Path to the created ZIP file.
@@ -156,14 +186,14 @@ def zip_addon_folder(src, addon_path, addon_manifest_data, target_build_name, bl
     # Run addon zip process based on the specified generation method
     if generate_method == "EXTENTION_COMMAND":
         print("Start build with extension command")
-        result = blender_exec.build_extension(src, output_filepath, blender_executable_path)
+        result = blender_exec.build_extension(src, output_filepath, blender_executable_path, worker)
         print(result.stdout)
         print(result.stderr, file=sys.stderr)
 
         created_filename = blender_exec.get_build_file(result)
         if created_filename:
             print("Start Validate")
-            blender_exec.validate_extension(created_filename, blender_executable_path)
+            blender_exec.validate_extension(created_filename, blender_executable_path, worker)
             print("End Validate")
 
         return created_filename
@@ -185,4 +215,57 @@ def zip_addon_folder(src, addon_path, addon_manifest_data, target_build_name, bl
             shutil.make_archive(base_name, 'zip', temp_dir, root_folder_name)
         
         print(f"SIMPLE_ZIP created successfully at {output_filepath}")
-        return output_filepath
\ No newline at end of file
+        return output_filepath
+
+
+def build_simple_zip(addon_path, addon_manifest_data, target_build_name, show_debug=True):
+    """
+    Creates the ZIP file of a SIMPLE_ZIP build directly from the addon folder.
+
+    The files are streamed in the archive under the module root folder, the excluded files
+    are skipped during the walk and the updated `__init__.py` (with the new `bl_info`)
+    is written from memory, so no temporary copy of the addon is needed.
+
+    Parameters:
+        addon_path (str): Root path of the addon.
+        addon_manifest_data (dict): Manifest data containing build specifications.
+        target_build_name (str): Name of the target build configuration.
+        show_debug (bool): If True, debug information is displayed.
+
+    Returns:
+        str: Path to the created ZIP file.
+    """
+    build_data = addon_manifest_data["builds"][target_build_name]
+    root_folder_name = build_data["module"]
+
+    output_filepath = get_zip_output_filename(addon_path, addon_manifest_data, target_build_name)
+    os.makedirs(os.path.dirname(output_filepath), exist_ok=True)
+
+    # Files generated for the build, written from memory instead of the source file.
+    new_bl_info = bl_info_generate.generate_new_bl_info(addon_manifest_data, target_build_name)
+    with open(os.path.join(addon_path, "__init__.py"), "r") as file:
+        init_content = file.read()
+    generated_files = {
+        "__init__.py": bl_info_generate.get_content_with_bl_info(init_content, new_bl_info),
+    }
+
+    exclude_paths = get_build_exclude_paths(build_data)
+    include_paths = build_data.get("include_paths", [])
+    file_count = 0
+    with zipfile.ZipFile(output_filepath, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+        for file_path, relative_path in iter_addon_files(addon_path, exclude_paths, include_paths):
+            archive_name = f"{root_folder_name}/{relative_path}"
+            if relative_path in generated_files:
+                zip_file.writestr(archive_name, generated_files.pop(relative_path))
+            else:
+                zip_file.write(file_path, archive_name)
+            file_count += 1
+
+        for relative_path, content in generated_files.items():
+            zip_file.writestr(f"{root_folder_name}/{relative_path}", content)
+            file_count += 1
+
+    if show_debug:
+        print(f"Addon bl_info updated in the archive for build '{target_build_name}'.")
+    print(f"SIMPLE_ZIP created successfully at {output_filepath} ({file_count} files)")
+    return output_filepath
@@ -114,10 +114,18 @@ def search_file_bl_info(file_path):
             return True
     return False
 
-def replace_file_bl_info(file_path, data):
-    with open(file_path, "r") as file:
-        content = file.read()
-        tree = ast.parse(content)
+def replace_content_bl_info(content, data):
+    """
+    Replaces the `bl_info` dictionary in Python source text.
+
+    Parameters:
+        content (str): Python source text of the addon's __init__.py.
+        data (dict): New `bl_info` dictionary.
+
+    Returns:
+        str: The updated source text, None if no `bl_info` was found.
+    """
+    tree = ast.parse(content)
 
     # Locate existing `bl_info` definition
     start_bl_info = None
@@ -135,17 +143,21 @@ def replace_file_bl_info(file_path, data):
         # Insert the new `bl_info` block at the same position
         new_bl_info_lines = format_bl_info_lines(data)
         lines[start_bl_info:start_bl_info] = new_bl_info_lines
+        return "\n".join(lines)
+    return None
 
-        # Write the updated content back to the file
-        with open(file_path, "w") as file:
-            file.write("\n".join(lines))
-        return True
-    return False
+def add_content_bl_info(content, data):
+    """
+    Adds a `bl_info` dictionary to Python source text, before the `register` function if found.
 
-def add_new_bl_info(file_path, data):
-    with open(file_path, "r") as file:
-        content = file.read()
-        tree = ast.parse(content)
+    Parameters:
+        content (str): Python source text of the addon's __init__.py.
+        data (dict): New `bl_info` dictionary.
+
+    Returns:
+        str: The updated source text.
+    """
+    tree = ast.parse(content)
 
     # Find the line number of the `register` function
     index_register = None
@@ -164,8 +176,43 @@ def add_new_bl_info(file_path, data):
     else:
         # If `register` is not found, append `bl_info` at the end
         lines.extend(new_bl_info_lines)
+    return "\n".join(lines)
+
+def get_content_with_bl_info(content, data):
+    """
+    Returns Python source text with its `bl_info` replaced or added, without touching any file.
+
+    Parameters:
+        content (str): Python source text of the addon's __init__.py.
+        data (dict): New `bl_info` dictionary.
+
+    Returns:
+        str: The updated source text.
+    """
+    new_content = replace_content_bl_info(content, data)
+    if new_content is None:
+        new_content = add_content_bl_info(content, data)
+    return new_content
+
+def replace_file_bl_info(file_path, data):
+    with open(file_path, "r") as file:
+        content = file.read()
+
+    new_content = replace_content_bl_info(content, data)
+    if new_content is not None:
+        # Write the updated content back to the file
+        with open(file_path, "w") as file:
+            file.write(new_content)
+        return True
+    return False
+
+def add_new_bl_info(file_path, data):
+    with open(file_path, "r") as file:
+        content = file.read()
+
+    new_content = add_content_bl_info(content, data)
 
     # Write the updated content back to the file
     with open(file_path, "w") as file:
-        file.write("\n".join(lines))
-    return True
\ No newline at end of file
+        file.write(new_content)
+    return True
@@ -27,7 +27,7 @@ import sys
 import re
 import subprocess
 
-def build_extension(src, dst, blender_executable_path):
+def build_extension(src, dst, blender_executable_path, worker=None):
     """
     Builds an extension using Blender's executable with specified source and destination paths.
 
@@ -35,19 +35,50 @@ def build_extension(src, dst, blender_executable_path):
         src (str): Path to the source directory of the extension.
         dst (str): Destination path for the built extension.
         blender_executable_path (str): Path to the Blender executable.
+        worker (blender_worker.BlenderWorker): Running Blender to use instead of starting a new one.
 
     Returns:
         subprocess.CompletedProcess: The result of the subprocess command execution.
     """
-    command = [
-        blender_executable_path,
-        '--command', 'extension', 'build',
+    extension_args = [
+        'build',
         '--source-dir', src,
         '--output-filepath', dst,
     ]
+    if worker is not None:
+        return worker.run_command("extension", argv=extension_args)
+
+    command = [blender_executable_path, '--command', 'extension'] + extension_args
     result = subprocess.run(command, capture_output=True, text=True)
     return result
 
+def run_python_script(blend_file, script_path, script_args, blender_executable_path, timeout=None):
+    """
+    Runs a Python script in a background Blender instance.
+
+    Parameters:
+        blend_file (str): Path to the .blend file to open, None to start with the default file.
+        script_path (str): Path to the Python script to run.
+        script_args (list): Arguments passed to the script after "--".
+        blender_executable_path (str): Path to the Blender executable.
+        timeout (float): Seconds before the Blender instance is stopped, None to wait without limit.
+
+    Returns:
+        subprocess.CompletedProcess: The result of the subprocess command execution.
+    """
+    # Options that change the startup must come before the file.
+    command = [blender_executable_path, '--background', '--factory-startup']
+    if blend_file:
+        command.append(blend_file)
+    command += [
+        '--python-exit-code', '1',
+        '--python', script_path,
+        '--',
+    ]
+    command += list(script_args)
+    result = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+    return result
+
 def get_build_file(build_result):
     """
     Extracts the path of the created build file from the build result output.
@@ -63,20 +94,24 @@ def get_build_file(build_result):
         return match.group(1)
     return None
 
-def validate_extension(path, blender_executable_path):
+def validate_extension(path, blender_executable_path, worker=None):
     """
     Validates the built extension using Blender's executable.
 
     Parameters:
         path (str): Path to the extension file to validate.
         blender_executable_path (str): Path to the Blender executable.
+        worker (blender_worker.BlenderWorker): Running Blender to use instead of starting a new one.
     """
-    validate_command = [
-        blender_executable_path,
-        '--command', 'extension', 'validate', 
-        path,
-    ]
-    result = subprocess.run(validate_command, capture_output=True, text=True)
+    if worker is not None:
+        result = worker.run_command("extension", argv=['validate', path])
+    else:
+        validate_command = [
+            blender_executable_path,
+            '--command', 'extension', 'validate', 
+            path,
+        ]
+        result = subprocess.run(validate_command, capture_output=True, text=True)
 
     # Output results for debugging purposes
     if result.returncode == 0:
@@ -0,0 +1,174 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# ----------------------------------------------
+#  BBAM -> BleuRaven Blender Addon Manager
+#  https://github.com/xavier150/BBAM
+#  BleuRaven.fr
+#  XavierLoux.com
+# ----------------------------------------------
+
+import os
+import json
+import queue
+import threading
+import subprocess
+
+# Must match RESPONSE_PREFIX in exec/blender_worker_loop.py
+RESPONSE_PREFIX = "BBAM_WORKER_RESPONSE "
+
+worker_script_path = os.path.abspath(os.path.join(__file__, '..', 'exec', 'blender_worker_loop.py'))
+
+
+class BlenderWorker:
+    """
+    A background Blender kept open to run several commands without paying the Blender startup each time.
+
+    Requests are sent as JSON lines on the worker stdin, see exec/blender_worker_loop.py.
+    The command results are returned as subprocess.CompletedProcess, like the functions of blender_exec.
+    A command that takes more than timeout seconds kills the worker, the next request starts a new one.
+
+    Usage:
+        with BlenderWorker(blender_executable_path) as worker:
+            result = blender_exec.build_extension(src, dst, blender_executable_path, worker)
+    """
+
+    def __init__(self, blender_executable_path, timeout=None):
+        self.blender_executable_path = blender_executable_path
+        self.timeout = timeout
+        self.process = None
+        self.responses = None
+        self.lock = threading.Lock()
+        self.request_id = 0
+
+    def start(self):
+        if self.process is not None:
+            return
+        command = [
+            self.blender_executable_path,
+            '--background',
+            '--factory-startup',
+            '--python', worker_script_path,
+        ]
+        self.process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        # stdout is read by a thread so a request can wait with a deadline.
+        self.responses = queue.Queue()
+        reader = threading.Thread(target=read_responses, args=(self.process.stdout, self.responses), daemon=True)
+        reader.start()
+
+    def is_running(self):
+        return self.process is not None and self.process.poll() is None
+
+    def request(self, command, **arguments):
+        """
+        Sends one request and waits for its response.
+
+        Parameters:
+            command (str): "ping", "extension" or "run_script".
+            arguments: The request arguments, see exec/blender_worker_loop.py.
+
+        Returns:
+            dict: The response, with at least "returncode".
+        """
+        with self.lock:
+            self.start()
+            self.request_id += 1
+            request = dict(arguments, command=command, id=self.request_id)
+            try:
+                self.process.stdin.write(json.dumps(request) + "\n")
+                self.process.stdin.flush()
+                while True:
+                    response = self.responses.get(timeout=self.timeout)
+                    if response is None:
+                        break
+                    # Responses of older requests are skipped.
+                    if response.get("id") == self.request_id:
+                        return response
+            except queue.Empty:
+                self.kill()
+                return {"returncode": 1, "stdout": "", "stderr": f"The Blender worker timed out after {self.timeout}s."}
+            except (OSError, ValueError):
+                pass
+
+            # The worker stopped, the next request starts a new one.
+            self.stop()
+            return {"returncode": 1, "stdout": "", "stderr": "The Blender worker stopped unexpectedly."}
+
+    def run_command(self, command, **arguments):
+        """
+        Same as request, but returns a subprocess.CompletedProcess.
+        """
+        response = self.request(command, **arguments)
+        return subprocess.CompletedProcess(
+            [command], response.get("returncode", 1), response.get("stdout", ""), response.get("stderr", "")
+        )
+
+    def kill(self):
+        """
+        Stops the worker without waiting for the current command.
+        """
+        if self.process is None:
+            return
+        self.process.kill()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            pass
+        self.process = None
+
+    def stop(self):
+        if self.process is None:
+            return
+        if self.process.poll() is None:
+            try:
+                self.process.stdin.write(json.dumps({"command": "quit"}) + "\n")
+                self.process.stdin.flush()
+                self.process.wait(timeout=10)
+            except (OSError, ValueError, subprocess.TimeoutExpired):
+                self.process.kill()
+        self.process = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def read_responses(stdout, responses):
+    """
+    Worker stdout reader thread: puts the decoded responses in the queue, then None when the worker stops.
+    """
+    try:
+        for line in stdout:
+            if line.startswith(RESPONSE_PREFIX):
+                try:
+                    responses.put(json.loads(line[len(RESPONSE_PREFIX):]))
+                except ValueError:
+                    continue
+    except (OSError, ValueError):
+        pass
+    responses.put(None)
@@ -0,0 +1,118 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# ----------------------------------------------
+#  BBAM -> BleuRaven Blender Addon Manager
+#  https://github.com/xavier150/BBAM
+#  BleuRaven.fr
+#  XavierLoux.com
+# ----------------------------------------------
+
+import os
+import json
+import hashlib
+
+from . import config
+from . import manifest_generate
+from . import bl_info_generate
+from . import addon_file_management
+
+# Cache file saved next to the generated builds
+build_cache_file = "build_cache.json"
+
+
+def get_build_cache_path(addon_path):
+    output_folder_path = os.path.abspath(os.path.join(addon_path, '..', config.build_output_folder))
+    return os.path.join(output_folder_path, build_cache_file)
+
+
+def load_build_cache(addon_path):
+    """
+    Loads the build cache, a dictionary with the content hash and the file of each build target.
+
+    Parameters:
+        addon_path (str): Root path of the addon.
+
+    Returns:
+        dict: The build cache, empty if not found or unreadable.
+    """
+    cache_path = get_build_cache_path(addon_path)
+    if not os.path.isfile(cache_path):
+        return {}
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_build_cache(addon_path, cache):
+    cache_path = get_build_cache_path(addon_path)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as file:
+        json.dump(cache, file, indent=4)
+
+
+def get_build_hash(addon_path, addon_manifest_data, target_build_name):
+    """
+    Computes the content hash of a build target: the included files, the generated
+    manifest or bl_info text and the target configuration.
+
+    Parameters:
+        addon_path (str): Root path of the addon.
+        addon_manifest_data (dict): Manifest data containing build specifications.
+        target_build_name (str): Name of the target build configuration.
+
+    Returns:
+        str: The hexadecimal SHA-256 of the build inputs.
+    """
+    build_data = addon_manifest_data["builds"][target_build_name]
+    hasher = hashlib.sha256()
+
+    # Target configuration and generated text
+    hasher.update(json.dumps(build_data, sort_keys=True).encode('utf-8'))
+    if build_data["generate_method"] == "EXTENTION_COMMAND":
+        new_manifest = manifest_generate.generate_new_manifest(addon_manifest_data, target_build_name)
+        hasher.update(manifest_generate.dict_to_toml(new_manifest).encode('utf-8'))
+    elif build_data["generate_method"] == "SIMPLE_ZIP":
+        new_bl_info = bl_info_generate.generate_new_bl_info(addon_manifest_data, target_build_name)
+        hasher.update("\n".join(bl_info_generate.format_bl_info_lines(new_bl_info)).encode('utf-8'))
+
+    # Included files, path and content
+    exclude_paths = addon_file_management.get_build_exclude_paths(build_data)
+    include_paths = build_data.get("include_paths", [])
+    for file_path, relative_path in addon_file_management.iter_addon_files(addon_path, exclude_paths, include_paths):
+        hasher.update(relative_path.encode('utf-8') + b"\0")
+        with open(file_path, 'rb') as file:
+            for block in iter(lambda: file.read(1024 * 1024), b""):
+                hasher.update(block)
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def get_cached_build_file(cache, target_build_name, build_hash):
+    """
+    Returns the file of a previous build with the same content hash, if it still exists.
+    """
+    entry = cache.get(target_build_name)
+    if entry is None or entry.get("hash") != build_hash:
+        return None
+    zip_file = entry.get("zip_file")
+    if zip_file and os.path.isfile(zip_file):
+        return zip_file
+    return None
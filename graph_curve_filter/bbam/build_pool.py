@@ -0,0 +1,221 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# ----------------------------------------------
+#  BBAM -> BleuRaven Blender Addon Manager
+#  https://github.com/xavier150/BBAM
+#  BleuRaven.fr
+#  XavierLoux.com
+# ----------------------------------------------
+
+import io
+import os
+import sys
+import time
+import threading
+import traceback
+import concurrent.futures
+
+from . import config
+from . import utils
+from . import addon_file_management
+from . import build_cache
+from . import blender_worker
+
+
+class ThreadOutputRouter:
+    """
+    Replaces sys.stdout or sys.stderr while builds run in threads.
+    Text printed by a thread that captures its output goes to its own buffer,
+    other threads still write to the original stream.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def set_buffer(self, buffer):
+        self.local.buffer = buffer
+
+    def write(self, text):
+        buffer = getattr(self.local, "buffer", None)
+        if buffer is not None:
+            return buffer.write(text)
+        return self.stream.write(text)
+
+    def flush(self):
+        buffer = getattr(self.local, "buffer", None)
+        if buffer is None:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def build_target(addon_path, addon_manifest_data, target_build_name, blender_executable_path, worker=None):
+    """
+    Generates the ZIP file of one build target.
+
+    Parameters:
+        addon_path (str): Root path of the addon.
+        addon_manifest_data (dict): Manifest data containing build specifications.
+        target_build_name (str): Name of the target build configuration.
+        blender_executable_path (str): Path to the Blender executable for running commands.
+        worker (blender_worker.BlenderWorker): Running Blender used for the extension commands, optional.
+
+    Returns:
+        str: Path to the created ZIP file.
+    """
+    build_data = addon_manifest_data["builds"][target_build_name]
+
+    if build_data["generate_method"] == "SIMPLE_ZIP":
+        # Stream the addon files in the archive, no temporary copy needed
+        return addon_file_management.build_simple_zip(
+            addon_path, addon_manifest_data, target_build_name, config.show_debug
+        )
+
+    # Create temporary addon folder
+    temp_addon_path = addon_file_management.create_temp_addon_folder(
+        addon_path, addon_manifest_data, target_build_name, config.show_debug
+    )
+    # Zip the addon folder for installation
+    return addon_file_management.zip_addon_folder(
+        temp_addon_path, addon_path, addon_manifest_data, target_build_name, blender_executable_path, worker
+    )
+
+
+def build_targets(
+        addon_path, addon_manifest_data, target_build_names, blender_executable_path, max_workers=0, force=False):
+    """
+    Generates several build targets at the same time.
+
+    The builds mostly wait for file copies and Blender subprocesses, so they run in threads.
+    The output of each build is captured in its own log.
+    A target is not built again when its content hash matches the cache and its file still exists.
+    With config.use_blender_worker, each thread keeps one background Blender for the extension commands.
+
+    Parameters:
+        addon_path (str): Root path of the addon.
+        addon_manifest_data (dict): Manifest data containing build specifications.
+        target_build_names (list): Names of the target build configurations.
+        blender_executable_path (str): Path to the Blender executable for running commands.
+        max_workers (int): Number of builds at the same time, 0 for the CPU count.
+        force (bool): If True, the cache is ignored and all the targets are built.
+
+    Returns:
+        list: One result dictionary per target, in the order of target_build_names,
+              with "target", "zip_file", "success", "cached", "duration" and "log".
+    """
+    if max_workers <= 0:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(target_build_names)))
+
+    cache = build_cache.load_build_cache(addon_path)
+    stdout_router = ThreadOutputRouter(sys.stdout)
+    stderr_router = ThreadOutputRouter(sys.stderr)
+
+    # One Blender worker per build thread, started on first use
+    workers = []
+    thread_data = threading.local()
+
+    def get_thread_worker():
+        if not config.use_blender_worker:
+            return None
+        worker = getattr(thread_data, "worker", None)
+        if worker is None:
+            worker = blender_worker.BlenderWorker(blender_executable_path, config.blender_worker_timeout)
+            thread_data.worker = worker
+            workers.append(worker)
+        return worker
+
+    def run_build(target_build_name):
+        log = io.StringIO()
+        stdout_router.set_buffer(log)
+        stderr_router.set_buffer(log)
+        result = {"target": target_build_name, "zip_file": None, "success": False, "cached": False}
+        start_time = time.perf_counter()
+        try:
+            build_hash = build_cache.get_build_hash(addon_path, addon_manifest_data, target_build_name)
+            cached_file = None if force else build_cache.get_cached_build_file(cache, target_build_name, build_hash)
+            if cached_file:
+                print(f"Build '{target_build_name}' is up to date: {cached_file}")
+                result["zip_file"] = cached_file
+                result["cached"] = True
+            else:
+                result["zip_file"] = build_target(
+                    addon_path, addon_manifest_data, target_build_name, blender_executable_path, get_thread_worker()
+                )
+                if result["zip_file"] is not None:
+                    cache[target_build_name] = {"hash": build_hash, "zip_file": result["zip_file"]}
+            result["success"] = result["zip_file"] is not None
+        except Exception:
+            traceback.print_exc(file=log)
+        finally:
+            stdout_router.set_buffer(None)
+            stderr_router.set_buffer(None)
+        result["duration"] = time.perf_counter() - start_time
+        result["log"] = log.getvalue()
+        return result
+
+    sys.stdout, sys.stderr = stdout_router, stderr_router
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(run_build, target_build_names))
+    finally:
+        sys.stdout, sys.stderr = stdout_router.stream, stderr_router.stream
+        for worker in workers:
+            worker.stop()
+
+    build_cache.save_build_cache(addon_path, cache)
+    return results
+
+
+def print_build_logs(results):
+    """
+    Prints the captured log of each build, one after the other.
+    """
+    for result in results:
+        print(f"===== Build '{result['target']}' =====")
+        print(result["log"].rstrip())
+
+
+def print_build_summary(results):
+    """
+    Prints a table with the state and the duration of each build.
+    """
+    name_width = max([len("Target")] + [len(result["target"]) for result in results])
+    print(f"{'Target'.ljust(name_width)} | Status | Duration | File")
+    print(f"{'-' * name_width}-+--------+----------+-----")
+    for result in results:
+        if result["cached"]:
+            status = "CACHED"
+        elif result["success"]:
+            status = "OK"
+        else:
+            status = "FAILED"
+        line = (
+            f"{result['target'].ljust(name_width)} | {status.ljust(6)} | "
+            f"{result['duration']:7.2f}s | {result['zip_file']}"
+        )
+        if result["success"]:
+            print(line)
+        else:
+            utils.print_red(line)
+    total = sum(result["duration"] for result in results)
+    cache_hits = sum(1 for result in results if result["cached"])
+    print(f"{len(results)} builds, {cache_hits} cache hits, {total:.2f}s of build time.")
@@ -37,4 +37,12 @@ manifest_schema_version = "1.0.0"
 # Folder where the generated build files will be stored
 build_output_folder = "generated_builds"
 
-show_debug = False
\ No newline at end of file
+show_debug = False
+# Number of builds generated at the same time, 0 uses the CPU count
+build_max_workers = 0
+
+# Run the extension build and validate commands in persistent background Blender instances
+use_blender_worker = True
+
+# Seconds allowed for one command of a background Blender worker, the worker is restarted after it
+blender_worker_timeout = 300
@@ -0,0 +1,145 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# ----------------------------------------------
+#  BBAM -> BleuRaven Blender Addon Manager
+#  https://github.com/xavier150/BBAM
+#  BleuRaven.fr
+#  XavierLoux.com
+# ----------------------------------------------
+
+# Request loop of a persistent background Blender, started by bbam.blender_worker:
+# blender --background --factory-startup --python blender_worker_loop.py
+# Each stdin line is a JSON request, each response is one stdout line starting with RESPONSE_PREFIX.
+# Other stdout lines (Blender messages) are ignored by the client.
+
+import io
+import os
+import sys
+import json
+import runpy
+import traceback
+import subprocess
+import importlib
+import contextlib
+import bpy
+
+RESPONSE_PREFIX = "BBAM_WORKER_RESPONSE "
+
+
+def run_extension_in_process(argv):
+    """
+    Runs the extension command with the bl_pkg module of this Blender instance.
+
+    Returns:
+        dict: The response, None when this Blender can not run the command in-process
+              (no bl_pkg module, or a blender_ext.main with another signature).
+    """
+    try:
+        blender_ext = importlib.import_module("bl_pkg.cli.blender_ext")
+    except ImportError:
+        return None
+    if not callable(getattr(blender_ext, "main", None)):
+        return None
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            returncode = blender_ext.main(argv, args_internal=False)
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else 1
+        except TypeError:
+            # main() of another Blender version, the command did not run.
+            return None
+        except Exception:
+            traceback.print_exc()
+            returncode = 1
+    return {"returncode": returncode or 0, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def run_extension_command(argv):
+    """
+    Runs "blender --command extension <argv>" in this Blender instance.
+    Falls back to a new Blender process when the extension module can not be used in-process.
+    """
+    response = run_extension_in_process(argv)
+    if response is not None:
+        return response
+
+    command = [bpy.app.binary_path, '--command', 'extension'] + list(argv)
+    result = subprocess.run(command, capture_output=True, text=True)
+    return {"returncode": result.returncode, "stdout": result.stdout, "stderr": result.stderr}
+
+
+def run_script(path, args):
+    """
+    Runs a Python script in this Blender instance with its own sys.argv.
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    old_argv = sys.argv
+    sys.argv = [path] + list(args)
+    returncode = 0
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            runpy.run_path(path, run_name="__main__")
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else 1
+        except Exception:
+            traceback.print_exc()
+            returncode = 1
+        finally:
+            sys.argv = old_argv
+    return {"returncode": returncode or 0, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def handle_request(request):
+    command = request.get("command")
+    if command == "ping":
+        return {"returncode": 0, "version": list(bpy.app.version), "pid": os.getpid()}
+    if command == "extension":
+        return run_extension_command(request["argv"])
+    if command == "run_script":
+        return run_script(request["path"], request.get("args", []))
+    return {"returncode": 1, "stdout": "", "stderr": f"Unknown worker command: {command}"}
+
+
+def main():
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError:
+            continue
+        if request.get("command") == "quit":
+            break
+
+        try:
+            response = handle_request(request)
+        except Exception:
+            response = {"returncode": 1, "stdout": "", "stderr": traceback.format_exc()}
+        response["id"] = request.get("id")
+
+        sys.stdout.write(RESPONSE_PREFIX + json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
+main()
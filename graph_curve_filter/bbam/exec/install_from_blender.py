@@ -36,7 +36,10 @@ spec = importlib.util.spec_from_file_location(module_name, bbam_path)
 module = importlib.util.module_from_spec(spec)
 sys.modules[module_name] = module
 spec.loader.exec_module(module)
-module.install_from_blender()
+
+# Use "-- --force" on the command line to ignore the build cache.
+force = "--force" in sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else False
+module.install_from_blender(force)
 
 
 # Instructions for running this script from Blender
@@ -0,0 +1,134 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# ----------------------------------------------
+#  BBAM -> BleuRaven Blender Addon Manager
+#  https://github.com/xavier150/BBAM
+#  BleuRaven.fr
+#  XavierLoux.com
+# ----------------------------------------------
+
+import os
+import re
+
+
+def translate_rule(rule):
+    """
+    Converts an exclude or include rule to a regular expression on "/" separated relative paths.
+
+    Rules work like .gitignore lines:
+        "bbam/"        folder named bbam, at any depth.
+        "docs/api/"    folder relative to the addon root (the rule contains a "/").
+        "*.pyc"        file name pattern, at any depth.
+        "**/*.pyc"     "**" matches any number of folders.
+        "README.md"    file or folder, matches everything inside a folder.
+
+    Parameters:
+        rule (str): The rule to convert.
+
+    Returns:
+        str: The regular expression source.
+    """
+    rule = rule.replace("\\", "/")
+    is_folder = rule.endswith("/")
+    body = rule.strip("/")
+    anchored = "/" in body or rule.startswith("/")
+
+    regex = ""
+    index = 0
+    while index < len(body):
+        char = body[index]
+        if body.startswith("**/", index):
+            regex += "(?:.*/)?"
+            index += 3
+            continue
+        if body.startswith("**", index):
+            regex += ".*"
+            index += 2
+            continue
+        if char == "*":
+            regex += "[^/]*"
+        elif char == "?":
+            regex += "[^/]"
+        elif char == "[":
+            end = body.find("]", index + 1)
+            if end == -1:
+                regex += re.escape(char)
+            else:
+                regex += "[" + body[index + 1:end].replace("\\", "\\\\") + "]"
+                index = end
+        else:
+            regex += re.escape(char)
+        index += 1
+
+    prefix = "" if anchored else "(?:.*/)?"
+    # A folder rule needs a "/" after the name, other rules match the path itself or its content.
+    suffix = "/" if is_folder else "(?:/|$)"
+    return prefix + regex + suffix
+
+
+def compile_rules(rules):
+    """
+    Compiles a list of rules into one regular expression, None for an empty list.
+    """
+    if not rules:
+        return None
+    return re.compile("|".join(f"(?:{translate_rule(rule)})" for rule in rules))
+
+
+class PathMatcher:
+    """
+    Exclude and include rules compiled once, then tested on each path of the walk.
+    A path matched by an include rule is never excluded.
+    """
+
+    def __init__(self, exclude_paths=[], include_paths=[]):
+        self.exclude_regex = compile_rules(exclude_paths)
+        self.include_regex = compile_rules(include_paths)
+
+    @staticmethod
+    def normalize(relative_path):
+        return relative_path.replace(os.sep, "/")
+
+    def is_file_excluded(self, relative_path):
+        """
+        Parameters:
+            relative_path (str): Path of a file relative to the addon folder.
+
+        Returns:
+            bool: True if the file should not be in the build.
+        """
+        relative_path = self.normalize(relative_path)
+        if self.include_regex is not None and self.include_regex.match(relative_path):
+            return False
+        return self.exclude_regex is not None and self.exclude_regex.match(relative_path) is not None
+
+    def is_folder_excluded(self, relative_path):
+        """
+        Checks if a whole folder can be skipped during the walk.
+        Folders are kept when there are include rules, a file inside may be included.
+
+        Parameters:
+            relative_path (str): Path of a folder relative to the addon folder.
+
+        Returns:
+            bool: True if nothing in the folder should be in the build.
+        """
+        if self.exclude_regex is None or self.include_regex is not None:
+            return False
+        return self.exclude_regex.match(self.normalize(relative_path) + "/") is not None
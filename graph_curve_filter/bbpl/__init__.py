@@ -36,6 +36,13 @@ from . import basics
 from . import utils
 from . import rig_bone_visual
 from . import skin_utils
+from . import fcurve_keys
+from . import channel_table
+from . import fcurve_reduce
+from . import fcurve_evaluate
+from . import fcurve_stats
+from . import fcurve_key_times
+from . import fcurve_process
 from . import anim_utils
 from . import scene_utils
 from . import ui_utils
@@ -62,6 +69,20 @@ if "rig_bone_visual" in locals():
     importlib.reload(rig_bone_visual)
 if "skin_utils" in locals():
     importlib.reload(skin_utils)
+if "fcurve_keys" in locals():
+    importlib.reload(fcurve_keys)
+if "channel_table" in locals():
+    importlib.reload(channel_table)
+if "fcurve_reduce" in locals():
+    importlib.reload(fcurve_reduce)
+if "fcurve_evaluate" in locals():
+    importlib.reload(fcurve_evaluate)
+if "fcurve_stats" in locals():
+    importlib.reload(fcurve_stats)
+if "fcurve_key_times" in locals():
+    importlib.reload(fcurve_key_times)
+if "fcurve_process" in locals():
+    importlib.reload(fcurve_process)
 if "anim_utils" in locals():
     importlib.reload(anim_utils)
 if "scene_utils" in locals():
@@ -24,9 +24,12 @@
 
 import bpy
 import mathutils
-from typing import List
+import numpy
+from typing import List, Dict
 from . import scene_utils
 from . import utils
+from . import fcurve_keys
+from . import fcurve_evaluate
 
 
 class NLA_Save:
@@ -290,6 +293,104 @@ class ProxyCopy_Keyframe():
 
 
 
+def get_fcurve_packed_keys(fcurve: bpy.types.FCurve) -> Dict[str, numpy.ndarray]:
+    """
+    Reads all the keyframes of an FCurve in numpy arrays with foreach_get.
+
+    Args:
+        fcurve (bpy.types.FCurve): The FCurve to read.
+
+    Returns:
+        dict: The packed keys (see fcurve_keys.KEYFRAME_ATTRIBUTES).
+    """
+    keyframe_points = fcurve.keyframe_points
+    packed_keys = fcurve_keys.new_packed_keys(len(keyframe_points))
+    for attr, values in packed_keys.items():
+        keyframe_points.foreach_get(attr, values.ravel())
+    return packed_keys
+
+
+def set_fcurve_packed_keys(fcurve: bpy.types.FCurve, packed_keys: Dict[str, numpy.ndarray]):
+    """
+    Replaces all the keyframes of an FCurve with packed keys.
+    The keyframes are created in one call then filled with foreach_set.
+
+    Args:
+        fcurve (bpy.types.FCurve): The FCurve to rebuild.
+        packed_keys (dict): The packed keys to write.
+
+    Returns:
+        None
+    """
+    keyframe_points = fcurve.keyframe_points
+    keyframe_points.clear()
+    keyframe_points.add(fcurve_keys.get_packed_keys_count(packed_keys))
+    for attr, values in packed_keys.items():
+        keyframe_points.foreach_set(attr, numpy.ascontiguousarray(values).ravel())
+    fcurve.update()
+
+
+def evaluate_fcurve_frames(fcurve: bpy.types.FCurve, frames) -> numpy.ndarray:
+    """
+    Evaluates an FCurve at many frames in one call with the numpy evaluator.
+    Falls back on FCurve.evaluate() when the curve uses modifiers or unsupported interpolations.
+
+    Args:
+        fcurve (bpy.types.FCurve): The FCurve to evaluate.
+        frames (array_like): The frames to evaluate.
+
+    Returns:
+        numpy.ndarray: The curve values at the given frames.
+    """
+    frames = numpy.asarray(frames, dtype=numpy.float64)
+    packed_keys = get_fcurve_packed_keys(fcurve)
+
+    use_modifiers = any(not modifier.mute for modifier in fcurve.modifiers)
+    if use_modifiers or not fcurve_evaluate.is_packed_keys_supported(packed_keys):
+        return numpy.array([fcurve.evaluate(frame) for frame in frames], dtype=numpy.float64)
+
+    extrapolation = fcurve_keys.EXTRAPOLATION_NAMES[fcurve.extrapolation]
+    return fcurve_evaluate.evaluate_packed_keys(packed_keys, frames, extrapolation)
+
+
+def get_fcurves_packed_curves(fcurves: List[bpy.types.FCurve]) -> fcurve_evaluate.PackedCurves:
+    """
+    Creates an array backed snapshot of FCurves that can be evaluated without bpy.
+
+    Args:
+        fcurves (list): The FCurves to read.
+
+    Returns:
+        fcurve_evaluate.PackedCurves: The snapshot, curves are in the same order as the FCurves.
+    """
+    packed_keys_list = [get_fcurve_packed_keys(fcurve) for fcurve in fcurves]
+    extrapolations = [fcurve_keys.EXTRAPOLATION_NAMES[fcurve.extrapolation] for fcurve in fcurves]
+    return fcurve_evaluate.PackedCurves(packed_keys_list, extrapolations)
+
+
+def evaluate_fcurves_frames(fcurves: List[bpy.types.FCurve], frames) -> numpy.ndarray:
+    """
+    Evaluates many FCurves at the same frames in one vectorized call.
+    FCurves that use modifiers or unsupported interpolations are evaluated with FCurve.evaluate().
+
+    Args:
+        fcurves (list): The FCurves to evaluate.
+        frames (array_like): The frames to evaluate.
+
+    Returns:
+        numpy.ndarray: The values, shape (FCurves, frames).
+    """
+    frames = numpy.asarray(frames, dtype=numpy.float64)
+    curves = get_fcurves_packed_curves(fcurves)
+    values = fcurve_evaluate.evaluate_packed_curves(curves, frames)
+
+    for index, fcurve in enumerate(fcurves):
+        use_modifiers = any(not modifier.mute for modifier in fcurve.modifiers)
+        if use_modifiers or not fcurve_evaluate.is_packed_keys_supported(curves.get_curve_keys(index)):
+            values[index] = [fcurve.evaluate(frame) for frame in frames]
+    return values
+
+
 def copy_attributes(a, b, priority_vars = [], ignore_list = [], print_fails = True):
     def copyattr(source, target, attr_name):
         try:
@@ -25,6 +25,7 @@
 import bpy
 from typing import List
 import importlib
+from .. import channel_table
 
 classes = (
 )
@@ -64,7 +65,14 @@ class RigActionUpdater:
         self.remove_fcurve = 0
         self.print_log = False
 
-    def update_action_curve_data_path(self, action: bpy.types.Action, old_data_paths: List[str], new_data_path: str, remove_if_already_exists=False, show_debug=False):
+    def update_action_curve_data_path(
+            self,
+            action: bpy.types.Action,
+            old_data_paths: List[str],
+            new_data_path: str,
+            remove_if_already_exists=False,
+            show_debug=False,
+            ):
         """
         Update the data paths of FCurves in a given action by replacing old data paths with a new one.
 
@@ -72,22 +80,20 @@ class RigActionUpdater:
             action (bpy.types.Action): The Blender action containing FCurves to be updated.
             old_data_paths (list of str): A list of old data paths to search for and replace.
             new_data_path (str): The new data path to replace the old ones with.
-            remove_if_already_exists (bool, optional): If True, remove FCurves if the new data path already exists in them.
+            remove_if_already_exists (bool, optional): If True, remove FCurves if the new data path
+                already exists in them.
                 Default is False.
 
         Returns:
             None
         """
-        cache_action_fcurves: List[bpy.types.FCurve] = []
-        cache_data_paths: List[str] = []
-        for fcurve in action.fcurves:
-            cache_action_fcurves.append(fcurve)
-            cache_data_paths.append(fcurve.data_path)
-            
-        for action_fcurve in cache_action_fcurves:
-            for old_data_path in old_data_paths:
-                current_target = action_fcurve.data_path
+        # Data paths are read once in the channel table, not from each FCurve.
+        table = channel_table.build_channel_table(action)
+        cache_action_fcurves: List[bpy.types.FCurve] = list(action.fcurves)
+        cache_data_paths = set(table.data_paths)
 
+        for action_fcurve, current_target in zip(cache_action_fcurves, table.data_paths):
+            for old_data_path in old_data_paths:
                 if old_data_path in current_target:
                     # ---
                     if show_debug: 
@@ -99,20 +105,30 @@ class RigActionUpdater:
                         if self.print_log or show_debug:
                             print(f'"{current_target}" updated to "{new_target}" in {action.name} action.')
                         self.update_fcurve += 1
+                        current_target = new_target
                     else:
                         if remove_if_already_exists:
                             action.fcurves.remove(action_fcurve)
                             if self.print_log or show_debug:
-                                print(f'"{current_target}" can not be updated to "{new_target}" in {action.name} action. (Alredy exist!) It was removed in {action.name} action.')
+                                print(
+                                    f'"{current_target}" can not be updated to "{new_target}" in {action.name} action. '
+                                    f'(Alredy exist!) It was removed in {action.name} action.'
+                                )
                             self.remove_fcurve += 1
                             break #FCurve removed so no neew to test the other old_var_names
                         else:
                             if self.print_log or show_debug:
-                                print(f'"{current_target}" can not be updated to "{new_target}" in {action.name} action. (Alredy exist!)')
+                                print(
+                                    f'"{current_target}" can not be updated to "{new_target}" in {action.name} action. '
+                                    '(Alredy exist!)'
+                                )
                 else:
                     if show_debug: 
                         print(f"{old_data_path} not found in {current_target} for action {action.name}.")
 
+        # Data paths changed without changing the FCurve count
+        channel_table.clear_channel_table(action)
+
     def remove_action_curve_by_data_path(self, action, data_paths):
         """
         Remove FCurves from a given action based on specified data paths.
@@ -124,15 +140,11 @@ class RigActionUpdater:
         Returns:
             None
         """
-        cache_action_fcurves = []
-        cache_data_paths = []
-        for fcurve in action.fcurves:
-            cache_action_fcurves.append(fcurve)
-            cache_data_paths.append(fcurve.data_path)
+        table = channel_table.build_channel_table(action)
+        cache_action_fcurves = list(action.fcurves)
 
-        for action_fcurve in cache_action_fcurves:
+        for action_fcurve, current_target in zip(cache_action_fcurves, table.data_paths):
             for data_path in data_paths:
-                current_target = action_fcurve.data_path
                 if data_path in current_target:
 
                     # ---
@@ -143,6 +155,40 @@ class RigActionUpdater:
                     self.remove_fcurve += 1
                     break #FCurve removed so no neew to test the other old_var_names
 
+        channel_table.clear_channel_table(action)
+
+    def remove_orphan_bone_curves(self, action, bone_names, dry_run=False):
+        """
+        Remove the FCurves of bones that are not in bone_names, for example after bones were deleted or renamed.
+
+        Args:
+            action (bpy.types.Action): The Blender action containing FCurves to be checked and removed.
+            bone_names (set of str): The names of the bones that still exist.
+            dry_run (bool, optional): If True, the FCurves are only listed.
+
+        Returns:
+            list: (data_path, array_index, key count) of each orphan FCurve.
+        """
+        table = channel_table.build_channel_table(action)
+        orphan_rows = table.get_orphan_bone_rows(set(bone_names))
+        if not orphan_rows:
+            return []
+
+        cache_action_fcurves = list(action.fcurves)
+        orphans = []
+        for row in orphan_rows:
+            orphan_fcurve = cache_action_fcurves[row]
+            orphans.append((table.data_paths[row], table.array_indices[row], len(orphan_fcurve.keyframe_points)))
+            if not dry_run:
+                action.fcurves.remove(orphan_fcurve)
+                if self.print_log:
+                    print(f'"{table.data_paths[row]}" removed in {action.name} action.')
+                self.remove_fcurve += 1
+
+        if not dry_run:
+            channel_table.clear_channel_table(action)
+        return orphans
+
     def edit_action_curve(self, action, data_paths, callback=None):
         """
         Edit FCurves in a given action based on specified data paths using a custom callback function.
@@ -158,23 +204,21 @@ class RigActionUpdater:
         Returns:
             None
         """
-        cache_action_fcurves = []
-        cache_data_paths = []
-        for fcurve in action.fcurves:
-            cache_action_fcurves.append(fcurve)
-            cache_data_paths.append(fcurve.data_path)
-
+        table = channel_table.build_channel_table(action)
+        cache_action_fcurves = list(action.fcurves)
 
-        for action_fcurve in cache_action_fcurves:
+        for action_fcurve, current_target in zip(cache_action_fcurves, table.data_paths):
             for data_path in data_paths:
-                current_target = action_fcurve.data_path
                 if data_path in current_target:
 
                     # ---
 
                     if callback:
                         callback(action, action_fcurve, data_path)
+                        current_target = action_fcurve.data_path
 
+        # The callback can edit the data paths
+        channel_table.clear_channel_table(action)
 
     def print_update_log(self):
         """
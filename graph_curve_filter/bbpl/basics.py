@@ -30,6 +30,7 @@ import bmesh
 import addon_utils
 import pathlib
 from typing import Optional
+from . import channel_table
 
 
 def check_plugin_is_activated(plugin_name):
@@ -276,16 +277,45 @@ def get_if_action_is_associated(action, bone_names):
     Returns:
         bool: True if the action is associated with any bone in the list, False otherwise.
     """
-    for group in action.groups:
-        for fcurve in group.channels:
-            s = fcurve.data_path
-            start = s.find('["')
-            end = s.rfind('"]')
-            if start > 0 and end > 0:
-                substring = s[start+2:end]
-                if substring in bone_names:
-                    return True
-    return False
+    action_bone_names = channel_table.get_channel_table(action).get_bone_names()
+    return not action_bone_names.isdisjoint(bone_names)
+
+
+def get_actions_association_matrix(actions, bone_name_lists, use_ratio=False):
+    """
+    Checks every action against every bone list, the bone names of each action are collected once.
+
+    Args:
+        actions (list): List of bpy.types.Action.
+        bone_name_lists (list): List of bone name lists, for example one per armature.
+        use_ratio (bool): If True, the entries are the ratio of the animated bones of the action
+            found in the bone list, else True when any bone is found.
+
+    Returns:
+        list: One row per action with one entry per bone list, bool or float.
+    """
+    bone_name_sets = [set(bone_names) for bone_names in bone_name_lists]
+    matrix = []
+    for action in actions:
+        action_bone_names = channel_table.get_channel_table(action).get_bone_names()
+        if use_ratio:
+            count = len(action_bone_names)
+            row = [len(action_bone_names & bone_names) / count if count else 0.0 for bone_names in bone_name_sets]
+        else:
+            row = [not action_bone_names.isdisjoint(bone_names) for bone_names in bone_name_sets]
+        matrix.append(row)
+    return matrix
+
+
+def get_armature_bone_names(armature):
+    """
+    Args:
+        armature (bpy.types.Object): The armature object.
+
+    Returns:
+        set: The names of the armature bones.
+    """
+    return {bone.name for bone in armature.data.bones}
 
 
 def get_surface_area(obj):
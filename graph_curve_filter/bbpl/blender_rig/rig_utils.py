@@ -154,6 +154,25 @@ if bpy.app.version >= (4, 0, 0):
                 col.unassign(bone)
                 return col
 
+    def get_bone_collection(arm, collection_name) -> bpy.types.BoneCollection:
+        #Return the collection or None, child collections included.
+        if bpy.app.version >= (4, 1, 0):
+            return arm.data.collections_all.get(collection_name)
+        else:
+            return arm.data.collections.get(collection_name)
+
+    def get_bone_collection_bone_names(arm, collection_name, include_children=True) -> set:
+        #Return the names of the bones in the collection and optionally in its child collections.
+        bone_names = set()
+        col = get_bone_collection(arm, collection_name)
+        pending = [col] if col else []
+        while pending:
+            col = pending.pop()
+            bone_names.update(bone.name for bone in col.bones)
+            if include_children and bpy.app.version >= (4, 1, 0):
+                pending.extend(col.children)
+        return bone_names
+
 def change_current_layer(layer, source):
     """
     Change the current active layer to the specified layer.
@@ -372,7 +391,9 @@ class DriverPropertyHelper:
         set_driver(self.armature, driver, bone_name, self.property_name)
 
 
-def create_bone_custom_property(armature, property_bone_name, property_name, default=0.0, value_min=0.0, value_max=1.0, description='..', overridable=True):
+def create_bone_custom_property(
+        armature, property_bone_name, property_name, default=0.0, value_min=0.0, value_max=1.0, description='..',
+        overridable=True):
     """
     Creates a custom property for the specified bone in the armature.
     """
@@ -432,7 +453,8 @@ def subdivise_one_bone(armature, bone_name, subdivise_prefix_name="Subdivise_",
     # Duplication
     chain = [bone_name]
     for x in range(1, split_number):
-        dup_bone_name = duplicate_bone(armature, edit_bone.name, subdivise_prefix_name + str(x).zfill(2) + "_" + edit_bone.name)
+        new_bone_name = subdivise_prefix_name + str(x).zfill(2) + "_" + edit_bone.name
+        dup_bone_name = duplicate_bone(armature, edit_bone.name, new_bone_name)
         chain.append(dup_bone_name)
 
     if not keep_parent:
@@ -508,7 +530,8 @@ def copy_constraint(armature, copy_bone_name, paste_bone_name, clear=True):
         armature (bpy.types.Object): The armature object.
         copy_bone_name (str): The name of the bone from which to copy the constraints.
         paste_bone_name (str): The name of the bone to which the constraints are copied.
-        clear (bool, optional): Indicates whether to clear existing constraints in the destination bone. Defaults to True.
+        clear (bool, optional): Indicates whether to clear existing constraints in the destination bone.
+            Defaults to True.
     """
     copy_bone = armature.pose.bones[copy_bone_name]
     paste_bone = armature.pose.bones[paste_bone_name]
@@ -0,0 +1,189 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# ----------------------------------------------
+#  BBPL -> BleuRaven Blender Python Library
+#  BleuRaven.fr
+#  XavierLoux.com
+# ----------------------------------------------
+
+# Channel metadata of the actions, parsed from the F-Curve data paths.
+# This module must not import bpy: it only reads data_path and array_index.
+
+import re
+import functools
+from typing import NamedTuple, List, Set
+
+OWNER_BONE = 'BONE'
+OWNER_SHAPE_KEY = 'SHAPE_KEY'
+OWNER_CUSTOM_PROPERTY = 'CUSTOM_PROPERTY'
+OWNER_OBJECT = 'OBJECT'
+
+OWNER_COLLECTION_KINDS = {
+    "pose.bones": OWNER_BONE,
+    "key_blocks": OWNER_SHAPE_KEY,
+}
+
+# pose.bones["Bone"].location, pose.bones["Bone"]["prop"], key_blocks["Key"].value, ["prop"], location
+CHANNEL_DATA_PATH_PATTERN = re.compile(
+    r'^(?:'
+    r'(?P<collection>pose\.bones|key_blocks)\["(?P<owner>(?:[^"\\]|\\.)*)"\](?:\.(?P<prop>.+)|(?P<owner_custom>\[.+\]))'
+    r'|\["(?P<custom>(?:[^"\\]|\\.)*)"\]'
+    r'|(?P<object_prop>.+)'
+    r')$'
+)
+ESCAPED_CHARACTER_PATTERN = re.compile(r'\\(.)')
+
+
+class ChannelPath(NamedTuple):
+    owner_kind: str
+    owner_name: str
+    property: str
+
+
+def unescape_name(name: str) -> str:
+    return ESCAPED_CHARACTER_PATTERN.sub(r'\1', name)
+
+
+@functools.lru_cache(maxsize=65536)
+def parse_data_path(data_path: str) -> ChannelPath:
+    """
+    Parses an F-Curve data path, memoized by data path.
+
+    Args:
+        data_path (str): The F-Curve data path.
+
+    Returns:
+        ChannelPath: The owner kind (OWNER_*), the owner name (bone or shape key name, custom property name,
+                     empty for object properties) and the property (custom properties of bones keep the brackets).
+    """
+    match = CHANNEL_DATA_PATH_PATTERN.match(data_path)
+    if match is None:
+        return ChannelPath(OWNER_OBJECT, "", data_path)
+    if match.group("collection"):
+        prop = match.group("prop") or match.group("owner_custom")
+        return ChannelPath(OWNER_COLLECTION_KINDS[match.group("collection")], unescape_name(match.group("owner")), prop)
+    if match.group("custom") is not None:
+        name = unescape_name(match.group("custom"))
+        return ChannelPath(OWNER_CUSTOM_PROPERTY, name, name)
+    return ChannelPath(OWNER_OBJECT, "", match.group("object_prop"))
+
+
+class ChannelTable():
+    """
+    One row per F-Curve of an action, in the fcurves order, stored as columns.
+    The owner columns are parsed on first use, the data path and array index columns are read at once.
+    """
+
+    def __init__(self, fcurves):
+        fcurves = list(fcurves)
+        self.data_paths: List[str] = [fcurve.data_path for fcurve in fcurves]
+        self.array_indices: List[int] = [fcurve.array_index for fcurve in fcurves]
+
+    def __len__(self):
+        return len(self.data_paths)
+
+    def matches(self, fcurves) -> bool:
+        """
+        Returns:
+            bool: True when the F-Curves still have the data paths and array indices of the rows, in the same order.
+        """
+        fcurves = list(fcurves)
+        return (
+            len(fcurves) == len(self.data_paths)
+            and [fcurve.data_path for fcurve in fcurves] == self.data_paths
+            and [fcurve.array_index for fcurve in fcurves] == self.array_indices
+        )
+
+    @functools.cached_property
+    def channel_paths(self) -> List[ChannelPath]:
+        return list(map(parse_data_path, self.data_paths))
+
+    @functools.cached_property
+    def owner_kinds(self) -> List[str]:
+        return [channel_path.owner_kind for channel_path in self.channel_paths]
+
+    @functools.cached_property
+    def owner_names(self) -> List[str]:
+        return [channel_path.owner_name for channel_path in self.channel_paths]
+
+    @functools.cached_property
+    def properties(self) -> List[str]:
+        return [channel_path.property for channel_path in self.channel_paths]
+
+    @functools.cached_property
+    def bone_name_column(self) -> List[str]:
+        """
+        The bone name of each row, None for the channels that are not bone channels.
+        """
+        return [
+            channel_path.owner_name if channel_path.owner_kind == OWNER_BONE else None
+            for channel_path in self.channel_paths
+        ]
+
+    def get_owner_names(self, owner_kind: str) -> Set[str]:
+        return {channel_path.owner_name for channel_path in self.channel_paths if channel_path.owner_kind == owner_kind}
+
+    def get_bone_names(self) -> Set[str]:
+        return self.get_owner_names(OWNER_BONE)
+
+    def get_orphan_bone_rows(self, bone_names: Set[str]) -> List[int]:
+        """
+        Returns:
+            list: The rows of the bone channels whose bone is not in bone_names.
+        """
+        return [
+            row for row, bone_name in enumerate(self.bone_name_column)
+            if bone_name is not None and bone_name not in bone_names
+        ]
+
+
+# Action pointer -> ChannelTable. The pointer does not change when the action is renamed.
+# Only the F-Curve count is checked on access: the code that renames or removes F-Curves clears the table,
+# and the addon clears all the tables after load, undo and redo, when freed pointers can be reused.
+channel_tables = {}
+
+
+def get_channel_table(action) -> ChannelTable:
+    """
+    Returns the cached channel table of the action, parsed again when its F-Curve count changed.
+    """
+    table = channel_tables.get(action.as_pointer())
+    if table is None or len(table) != len(action.fcurves):
+        table = build_channel_table(action)
+    return table
+
+
+def build_channel_table(action) -> ChannelTable:
+    """
+    Parses the channel table of the action again, for code that writes the F-Curves
+    and can not use a table made before a bone rename.
+    """
+    table = ChannelTable(action.fcurves)
+    channel_tables[action.as_pointer()] = table
+    return table
+
+
+def clear_channel_table(action=None):
+    """
+    Removes the cached table of the action, or all the tables when action is None.
+    """
+    if action is None:
+        channel_tables.clear()
+    else:
+        channel_tables.pop(action.as_pointer(), None)
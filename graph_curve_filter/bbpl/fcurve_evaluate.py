@@ -0,0 +1,651 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# ----------------------------------------------
+#  BBPL -> BleuRaven Blender Python Library
+#  BleuRaven.fr
+#  XavierLoux.com
+# ----------------------------------------------
+
+# Batch evaluation of packed keys (see fcurve_keys.py).
+# Reproduces Blender FCurve keyframe evaluation (fcurve_eval_keyframes) without calling
+# FCurve.evaluate() per frame: bezier, linear, constant and easing interpolations with
+# extrapolation. FCurve modifiers are not evaluated.
+# This module must not import bpy: curves can be evaluated outside of Blender.
+
+import numpy
+from typing import Dict, Sequence
+from . import fcurve_keys
+
+# Same value as FLT_EPSILON in Blender.
+FLT_EPSILON = 1.1920929e-07
+# Same threshold as the key search of fcurve_eval_keyframes_interpolate() in Blender:
+# a frame closer than this to a key returns the key value.
+KEY_FRAME_THRESHOLD = 0.0001
+
+
+class PackedCurves():
+    """
+    Array backed snapshot of many curves.
+
+    The keys of all the curves are concatenated in one packed keys,
+    the keys of the curve i are keys[key_offsets[i]:key_offsets[i + 1]].
+    It only holds numpy arrays so it can be pickled or sent to another process.
+    """
+
+    def __init__(self, packed_keys_list: Sequence[Dict[str, numpy.ndarray]] = (), extrapolations: Sequence[int] = ()):
+        """
+        Args:
+            packed_keys_list (list): The packed keys of each curve, sorted by frame.
+            extrapolations (list): The extrapolation of each curve, constant if empty.
+        """
+        packed_keys_list = list(packed_keys_list)
+        counts = [fcurve_keys.get_packed_keys_count(packed_keys) for packed_keys in packed_keys_list]
+
+        self.key_offsets = numpy.zeros(len(counts) + 1, dtype=numpy.int64)
+        numpy.cumsum(counts, out=self.key_offsets[1:])
+        self.keys = fcurve_keys.concatenate_packed_keys(packed_keys_list)
+
+        if len(extrapolations) == 0:
+            extrapolations = [fcurve_keys.EXTRAPOLATION_CONSTANT] * len(counts)
+        self.extrapolations = numpy.array(extrapolations, dtype=numpy.int32)
+
+    @classmethod
+    def from_arrays(cls, keys: Dict[str, numpy.ndarray], key_offsets: numpy.ndarray, extrapolations: numpy.ndarray):
+        """
+        Creates curves that use existing arrays, without copy.
+        """
+        curves = cls()
+        curves.keys = keys
+        curves.key_offsets = key_offsets
+        curves.extrapolations = extrapolations
+        return curves
+
+    def __len__(self):
+        return len(self.key_offsets) - 1
+
+    def get_curve_keys(self, index: int) -> Dict[str, numpy.ndarray]:
+        """
+        Returns the packed keys of one curve (array views).
+        """
+        start, end = self.key_offsets[index], self.key_offsets[index + 1]
+        return {attr: values[start:end] for attr, values in self.keys.items()}
+
+    def get_key_counts(self) -> numpy.ndarray:
+        return numpy.diff(self.key_offsets)
+
+
+# Easing equations, same as BLI_easing.
+# All the functions use the signature (time, begin, change, duration, back, amplitude, period).
+
+def back_ease_in(time, begin, change, duration, back, amplitude, period):
+    time = time / duration
+    return change * time * time * ((back + 1.0) * time - back) + begin
+
+
+def back_ease_out(time, begin, change, duration, back, amplitude, period):
+    time = time / duration - 1.0
+    return change * (time * time * ((back + 1.0) * time + back) + 1.0) + begin
+
+
+def back_ease_in_out(time, begin, change, duration, back, amplitude, period):
+    back = back * 1.525
+    half_time = time / (duration * 0.5)
+    end_time = half_time - 2.0
+    first_half = change * 0.5 * (half_time * half_time * ((back + 1.0) * half_time - back)) + begin
+    second_half = change * 0.5 * (end_time * end_time * ((back + 1.0) * end_time + back) + 2.0) + begin
+    return numpy.where(half_time < 1.0, first_half, second_half)
+
+
+def bounce_ease_out(time, begin, change, duration, back=None, amplitude=None, period=None):
+    time = time / duration
+    result = numpy.where(
+        time < (1.0 / 2.75),
+        7.5625 * time * time,
+        numpy.where(
+            time < (2.0 / 2.75),
+            7.5625 * (time - 1.5 / 2.75) ** 2 + 0.75,
+            numpy.where(
+                time < (2.5 / 2.75),
+                7.5625 * (time - 2.25 / 2.75) ** 2 + 0.9375,
+                7.5625 * (time - 2.625 / 2.75) ** 2 + 0.984375,
+                )
+            )
+        )
+    return change * result + begin
+
+
+def bounce_ease_in(time, begin, change, duration, back=None, amplitude=None, period=None):
+    return change - bounce_ease_out(duration - time, 0.0, change, duration) + begin
+
+
+def bounce_ease_in_out(time, begin, change, duration, back=None, amplitude=None, period=None):
+    first_half = bounce_ease_in(time * 2.0, 0.0, change, duration) * 0.5 + begin
+    second_half = bounce_ease_out(time * 2.0 - duration, 0.0, change, duration) * 0.5 + change * 0.5 + begin
+    return numpy.where(time < duration * 0.5, first_half, second_half)
+
+
+def circ_ease_in(time, begin, change, duration, back, amplitude, period):
+    time = time / duration
+    return -change * (numpy.sqrt(numpy.maximum(1.0 - time * time, 0.0)) - 1.0) + begin
+
+
+def circ_ease_out(time, begin, change, duration, back, amplitude, period):
+    time = time / duration - 1.0
+    return change * numpy.sqrt(numpy.maximum(1.0 - time * time, 0.0)) + begin
+
+
+def circ_ease_in_out(time, begin, change, duration, back, amplitude, period):
+    half_time = time / (duration * 0.5)
+    end_time = half_time - 2.0
+    first_half = -change * 0.5 * (numpy.sqrt(numpy.maximum(1.0 - half_time * half_time, 0.0)) - 1.0) + begin
+    second_half = change * 0.5 * (numpy.sqrt(numpy.maximum(1.0 - end_time * end_time, 0.0)) + 1.0) + begin
+    return numpy.where(half_time < 1.0, first_half, second_half)
+
+
+def cubic_ease_in(time, begin, change, duration, back, amplitude, period):
+    time = time / duration
+    return change * time ** 3 + begin
+
+
+def cubic_ease_out(time, begin, change, duration, back, amplitude, period):
+    time = time / duration - 1.0
+    return change * (time ** 3 + 1.0) + begin
+
+
+def cubic_ease_in_out(time, begin, change, duration, back, amplitude, period):
+    time = time / (duration * 0.5)
+    return numpy.where(
+        time < 1.0,
+        change * 0.5 * time ** 3 + begin,
+        change * 0.5 * ((time - 2.0) ** 3 + 2.0) + begin,
+        )
+
+
+def elastic_blend(time, change, duration, amplitude, s, f):
+    # When the amplitude is less than the change, blend f close to the crossing point.
+    t = numpy.abs(s)
+    abs_change = numpy.abs(change)
+    amplitude_ratio = numpy.divide(amplitude, abs_change, out=numpy.zeros_like(abs_change), where=abs_change != 0.0)
+    f = numpy.where(amplitude != 0.0, f * amplitude_ratio, 0.0)
+    scaled_time = numpy.abs(time * duration)
+    blend = numpy.divide(scaled_time, t, out=numpy.ones_like(t), where=t != 0.0)
+    f = numpy.where(scaled_time < t, f * blend + (1.0 - blend), f)
+    return numpy.where(change != 0.0, f, 1.0)
+
+
+def elastic_parameters(time, change, duration, amplitude, period, default_period):
+    period = numpy.where(period == 0.0, duration * default_period, period)
+    use_blend = (amplitude == 0.0) | (amplitude < numpy.abs(change))
+    quarter_period = period / 4.0
+    ratio = numpy.divide(change, amplitude, out=numpy.zeros_like(change), where=amplitude != 0.0)
+    s = numpy.where(use_blend, quarter_period, period / (2.0 * numpy.pi) * numpy.arcsin(numpy.clip(ratio, -1.0, 1.0)))
+    f = numpy.where(use_blend, elastic_blend(time, change, duration, amplitude, quarter_period, 1.0), 1.0)
+    amplitude = numpy.where(use_blend, change, amplitude)
+    return s, f, amplitude, period
+
+
+def elastic_wave(time, duration, amplitude, period, s):
+    return amplitude * numpy.power(2.0, 10.0 * time) * numpy.sin((time * duration - s) * (2.0 * numpy.pi) / period)
+
+
+def elastic_ease_in(time, begin, change, duration, back, amplitude, period):
+    is_start = time == 0.0
+    time = time / duration
+    is_end = time == 1.0
+    time = time - 1.0
+    s, f, amplitude, period = elastic_parameters(time, change, duration, amplitude, period, 0.3)
+    result = -f * elastic_wave(time, duration, amplitude, period, s) + begin
+    return numpy.where(is_start, begin, numpy.where(is_end, begin + change, result))
+
+
+def elastic_ease_out(time, begin, change, duration, back, amplitude, period):
+    is_start = time == 0.0
+    time = time / duration
+    is_end = time == 1.0
+    time = -time
+    s, f, amplitude, period = elastic_parameters(time, change, duration, amplitude, period, 0.3)
+    result = f * elastic_wave(time, duration, amplitude, period, s) + change + begin
+    return numpy.where(is_start, begin, numpy.where(is_end, begin + change, result))
+
+
+def elastic_ease_in_out(time, begin, change, duration, back, amplitude, period):
+    is_start = time == 0.0
+    time = time / (duration * 0.5)
+    is_end = time == 2.0
+    time = time - 1.0
+    s, f, amplitude, period = elastic_parameters(time, change, duration, amplitude, period, 0.3 * 1.5)
+    first_half = -0.5 * f * elastic_wave(time, duration, amplitude, period, s) + begin
+    end_time = -time
+    second_half = 0.5 * f * elastic_wave(end_time, duration, amplitude, period, s) + change + begin
+    result = numpy.where(time < 0.0, first_half, second_half)
+    return numpy.where(is_start, begin, numpy.where(is_end, begin + change, result))
+
+
+# Expo easing is scaled to start at 0 and end at 1, same as Blender.
+EXPO_POW_MIN = 0.0009765625
+EXPO_POW_SCALE = 1.0 / (1.0 - EXPO_POW_MIN)
+
+
+def expo_ease_in(time, begin, change, duration, back=None, amplitude=None, period=None):
+    result = change * (numpy.power(2.0, 10.0 * (time / duration - 1.0)) - EXPO_POW_MIN) * EXPO_POW_SCALE + begin
+    return numpy.where(time == 0.0, begin, result)
+
+
+def expo_ease_out(time, begin, change, duration, back=None, amplitude=None, period=None):
+    result = change * (1.0 - (numpy.power(2.0, -10.0 * time / duration) - EXPO_POW_MIN) * EXPO_POW_SCALE) + begin
+    return numpy.where(time == 0.0, begin, result)
+
+
+def expo_ease_in_out(time, begin, change, duration, back=None, amplitude=None, period=None):
+    duration = duration * 0.5
+    change = change * 0.5
+    return numpy.where(
+        time < duration,
+        expo_ease_in(time, begin, change, duration),
+        expo_ease_out(time - duration, begin + change, change, duration),
+        )
+
+
+def quad_ease_in(time, begin, change, duration, back, amplitude, period):
+    time = time / duration
+    return change * time * time + begin
+
+
+def quad_ease_out(time, begin, change, duration, back, amplitude, period):
+    time = time / duration
+    return -change * time * (time - 2.0) + begin
+
+
+def quad_ease_in_out(time, begin, change, duration, back, amplitude, period):
+    time = time / (duration * 0.5)
+    return numpy.where(
+        time < 1.0,
+        change * 0.5 * time * time + begin,
+        -change * 0.5 * ((time - 1.0) * (time - 3.0) - 1.0) + begin,
+        )
+
+
+def quart_ease_in(time, begin, change, duration, back, amplitude, period):
+    time = time / duration
+    return change * time ** 4 + begin
+
+
+def quart_ease_out(time, begin, change, duration, back, amplitude, period):
+    time = time / duration - 1.0
+    return -change * (time ** 4 - 1.0) + begin
+
+
+def quart_ease_in_out(time, begin, change, duration, back, amplitude, period):
+    time = time / (duration * 0.5)
+    return numpy.where(
+        time < 1.0,
+        change * 0.5 * time ** 4 + begin,
+        -change * 0.5 * ((time - 2.0) ** 4 - 2.0) + begin,
+        )
+
+
+def quint_ease_in(time, begin, change, duration, back, amplitude, period):
+    time = time / duration
+    return change * time ** 5 + begin
+
+
+def quint_ease_out(time, begin, change, duration, back, amplitude, period):
+    time = time / duration - 1.0
+    return change * (time ** 5 + 1.0) + begin
+
+
+def quint_ease_in_out(time, begin, change, duration, back, amplitude, period):
+    time = time / (duration * 0.5)
+    return numpy.where(
+        time < 1.0,
+        change * 0.5 * time ** 5 + begin,
+        change * 0.5 * ((time - 2.0) ** 5 + 2.0) + begin,
+        )
+
+
+def sine_ease_in(time, begin, change, duration, back, amplitude, period):
+    return -change * numpy.cos(time / duration * (numpy.pi / 2.0)) + change + begin
+
+
+def sine_ease_out(time, begin, change, duration, back, amplitude, period):
+    return change * numpy.sin(time / duration * (numpy.pi / 2.0)) + begin
+
+
+def sine_ease_in_out(time, begin, change, duration, back, amplitude, period):
+    return -change * 0.5 * (numpy.cos(numpy.pi * time / duration) - 1.0) + begin
+
+
+# interpolation: (ease in, ease out, ease in out, easing used for EASING_AUTO)
+EASING_FUNCTIONS = {
+    fcurve_keys.INTERPOLATION_BACK: (back_ease_in, back_ease_out, back_ease_in_out, fcurve_keys.EASING_OUT),
+    fcurve_keys.INTERPOLATION_BOUNCE: (bounce_ease_in, bounce_ease_out, bounce_ease_in_out, fcurve_keys.EASING_OUT),
+    fcurve_keys.INTERPOLATION_CIRC: (circ_ease_in, circ_ease_out, circ_ease_in_out, fcurve_keys.EASING_IN),
+    fcurve_keys.INTERPOLATION_CUBIC: (cubic_ease_in, cubic_ease_out, cubic_ease_in_out, fcurve_keys.EASING_IN),
+    fcurve_keys.INTERPOLATION_ELASTIC: (elastic_ease_in, elastic_ease_out, elastic_ease_in_out, fcurve_keys.EASING_OUT),
+    fcurve_keys.INTERPOLATION_EXPO: (expo_ease_in, expo_ease_out, expo_ease_in_out, fcurve_keys.EASING_IN),
+    fcurve_keys.INTERPOLATION_QUAD: (quad_ease_in, quad_ease_out, quad_ease_in_out, fcurve_keys.EASING_IN),
+    fcurve_keys.INTERPOLATION_QUART: (quart_ease_in, quart_ease_out, quart_ease_in_out, fcurve_keys.EASING_IN),
+    fcurve_keys.INTERPOLATION_QUINT: (quint_ease_in, quint_ease_out, quint_ease_in_out, fcurve_keys.EASING_IN),
+    fcurve_keys.INTERPOLATION_SINE: (sine_ease_in, sine_ease_out, sine_ease_in_out, fcurve_keys.EASING_IN),
+}
+
+
+def is_packed_keys_supported(packed_keys: Dict[str, numpy.ndarray]) -> bool:
+    """
+    Checks if all the interpolation modes of the packed keys can be evaluated by this module.
+    """
+    supported = (
+        fcurve_keys.INTERPOLATION_CONSTANT,
+        fcurve_keys.INTERPOLATION_LINEAR,
+        fcurve_keys.INTERPOLATION_BEZIER,
+        *EASING_FUNCTIONS.keys(),
+    )
+    return bool(numpy.isin(packed_keys["interpolation"][:-1], supported).all())
+
+
+def correct_bezier_handles(x1, y1, x2, y2, x3, y3, x4, y4):
+    """
+    Shortens the handles that overlap in time, same as BKE_fcurve_correct_bezpart().
+
+    Returns:
+        tuple: The corrected (x2, y2, x3, y3).
+    """
+    h1_x = x1 - x2
+    h1_y = y1 - y2
+    h2_x = x4 - x3
+    h2_y = y4 - y3
+    length = x4 - x1
+    handles_length = numpy.abs(h1_x) + numpy.abs(h2_x)
+
+    too_long = (handles_length > length) & (handles_length != 0.0)
+    factor = numpy.ones_like(length)
+    numpy.divide(length, handles_length, out=factor, where=too_long)
+
+    x2 = x1 - factor * h1_x
+    y2 = y1 - factor * h1_y
+    x3 = x4 - factor * h2_x
+    y3 = y4 - factor * h2_y
+    return x2, y2, x3, y3
+
+
+def solve_bezier_time(frames, x1, x2, x3, x4, iterations=12):
+    """
+    Finds the bezier parameter t for each frame (x(t) = frame) with a bracketed Newton solver.
+    """
+    c1 = 3.0 * (x2 - x1)
+    c2 = 3.0 * (x1 - 2.0 * x2 + x3)
+    c3 = x4 - x1 + 3.0 * (x2 - x3)
+    c0 = x1 - frames
+
+    span = x4 - x1
+    t = numpy.divide(frames - x1, span, out=numpy.zeros_like(frames), where=span != 0.0)
+    t = numpy.clip(t, 0.0, 1.0)
+    low = numpy.zeros_like(t)
+    high = numpy.ones_like(t)
+
+    for _ in range(iterations):
+        x = ((c3 * t + c2) * t + c1) * t + c0
+        dx = (3.0 * c3 * t + 2.0 * c2) * t + c1
+
+        # x(t) is increasing: keep the bracket around the root.
+        low = numpy.where(x < 0.0, t, low)
+        high = numpy.where(x > 0.0, t, high)
+
+        newton_t = t - numpy.divide(x, dx, out=numpy.full_like(t, -1.0), where=dx != 0.0)
+        use_newton = (newton_t > low) & (newton_t < high)
+        t = numpy.where(use_newton, newton_t, (low + high) * 0.5)
+    return t
+
+
+def evaluate_bezier(frames, x1, y1, x2, y2, x3, y3, x4, y4):
+    """
+    Evaluates bezier segments at the given frames, handles are corrected like in Blender.
+    """
+    flat = (numpy.abs(y1 - y4) < FLT_EPSILON) & (y2 == y1) & (y3 == y4)
+
+    x2, y2, x3, y3 = correct_bezier_handles(x1, y1, x2, y2, x3, y3, x4, y4)
+    t = solve_bezier_time(frames, x1, x2, x3, x4)
+    u = 1.0 - t
+    values = u * u * u * y1 + 3.0 * u * u * t * y2 + 3.0 * u * t * t * y3 + t * t * t * y4
+    return numpy.where(flat, y1, values)
+
+
+def evaluate_easing(interpolation, easing, time, begin, change, duration, back, amplitude, period):
+    """
+    Evaluates easing segments, the mode of each sample is given by its interpolation and easing.
+    """
+    values = begin.copy()
+    for interpolation_mode, (ease_in, ease_out, ease_in_out, auto_easing) in EASING_FUNCTIONS.items():
+        mode_mask = interpolation == interpolation_mode
+        if not mode_mask.any():
+            continue
+
+        mode_easing = numpy.where(easing[mode_mask] == fcurve_keys.EASING_AUTO, auto_easing, easing[mode_mask])
+        for easing_mode, function in (
+                (fcurve_keys.EASING_IN, ease_in),
+                (fcurve_keys.EASING_OUT, ease_out),
+                (fcurve_keys.EASING_IN_OUT, ease_in_out)):
+            easing_mask = mode_easing == easing_mode
+            if not easing_mask.any():
+                continue
+
+            mask = numpy.flatnonzero(mode_mask)[easing_mask]
+            values[mask] = function(
+                time[mask], begin[mask], change[mask], duration[mask], back[mask], amplitude[mask], period[mask]
+            )
+    return values
+
+
+def evaluate_extrapolation(keys, sample_frames, endpoint, neighbor, handle_attr, key_counts, extrapolations):
+    """
+    Evaluates the frames outside the keyframe range, same as fcurve_eval_keyframes_extrapolate().
+    """
+    co = keys["co"]
+    endpoint_frames = co[endpoint, 0].astype(numpy.float64)
+    endpoint_values = co[endpoint, 1].astype(numpy.float64)
+    interpolation = keys["interpolation"][endpoint]
+
+    use_slope = (
+        (extrapolations == fcurve_keys.EXTRAPOLATION_LINEAR)
+        & (key_counts > 1)
+        & (interpolation != fcurve_keys.INTERPOLATION_CONSTANT)
+    )
+    if not use_slope.any():
+        return endpoint_values
+
+    # Linear keys use the neighbor key, other keys use their handle.
+    use_neighbor = interpolation == fcurve_keys.INTERPOLATION_LINEAR
+    reference = numpy.where(use_neighbor[:, None], co[neighbor], keys[handle_attr][endpoint]).astype(numpy.float64)
+    span = numpy.where(use_neighbor, reference[:, 0] - endpoint_frames, endpoint_frames - reference[:, 0])
+    change = numpy.where(use_neighbor, reference[:, 1] - endpoint_values, endpoint_values - reference[:, 1])
+    slope = numpy.divide(change, span, out=numpy.zeros_like(span), where=span != 0.0)
+
+    return numpy.where(use_slope, endpoint_values - slope * (endpoint_frames - sample_frames), endpoint_values)
+
+
+def evaluate_samples(curves: PackedCurves, curve_indices: numpy.ndarray, sample_frames: numpy.ndarray) -> numpy.ndarray:
+    """
+    Evaluates one frame per sample, each sample can target a different curve.
+
+    Args:
+        curves (PackedCurves): The curves to evaluate.
+        curve_indices (numpy.ndarray): The curve index of each sample.
+        sample_frames (numpy.ndarray): The frame of each sample.
+
+    Returns:
+        numpy.ndarray: The value of each sample.
+    """
+    curve_indices = numpy.asarray(curve_indices, dtype=numpy.int64)
+    sample_frames = numpy.asarray(sample_frames, dtype=numpy.float64)
+    values = numpy.zeros(sample_frames.shape, dtype=numpy.float64)
+
+    keys = curves.keys
+    total_key_count = fcurve_keys.get_packed_keys_count(keys)
+    if total_key_count == 0 or len(sample_frames) == 0:
+        return values
+
+    key_frames = keys["co"][:, 0].astype(numpy.float64)
+    key_values = keys["co"][:, 1].astype(numpy.float64)
+
+    key_counts = curves.get_key_counts()[curve_indices]
+    first = numpy.minimum(curves.key_offsets[curve_indices], total_key_count - 1)
+    last = numpy.maximum(curves.key_offsets[curve_indices + 1] - 1, 0)
+    extrapolations = curves.extrapolations[curve_indices]
+
+    has_keys = key_counts > 0
+    before = has_keys & (sample_frames <= key_frames[first])
+    after = has_keys & ~before & (sample_frames >= key_frames[last])
+    inside = has_keys & ~(before | after)
+
+    for mask, endpoint, neighbor, handle_attr in (
+            (before, first, first + 1, "handle_left"),
+            (after, last, last - 1, "handle_right")):
+        if mask.any():
+            values[mask] = evaluate_extrapolation(
+                keys, sample_frames[mask], endpoint[mask], numpy.clip(neighbor[mask], 0, total_key_count - 1),
+                handle_attr, key_counts[mask], extrapolations[mask])
+
+    if not inside.any():
+        return values
+
+    # One global search: the frames are shifted by curve so all the keys stay sorted.
+    min_frame = min(key_frames.min(), sample_frames.min())
+    curve_span = max(key_frames.max(), sample_frames.max()) - min_frame + 2.0
+    key_curve_indices = numpy.repeat(numpy.arange(len(curves)), curves.get_key_counts())
+    search_keys = key_curve_indices * curve_span + (key_frames - min_frame)
+    inside_frames = sample_frames[inside]
+    search_samples = curve_indices[inside] * curve_span + (inside_frames - min_frame)
+
+    start = numpy.searchsorted(search_keys, search_samples, side='right') - 1
+    start = numpy.clip(start, first[inside], last[inside] - 1)
+    end = start + 1
+
+    x1 = key_frames[start]
+    y1 = key_values[start]
+    x4 = key_frames[end]
+    y4 = key_values[end]
+    interpolation = keys["interpolation"][start]
+    duration = x4 - x1
+
+    # Constant, also used for zero length segments.
+    inside_values = y1.copy()
+    has_duration = duration != 0.0
+
+    linear = has_duration & (interpolation == fcurve_keys.INTERPOLATION_LINEAR)
+    if linear.any():
+        factor = (inside_frames[linear] - x1[linear]) / duration[linear]
+        inside_values[linear] = y1[linear] + factor * (y4[linear] - y1[linear])
+
+    bezier = has_duration & (interpolation == fcurve_keys.INTERPOLATION_BEZIER)
+    if bezier.any():
+        handle_right = keys["handle_right"][start[bezier]].astype(numpy.float64)
+        handle_left = keys["handle_left"][end[bezier]].astype(numpy.float64)
+        inside_values[bezier] = evaluate_bezier(
+            inside_frames[bezier],
+            x1[bezier], y1[bezier],
+            handle_right[:, 0], handle_right[:, 1],
+            handle_left[:, 0], handle_left[:, 1],
+            x4[bezier], y4[bezier],
+            )
+
+    easing = has_duration & (interpolation > fcurve_keys.INTERPOLATION_BEZIER)
+    if easing.any():
+        easing_start = start[easing]
+        inside_values[easing] = evaluate_easing(
+            interpolation[easing],
+            keys["easing"][easing_start],
+            inside_frames[easing] - x1[easing],
+            y1[easing],
+            y4[easing] - y1[easing],
+            duration[easing],
+            keys["back"][easing_start].astype(numpy.float64),
+            keys["amplitude"][easing_start].astype(numpy.float64),
+            keys["period"][easing_start].astype(numpy.float64),
+            )
+
+    # Frames very close to a key return the key value.
+    near_start = numpy.abs(inside_frames - x1) < KEY_FRAME_THRESHOLD
+    near_end = numpy.abs(x4 - inside_frames) < KEY_FRAME_THRESHOLD
+    inside_values = numpy.where(near_start, y1, numpy.where(near_end, y4, inside_values))
+
+    values[inside] = inside_values
+    return values
+
+
+def evaluate_packed_curves(curves: PackedCurves, frames) -> numpy.ndarray:
+    """
+    Evaluates many curves at many frames in one vectorized call.
+
+    Args:
+        curves (PackedCurves): The curves to evaluate.
+        frames (array_like): Frames shared by all the curves (shape: frames)
+            or frames of each curve (shape: curves, frames).
+
+    Returns:
+        numpy.ndarray: The values, shape (curves, frames).
+    """
+    frames = numpy.asarray(frames, dtype=numpy.float64)
+    curve_count = len(curves)
+    if frames.ndim == 1:
+        frames = numpy.broadcast_to(frames, (curve_count, len(frames)))
+
+    curve_indices = numpy.repeat(numpy.arange(curve_count), frames.shape[1])
+    values = evaluate_samples(curves, curve_indices, frames.ravel())
+    return values.reshape(frames.shape)
+
+
+def evaluate_packed_keys(packed_keys: Dict[str, numpy.ndarray], frames, extrapolation: int = 0) -> numpy.ndarray:
+    """
+    Evaluates packed keys at many frames in one call.
+
+    Args:
+        packed_keys (dict): The packed keys of the curve, sorted by frame.
+        frames (array_like): The frames to evaluate.
+        extrapolation (int): fcurve_keys.EXTRAPOLATION_CONSTANT or fcurve_keys.EXTRAPOLATION_LINEAR.
+
+    Returns:
+        numpy.ndarray: The curve values at the given frames.
+    """
+    frames = numpy.asarray(frames, dtype=numpy.float64)
+    curves = PackedCurves([packed_keys], [extrapolation])
+    return evaluate_packed_curves(curves, frames.ravel())[0].reshape(frames.shape)
+
+
+def get_sample_frames(frame_start: float, frame_end: float, frame_step: float) -> numpy.ndarray:
+    """
+    Creates a regular frame grid from frame_start to frame_end.
+    frame_end is always the last sample, also when it is not on the grid (e.g. a subframe last key).
+
+    Args:
+        frame_start (float): The first frame of the grid.
+        frame_end (float): The last frame of the range.
+        frame_step (float): The distance between two samples, can be a subframe value.
+
+    Returns:
+        numpy.ndarray: The sample frames.
+    """
+    if frame_step <= 0.0 or frame_end < frame_start:
+        return numpy.array([frame_start], dtype=numpy.float64)
+    count = int(numpy.floor((frame_end - frame_start) / frame_step + 1e-6)) + 1
+    frames = frame_start + numpy.arange(count, dtype=numpy.float64) * frame_step
+    if frame_end - frames[-1] > frame_step * 1e-6:
+        frames = numpy.append(frames, frame_end)
+    else:
+        frames[-1] = frame_end
+    return frames
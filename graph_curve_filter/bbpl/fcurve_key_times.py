@@ -0,0 +1,99 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# ----------------------------------------------
+#  BBPL -> BleuRaven Blender Python Library
+#  BleuRaven.fr
+#  XavierLoux.com
+# ----------------------------------------------
+
+# Sorted key times of many curves, to find the curves with keys in a frame range.
+# The key frames of all the curves are shifted by curve index into one sorted array,
+# a frame range query is two numpy searchsorted calls for all the curves.
+# This module must not import bpy.
+
+import numpy
+from . import fcurve_evaluate
+
+
+class KeyTimeIndex():
+    """
+    Key frames and value changes of packed curves, in the curves order.
+    """
+
+    def __init__(self, curves: fcurve_evaluate.PackedCurves):
+        key_frames = curves.keys["co"][:, 0].astype(numpy.float64)
+        key_values = curves.keys["co"][:, 1]
+        self.key_offsets = curves.key_offsets
+        self.key_counts = curves.get_key_counts()
+        curve_indices = numpy.repeat(numpy.arange(len(curves)), self.key_counts)
+
+        if len(key_frames) > 0:
+            self.min_frame = float(key_frames.min())
+            self.max_frame = float(key_frames.max())
+        else:
+            self.min_frame = self.max_frame = 0.0
+        # The frames of a curve stay inside its span, so the shifted keys are sorted.
+        self.curve_span = self.max_frame - self.min_frame + 2.0
+        self.search_keys = curve_indices * self.curve_span + (key_frames - self.min_frame)
+
+        # changes[j] - changes[i] counts the keys k in [i, j) with a different value at key k + 1.
+        changes = numpy.zeros(max(len(key_frames), 1), dtype=numpy.int64)
+        if len(key_frames) > 1:
+            differs = (key_values[1:] != key_values[:-1]) & (curve_indices[1:] == curve_indices[:-1])
+            numpy.cumsum(differs, out=changes[1:])
+        self.changes = changes
+
+    def __len__(self):
+        return len(self.key_counts)
+
+    def get_range_bounds(self, frame_start: float, frame_end: float):
+        """
+        Returns:
+            tuple: The first key at or after frame_start and the first key after frame_end of each curve.
+        """
+        curve_offsets = numpy.arange(len(self)) * self.curve_span
+        start = min(max(frame_start, self.min_frame), self.max_frame + 1.0) - self.min_frame
+        end = min(max(frame_end, self.min_frame - 1.0), self.max_frame + 1.0) - self.min_frame
+        first_inside = numpy.searchsorted(self.search_keys, curve_offsets + start, side='left')
+        after_inside = numpy.searchsorted(self.search_keys, curve_offsets + end, side='right')
+        return first_inside, after_inside
+
+    def get_curves_with_keys(self, frame_start: float, frame_end: float) -> numpy.ndarray:
+        """
+        Returns:
+            numpy.ndarray: True for the curves with at least one key between frame_start and frame_end (included).
+        """
+        first_inside, after_inside = self.get_range_bounds(frame_start, frame_end)
+        return after_inside > first_inside
+
+    def get_curves_with_changes(self, frame_start: float, frame_end: float) -> numpy.ndarray:
+        """
+        Returns:
+            numpy.ndarray: True for the curves with two keys of different values around or inside the range.
+                           Handles are not checked: a bezier overshoot between keys of the same value is not a change.
+        """
+        first_inside, after_inside = self.get_range_bounds(frame_start, frame_end)
+        # Segments from the last key before the range to the first key after it.
+        first_key = numpy.maximum(first_inside - 1, self.key_offsets[:-1])
+        last_key = numpy.minimum(after_inside, self.key_offsets[1:] - 1)
+        has_segments = last_key > first_key
+        # Curves without keys have no segment, their indices are clipped to stay in the array.
+        first_key = numpy.clip(first_key, 0, len(self.changes) - 1)
+        last_key = numpy.clip(last_key, 0, len(self.changes) - 1)
+        return has_segments & (self.changes[last_key] > self.changes[first_key])
@@ -0,0 +1,187 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# ----------------------------------------------
+#  BBPL -> BleuRaven Blender Python Library
+#  BleuRaven.fr
+#  XavierLoux.com
+# ----------------------------------------------
+
+# Packed keyframe arrays.
+# This module must not import bpy: packed keys can be processed outside of Blender.
+
+import numpy
+import hashlib
+from typing import Dict
+
+# Raw DNA values returned by foreach_get() on keyframe enum properties.
+INTERPOLATION_CONSTANT = 0
+INTERPOLATION_LINEAR = 1
+INTERPOLATION_BEZIER = 2
+INTERPOLATION_BACK = 3
+INTERPOLATION_BOUNCE = 4
+INTERPOLATION_CIRC = 5
+INTERPOLATION_CUBIC = 6
+INTERPOLATION_ELASTIC = 7
+INTERPOLATION_EXPO = 8
+INTERPOLATION_QUAD = 9
+INTERPOLATION_QUART = 10
+INTERPOLATION_QUINT = 11
+INTERPOLATION_SINE = 12
+
+EASING_AUTO = 0
+EASING_IN = 1
+EASING_OUT = 2
+EASING_IN_OUT = 3
+
+HANDLE_FREE = 0
+HANDLE_AUTO = 1
+HANDLE_VECTOR = 2
+HANDLE_ALIGNED = 3
+HANDLE_AUTO_CLAMPED = 4
+
+KEYFRAME_TYPE_KEYFRAME = 0
+
+# FCurve.extrapolation
+EXTRAPOLATION_CONSTANT = 0
+EXTRAPOLATION_LINEAR = 1
+EXTRAPOLATION_NAMES = {
+    'CONSTANT': EXTRAPOLATION_CONSTANT,
+    'LINEAR': EXTRAPOLATION_LINEAR,
+}
+
+# Blender defaults for new keyframes.
+DEFAULT_BACK = 1.70158
+DEFAULT_AMPLITUDE = 0.8
+DEFAULT_PERIOD = 4.1
+
+# Keyframe attributes read and written with foreach_get() / foreach_set().
+# attribute name: (item size, numpy dtype)
+KEYFRAME_ATTRIBUTES = {
+    "co": (2, numpy.float32),
+    "handle_left": (2, numpy.float32),
+    "handle_right": (2, numpy.float32),
+    "interpolation": (1, numpy.int32),
+    "easing": (1, numpy.int32),
+    "handle_left_type": (1, numpy.int32),
+    "handle_right_type": (1, numpy.int32),
+    "type": (1, numpy.int32),
+    "back": (1, numpy.float32),
+    "amplitude": (1, numpy.float32),
+    "period": (1, numpy.float32),
+}
+
+
+def new_packed_keys(count: int) -> Dict[str, numpy.ndarray]:
+    """
+    Creates empty packed keys.
+
+    Args:
+        count (int): The number of keyframes.
+
+    Returns:
+        dict: Attribute name -> numpy array, vector attributes have the shape (count, 2).
+    """
+    packed_keys = {}
+    for attr, (size, dtype) in KEYFRAME_ATTRIBUTES.items():
+        shape = (count, size) if size > 1 else (count,)
+        packed_keys[attr] = numpy.zeros(shape, dtype=dtype)
+    return packed_keys
+
+
+def get_packed_keys_count(packed_keys: Dict[str, numpy.ndarray]) -> int:
+    """
+    Returns the number of keyframes stored in packed keys.
+    """
+    return len(packed_keys["co"])
+
+
+def get_packed_keys_hash(packed_keys: Dict[str, numpy.ndarray], extrapolation: int = EXTRAPOLATION_CONSTANT) -> bytes:
+    """
+    Returns a hash of the keyframe content, equal for curves with the same keys and extrapolation.
+
+    Args:
+        packed_keys (dict): The packed keys to hash.
+        extrapolation (int): The curve extrapolation (EXTRAPOLATION_*).
+
+    Returns:
+        bytes: 16 bytes digest.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(bytes((extrapolation,)))
+    for attr in KEYFRAME_ATTRIBUTES:
+        hasher.update(numpy.ascontiguousarray(packed_keys[attr]).tobytes())
+    return hasher.digest()
+
+
+def select_packed_keys(packed_keys: Dict[str, numpy.ndarray], mask: numpy.ndarray) -> Dict[str, numpy.ndarray]:
+    """
+    Returns new packed keys that only contain the keyframes selected by the mask.
+
+    Args:
+        packed_keys (dict): The source packed keys.
+        mask (numpy.ndarray): Boolean mask or index array of the keyframes to keep.
+
+    Returns:
+        dict: The selected packed keys.
+    """
+    return {attr: values[mask] for attr, values in packed_keys.items()}
+
+
+def new_sampled_packed_keys(
+        frames: numpy.ndarray,
+        values: numpy.ndarray,
+        interpolation: int = INTERPOLATION_LINEAR,
+        ) -> Dict[str, numpy.ndarray]:
+    """
+    Creates packed keys from sampled values, one key per sample with auto clamped handles.
+
+    Args:
+        frames (numpy.ndarray): The sample frames.
+        values (numpy.ndarray): The sample values.
+        interpolation (int): The interpolation of the new keys.
+
+    Returns:
+        dict: The new packed keys.
+    """
+    packed_keys = new_packed_keys(len(frames))
+    packed_keys["co"][:, 0] = frames
+    packed_keys["co"][:, 1] = values
+    packed_keys["handle_left"][:] = packed_keys["co"]
+    packed_keys["handle_right"][:] = packed_keys["co"]
+    packed_keys["interpolation"][:] = interpolation
+    packed_keys["handle_left_type"][:] = HANDLE_AUTO_CLAMPED
+    packed_keys["handle_right_type"][:] = HANDLE_AUTO_CLAMPED
+    packed_keys["type"][:] = KEYFRAME_TYPE_KEYFRAME
+    packed_keys["back"][:] = DEFAULT_BACK
+    packed_keys["amplitude"][:] = DEFAULT_AMPLITUDE
+    packed_keys["period"][:] = DEFAULT_PERIOD
+    return packed_keys
+
+
+def concatenate_packed_keys(packed_keys_list) -> Dict[str, numpy.ndarray]:
+    """
+    Concatenates the keyframes of many packed keys in a single packed keys.
+    """
+    packed_keys_list = list(packed_keys_list)
+    if len(packed_keys_list) == 0:
+        return new_packed_keys(0)
+    return {
+        attr: numpy.concatenate([packed_keys[attr] for packed_keys in packed_keys_list])
+        for attr in KEYFRAME_ATTRIBUTES
+    }
@@ -0,0 +1,226 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# ----------------------------------------------
+#  BBPL -> BleuRaven Blender Python Library
+#  BleuRaven.fr
+#  XavierLoux.com
+# ----------------------------------------------
+
+# Curve processing on packed curves, usable in worker processes.
+# This module must not import bpy: the functions here run in processes without Blender.
+# Worker processes load the bpy-free bbpl modules through a package that only points
+# to the bbpl folder, so the bbpl __init__ (which imports bpy) is never executed.
+
+import numpy
+import traceback
+from typing import Dict, List, Optional, Tuple
+from multiprocessing import shared_memory
+from . import fcurve_keys
+from . import fcurve_reduce
+from . import fcurve_evaluate
+
+OPERATION_DECIMATE = "DECIMATE"
+OPERATION_LOSSLESS = "LOSSLESS"
+OPERATION_RESAMPLE = "RESAMPLE"
+OPERATION_EULER_FILTER = "EULER_FILTER"
+
+
+def get_euler_filter_packed_keys(packed_keys: Dict[str, numpy.ndarray]) -> Optional[Dict[str, numpy.ndarray]]:
+    """
+    Removes the 360 degrees jumps between the keys of an euler rotation curve.
+    Each key is moved by a multiple of 2 pi so it stays within pi of the previous key,
+    the handles move with their key.
+
+    Args:
+        packed_keys (dict): The packed keys of the curve, values in radians.
+
+    Returns:
+        dict: The filtered packed keys, None when the curve has no jump.
+    """
+    values = packed_keys["co"][:, 1].astype(numpy.float64)
+    offsets = numpy.unwrap(values) - values
+    if not numpy.any(numpy.abs(offsets) > 1e-6):
+        return None
+
+    new_keys = {attr: array.copy() for attr, array in packed_keys.items()}
+    for attr in ("co", "handle_left", "handle_right"):
+        new_keys[attr][:, 1] += offsets.astype(new_keys[attr].dtype)
+    return new_keys
+
+
+def process_packed_keys(
+        packed_keys: Dict[str, numpy.ndarray],
+        extrapolation: int,
+        operation: str,
+        options: dict,
+        ) -> Optional[Dict[str, numpy.ndarray]]:
+    """
+    Runs one curve operation on packed keys.
+
+    Args:
+        packed_keys (dict): The packed keys of the curve.
+        extrapolation (int): The extrapolation of the curve.
+        operation (str): OPERATION_DECIMATE, OPERATION_LOSSLESS, OPERATION_RESAMPLE or OPERATION_EULER_FILTER.
+        options (dict): The operation options.
+            DECIMATE: "tolerance".
+            RESAMPLE: "frame_step", "frame_range" (None for the curve range), "sparse".
+
+    Returns:
+        dict: The new packed keys, None when the curve is unchanged.
+    """
+    key_count = fcurve_keys.get_packed_keys_count(packed_keys)
+
+    if operation in (OPERATION_DECIMATE, OPERATION_LOSSLESS):
+        if key_count < 3:
+            return None
+        if operation == OPERATION_LOSSLESS:
+            keep_mask = fcurve_reduce.get_lossless_keep_mask(packed_keys)
+        else:
+            keep_mask = fcurve_reduce.get_decimate_keep_mask(packed_keys, options["tolerance"])
+        if keep_mask.all():
+            return None
+        return fcurve_reduce.reduce_packed_keys(packed_keys, keep_mask, operation == OPERATION_DECIMATE)
+
+    if operation == OPERATION_RESAMPLE:
+        if key_count == 0:
+            return None
+        frame_range = options.get("frame_range")
+        if frame_range is None:
+            frame_range = (packed_keys["co"][0, 0], packed_keys["co"][-1, 0])
+        frames = fcurve_evaluate.get_sample_frames(frame_range[0], frame_range[1], options["frame_step"])
+        values = fcurve_evaluate.evaluate_packed_keys(packed_keys, frames, extrapolation)
+        new_keys = fcurve_keys.new_sampled_packed_keys(frames, values)
+        if options.get("sparse", False):
+            keep_mask = fcurve_reduce.get_lossless_keep_mask(new_keys)
+            new_keys = fcurve_reduce.reduce_packed_keys(new_keys, keep_mask, use_linear_segments=False)
+        return new_keys
+
+    if operation == OPERATION_EULER_FILTER:
+        if key_count < 2:
+            return None
+        return get_euler_filter_packed_keys(packed_keys)
+
+    raise ValueError(f"Unknown curve operation: {operation}")
+
+
+class SharedPackedCurves():
+    """
+    Copies the arrays of PackedCurves in one shared memory block.
+
+    The description is small and can be sent to worker processes,
+    they attach the block instead of receiving a copy of the curves.
+    """
+
+    def __init__(self, curves: fcurve_evaluate.PackedCurves):
+        arrays = {
+            "key_offsets": curves.key_offsets,
+            "extrapolations": curves.extrapolations,
+        }
+        for attr, values in curves.keys.items():
+            arrays["keys." + attr] = values
+
+        layout = []
+        size = 0
+        for name, values in arrays.items():
+            size = (size + 15) // 16 * 16  # Keep arrays aligned.
+            layout.append((name, size, values.shape, values.dtype.str))
+            size += values.nbytes
+
+        self.shared_memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for (name, offset, shape, dtype), values in zip(layout, arrays.values()):
+            target = numpy.ndarray(shape, dtype=dtype, buffer=self.shared_memory.buf, offset=offset)
+            target[...] = values
+
+        self.description = (self.shared_memory.name, layout)
+
+    def release(self):
+        """
+        Frees the shared memory block, call it when all the workers are done.
+        """
+        self.shared_memory.close()
+        self.shared_memory.unlink()
+
+
+def process_shared_curves(
+        description,
+        curve_indices: List[int],
+        operation: str,
+        options: dict,
+        ) -> List[Tuple[int, Optional[Dict[str, numpy.ndarray]]]]:
+    """
+    Worker entry: runs an operation on some curves of a SharedPackedCurves.
+
+    Args:
+        description (tuple): SharedPackedCurves.description.
+        curve_indices (list): The curves to process.
+        operation (str): The curve operation, see process_packed_keys().
+        options (dict): The operation options.
+
+    Returns:
+        list: (curve index, new packed keys or None) for each processed curve.
+    """
+    name, layout = description
+    # Pool workers share the resource tracker of the main process, which owns the block.
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        results = process_block_curves(block, layout, curve_indices, operation, options)
+    except BaseException as error:
+        # The frames of the traceback keep the array views alive, close() would raise BufferError
+        # and hide the error of the task.
+        traceback.clear_frames(error.__traceback__)
+        try:
+            block.close()
+        except BufferError:
+            pass
+        raise
+    block.close()
+    return results
+
+
+def process_block_curves(block, layout, curve_indices, operation, options):
+    """
+    Runs the operation on views of the shared block, the views are released when it returns.
+    """
+    arrays = {}
+    for array_name, offset, shape, dtype in layout:
+        arrays[array_name] = numpy.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset)
+    keys = {attr[len("keys."):]: values for attr, values in arrays.items() if attr.startswith("keys.")}
+    curves = fcurve_evaluate.PackedCurves.from_arrays(keys, arrays["key_offsets"], arrays["extrapolations"])
+
+    results = []
+    for index in curve_indices:
+        # Copy the keys, the shared block is closed when the task ends.
+        packed_keys = {attr: values.copy() for attr, values in curves.get_curve_keys(index).items()}
+        new_keys = process_packed_keys(packed_keys, int(curves.extrapolations[index]), operation, options)
+        results.append((int(index), new_keys))
+    return results
+
+
+def get_worker_bootstrap_source(package_name: str, package_path: str) -> str:
+    """
+    Python source that registers a package pointing to the bbpl folder
+    without running the bbpl __init__. Used as process pool initializer with exec.
+    """
+    return (
+        "import sys, types\n"
+        f"if {package_name!r} not in sys.modules:\n"
+        f"    package = types.ModuleType({package_name!r})\n"
+        f"    package.__path__ = [{package_path!r}]\n"
+        f"    sys.modules[{package_name!r}] = package\n"
+    )
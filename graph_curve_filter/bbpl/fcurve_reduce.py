@@ -0,0 +1,235 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# ----------------------------------------------
+#  BBPL -> BleuRaven Blender Python Library
+#  BleuRaven.fr
+#  XavierLoux.com
+# ----------------------------------------------
+
+# Keyframe reduction on packed keys (see fcurve_keys.py).
+# This module must not import bpy: packed keys can be processed outside of Blender.
+
+import numpy
+from typing import Dict
+from . import fcurve_keys
+
+
+def get_rdp_keep_mask(frames: numpy.ndarray, values: numpy.ndarray, tolerance: float) -> numpy.ndarray:
+    """
+    Ramer-Douglas-Peucker reduction of a keyframe list.
+    The error is the value distance between a key and the line joining the kept keys.
+
+    Args:
+        frames (numpy.ndarray): Sorted keyframe frames.
+        values (numpy.ndarray): Keyframe values.
+        tolerance (float): Maximum value error allowed for a removed key.
+
+    Returns:
+        numpy.ndarray: Boolean mask of the keys to keep.
+    """
+    count = len(frames)
+    keep = numpy.zeros(count, dtype=bool)
+    if count == 0:
+        return keep
+    keep[0] = True
+    keep[-1] = True
+
+    frames = frames.astype(numpy.float64)
+    values = values.astype(numpy.float64)
+
+    # Iterative to avoid recursion limits on curves with one key per frame.
+    segments = [(0, count - 1)]
+    while segments:
+        start, end = segments.pop()
+        if end - start < 2:
+            continue
+
+        span = frames[end] - frames[start]
+        if span != 0.0:
+            factor = (frames[start + 1:end] - frames[start]) / span
+        else:
+            factor = numpy.zeros(end - start - 1)
+        line = values[start] + factor * (values[end] - values[start])
+        errors = numpy.abs(values[start + 1:end] - line)
+
+        index = int(numpy.argmax(errors))
+        if errors[index] > tolerance:
+            split = start + 1 + index
+            keep[split] = True
+            segments.append((start, split))
+            segments.append((split, end))
+    return keep
+
+
+def get_lossless_keep_mask(
+        packed_keys: Dict[str, numpy.ndarray],
+        rtol: float = 1e-5,
+        atol: float = 1e-6,
+        ) -> numpy.ndarray:
+    """
+    Finds the keys that can be removed without changing the curve shape:
+    keys inside a straight linear segment and keys inside a flat segment.
+
+    Args:
+        packed_keys (dict): The packed keys of the curve.
+        rtol (float): Relative tolerance used to compare values.
+        atol (float): Absolute tolerance used to compare values.
+
+    Returns:
+        numpy.ndarray: Boolean mask of the keys to keep.
+    """
+    count = fcurve_keys.get_packed_keys_count(packed_keys)
+    keep = numpy.ones(count, dtype=bool)
+    if count < 3:
+        return keep
+
+    co = packed_keys["co"].astype(numpy.float64)
+    frames = co[:, 0]
+    values = co[:, 1]
+    handle_left_values = packed_keys["handle_left"][:, 1].astype(numpy.float64)
+    handle_right_values = packed_keys["handle_right"][:, 1].astype(numpy.float64)
+    interpolation = packed_keys["interpolation"]
+
+    # Indices: a = previous key, b = tested key, c = next key.
+    prev_frames, key_frames, next_frames = frames[:-2], frames[1:-1], frames[2:]
+    prev_values, key_values, next_values = values[:-2], values[1:-1], values[2:]
+    prev_interp, key_interp = interpolation[:-2], interpolation[1:-1]
+
+    # Straight line: both segments linear and the key lies on the line a -> c.
+    span = next_frames - prev_frames
+    factor = numpy.divide(key_frames - prev_frames, span, out=numpy.zeros_like(span), where=span != 0.0)
+    line = prev_values + factor * (next_values - prev_values)
+    straight = (
+        (prev_interp == fcurve_keys.INTERPOLATION_LINEAR)
+        & (key_interp == fcurve_keys.INTERPOLATION_LINEAR)
+        & numpy.isclose(key_values, line, rtol=rtol, atol=atol)
+    )
+
+    # Flat: same value on a, b and c. Bezier segments also need flat handles.
+    def is_flat_segment(interp, start_values, start_handles, end_values, end_handles):
+        flat_bezier = (
+            numpy.isclose(start_handles, start_values, rtol=rtol, atol=atol)
+            & numpy.isclose(end_handles, end_values, rtol=rtol, atol=atol)
+        )
+        return (interp != fcurve_keys.INTERPOLATION_BEZIER) | flat_bezier
+
+    flat = (
+        numpy.isclose(prev_values, key_values, rtol=rtol, atol=atol)
+        & numpy.isclose(next_values, key_values, rtol=rtol, atol=atol)
+        & is_flat_segment(prev_interp, prev_values, handle_right_values[:-2], key_values, handle_left_values[1:-1])
+        & is_flat_segment(key_interp, key_values, handle_right_values[1:-1], next_values, handle_left_values[2:])
+    )
+
+    keep[1:-1] = ~(straight | flat)
+    return keep
+
+
+def get_decimate_keep_mask(packed_keys: Dict[str, numpy.ndarray], tolerance: float) -> numpy.ndarray:
+    """
+    Error bounded reduction of the packed keys, the error is measured at the removed keys.
+    The bound holds when the merged segments are made linear, see reduce_packed_keys().
+    Keys of constant (stepped) segments are always kept.
+
+    Args:
+        packed_keys (dict): The packed keys of the curve.
+        tolerance (float): Maximum value error allowed for a removed key.
+
+    Returns:
+        numpy.ndarray: Boolean mask of the keys to keep.
+    """
+    co = packed_keys["co"]
+    keep = get_rdp_keep_mask(co[:, 0], co[:, 1], tolerance)
+
+    stepped = packed_keys["interpolation"] == fcurve_keys.INTERPOLATION_CONSTANT
+    keep |= stepped
+    keep[1:] |= stepped[:-1]
+    return keep
+
+
+def reduce_packed_keys(
+        packed_keys: Dict[str, numpy.ndarray],
+        keep_mask: numpy.ndarray,
+        use_linear_segments: bool = True,
+        ) -> Dict[str, numpy.ndarray]:
+    """
+    Removes the keys that are not in the keep mask.
+
+    Args:
+        packed_keys (dict): The packed keys of the curve.
+        keep_mask (numpy.ndarray): Boolean mask of the keys to keep.
+        use_linear_segments (bool): If True, the segments that replace removed keys are linear,
+            so they follow the lines used by get_decimate_keep_mask(). The keys at their ends get
+            free handles: Blender does not recalculate them and the other segments keep their shape.
+
+    Returns:
+        dict: The reduced packed keys.
+    """
+    reduced_keys = fcurve_keys.select_packed_keys(packed_keys, keep_mask)
+
+    if use_linear_segments:
+        kept_indices = numpy.flatnonzero(keep_mask)
+        merged = numpy.diff(kept_indices) > 1
+        reduced_keys["interpolation"][:-1][merged] = fcurve_keys.INTERPOLATION_LINEAR
+        merged_ends = numpy.zeros(len(kept_indices), dtype=bool)
+        merged_ends[:-1] |= merged
+        merged_ends[1:] |= merged
+        reduced_keys["handle_left_type"][merged_ends] = fcurve_keys.HANDLE_FREE
+        reduced_keys["handle_right_type"][merged_ends] = fcurve_keys.HANDLE_FREE
+    return reduced_keys
+
+
+def is_static_packed_keys(
+        packed_keys: Dict[str, numpy.ndarray],
+        tolerance: float = 1e-6,
+        extrapolation: int = fcurve_keys.EXTRAPOLATION_CONSTANT,
+        ) -> bool:
+    """
+    Checks if a curve keeps the same value on all frames.
+
+    Args:
+        packed_keys (dict): The packed keys of the curve.
+        tolerance (float): Maximum value difference with the first key.
+        extrapolation (int): The extrapolation of the curve.
+
+    Returns:
+        bool: True if the curve is static.
+    """
+    count = fcurve_keys.get_packed_keys_count(packed_keys)
+    if count == 0:
+        return True
+
+    values = packed_keys["co"][:, 1].astype(numpy.float64)
+    reference = values[0]
+    if numpy.any(numpy.abs(values - reference) > tolerance):
+        return False
+
+    # Bezier segments can move away from the keys with their handles.
+    bezier = packed_keys["interpolation"][:-1] == fcurve_keys.INTERPOLATION_BEZIER
+    handles = [
+        packed_keys["handle_right"][:-1, 1][bezier],
+        packed_keys["handle_left"][1:, 1][bezier],
+    ]
+    if extrapolation == fcurve_keys.EXTRAPOLATION_LINEAR:
+        # The end handles give the extrapolation slope.
+        handles.append(packed_keys["handle_left"][:1, 1])
+        handles.append(packed_keys["handle_right"][-1:, 1])
+    for handle_values in handles:
+        if numpy.any(numpy.abs(handle_values.astype(numpy.float64) - reference) > tolerance):
+            return False
+    return True
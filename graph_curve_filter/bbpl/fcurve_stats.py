@@ -0,0 +1,159 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# ----------------------------------------------
+#  BBPL -> BleuRaven Blender Python Library
+#  BleuRaven.fr
+#  XavierLoux.com
+# ----------------------------------------------
+
+# Per curve statistics of packed curves: value range and mean, peak velocity and peak acceleration.
+# Each curve is sampled on its own key range, the samples of all the curves are evaluated
+# together and the results are reduced by curve with numpy reduceat.
+# This module must not import bpy.
+
+import numpy
+from typing import NamedTuple
+from . import fcurve_evaluate
+
+# Maximum number of samples evaluated at once, bounds the memory of the temporary arrays.
+MAX_CHUNK_SAMPLES = 1 << 20
+
+
+class CurveStats(NamedTuple):
+    """
+    One value per curve. Velocity and acceleration are in value units per frame (and per frame squared).
+    value_mean is the mean of the samples, the keys between two samples are not included.
+    """
+    key_counts: numpy.ndarray
+    value_min: numpy.ndarray
+    value_max: numpy.ndarray
+    value_mean: numpy.ndarray
+    peak_velocity: numpy.ndarray
+    peak_acceleration: numpy.ndarray
+
+    @property
+    def value_range(self) -> numpy.ndarray:
+        return self.value_max - self.value_min
+
+
+STAT_NAMES = (
+    "key_counts", "value_min", "value_max", "value_mean", "value_range", "peak_velocity", "peak_acceleration",
+)
+
+
+def get_curve_sample_counts(curves: fcurve_evaluate.PackedCurves, frame_step: float):
+    """
+    Returns:
+        tuple: The first sample frame, the last sample frame and the sample count of each curve,
+               0 samples for curves without keys. The last key is always the last sample,
+               so the last interval is shorter than frame_step when the key range is not a multiple of it.
+    """
+    key_counts = curves.get_key_counts()
+    has_keys = key_counts > 0
+    key_frames = curves.keys["co"][:, 0].astype(numpy.float64)
+
+    frame_starts = numpy.zeros(len(curves), dtype=numpy.float64)
+    frame_ends = numpy.zeros(len(curves), dtype=numpy.float64)
+    sample_counts = numpy.zeros(len(curves), dtype=numpy.int64)
+    if has_keys.any():
+        frame_starts[has_keys] = key_frames[curves.key_offsets[:-1][has_keys]]
+        frame_ends[has_keys] = key_frames[curves.key_offsets[1:][has_keys] - 1]
+        steps = (frame_ends[has_keys] - frame_starts[has_keys]) / frame_step
+        spans = numpy.floor(steps + 1e-6)
+        sample_counts[has_keys] = spans.astype(numpy.int64) + 1 + (steps - spans > 1e-6)
+    return frame_starts, frame_ends, sample_counts
+
+
+def get_rows_stats(curves, rows, frame_starts, frame_ends, sample_counts, frame_step):
+    """
+    Samples the curves of the given rows (with at least one key) and reduces the samples by curve.
+    """
+    counts = sample_counts[rows]
+    curve_indices = numpy.repeat(rows, counts)
+    sample_offsets = numpy.zeros(len(rows), dtype=numpy.int64)
+    numpy.cumsum(counts[:-1], out=sample_offsets[1:])
+    local_indices = numpy.arange(len(curve_indices)) - numpy.repeat(sample_offsets, counts)
+    sample_frames = numpy.repeat(frame_starts[rows], counts) + local_indices * frame_step
+    numpy.minimum(sample_frames, numpy.repeat(frame_ends[rows], counts), out=sample_frames)
+    values = fcurve_evaluate.evaluate_samples(curves, curve_indices, sample_frames)
+
+    # Differences that cross two curves are set to 0, they are padded to one value per sample for reduceat.
+    sample_count = len(values)
+    velocities = numpy.zeros(sample_count, dtype=numpy.float64)
+    accelerations = numpy.zeros(sample_count, dtype=numpy.float64)
+    if sample_count > 1:
+        same_curve = curve_indices[1:] == curve_indices[:-1]
+        # The frame distances are frame_step except before the last key, 1 between two curves.
+        frame_deltas = numpy.where(same_curve, numpy.diff(sample_frames), 1.0)
+        steps = numpy.diff(values) / frame_deltas
+        velocities[:-1] = numpy.where(same_curve, numpy.abs(steps), 0.0)
+        if sample_count > 2:
+            same_curve = curve_indices[2:] == curve_indices[:-2]
+            step_deltas = (frame_deltas[1:] + frame_deltas[:-1]) * 0.5
+            accelerations[:-2] = numpy.where(same_curve, numpy.abs(numpy.diff(steps)) / step_deltas, 0.0)
+
+    return (
+        numpy.minimum.reduceat(values, sample_offsets),
+        numpy.maximum.reduceat(values, sample_offsets),
+        numpy.add.reduceat(values, sample_offsets) / counts,
+        numpy.maximum.reduceat(velocities, sample_offsets),
+        numpy.maximum.reduceat(accelerations, sample_offsets),
+    )
+
+
+def get_packed_curves_stats(curves: fcurve_evaluate.PackedCurves, frame_step: float = 1.0) -> CurveStats:
+    """
+    Computes the statistics of all the curves, sampled every frame_step from their first key and at their last key.
+
+    Args:
+        curves (fcurve_evaluate.PackedCurves): The curves.
+        frame_step (float): Distance between two samples, the derivatives are finite differences at this step.
+
+    Returns:
+        CurveStats: The statistics, 0 for the curves without keys.
+    """
+    curve_count = len(curves)
+    value_min = numpy.zeros(curve_count, dtype=numpy.float64)
+    value_max = numpy.zeros(curve_count, dtype=numpy.float64)
+    value_mean = numpy.zeros(curve_count, dtype=numpy.float64)
+    peak_velocity = numpy.zeros(curve_count, dtype=numpy.float64)
+    peak_acceleration = numpy.zeros(curve_count, dtype=numpy.float64)
+
+    frame_starts, frame_ends, sample_counts = get_curve_sample_counts(curves, frame_step)
+    curve_rows = numpy.flatnonzero(sample_counts)
+    if len(curve_rows) > 0:
+        # Chunks of about MAX_CHUNK_SAMPLES samples, a longer curve is a chunk on its own.
+        cumulative_counts = numpy.cumsum(sample_counts[curve_rows])
+        chunk_limits = numpy.arange(MAX_CHUNK_SAMPLES, cumulative_counts[-1], MAX_CHUNK_SAMPLES)
+        chunk_ends = numpy.searchsorted(cumulative_counts, chunk_limits)
+        chunk_bounds = numpy.unique(numpy.concatenate(([0], chunk_ends + 1, [len(curve_rows)])))
+        for start, end in zip(chunk_bounds[:-1], chunk_bounds[1:]):
+            rows = curve_rows[start:end]
+            chunk_stats = get_rows_stats(curves, rows, frame_starts, frame_ends, sample_counts, frame_step)
+            (
+                value_min[rows], value_max[rows], value_mean[rows], peak_velocity[rows], peak_acceleration[rows]
+            ) = chunk_stats
+
+        # Keys between two samples, at fractional frames, are part of the value range.
+        key_values = curves.keys["co"][:, 1].astype(numpy.float64)
+        key_starts = curves.key_offsets[:-1][curve_rows]
+        value_min[curve_rows] = numpy.minimum(value_min[curve_rows], numpy.minimum.reduceat(key_values, key_starts))
+        value_max[curve_rows] = numpy.maximum(value_max[curve_rows], numpy.maximum.reduceat(key_values, key_starts))
+
+    return CurveStats(curves.get_key_counts(), value_min, value_max, value_mean, peak_velocity, peak_acceleration)
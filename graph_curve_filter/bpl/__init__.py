@@ -28,6 +28,7 @@ import importlib
 from . import advprint
 from . import console_utils
 from . import utils
+from . import profiler
 from . import math
 from . import color_set
 from . import blender_sub_process
@@ -39,6 +40,8 @@ if "console_utils" in locals():
     importlib.reload(console_utils)
 if "utils" in locals():
     importlib.reload(utils)
+if "profiler" in locals():
+    importlib.reload(profiler)
 if "math" in locals():
     importlib.reload(math)
 if "color_set" in locals():
@@ -0,0 +1,293 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# ----------------------------------------------
+#  BPL -> BleuRaven Python Library
+#  https://github.com/xavier150/BPL
+#  BleuRaven.fr
+#  XavierLoux.com
+# ----------------------------------------------
+
+import os
+import json
+import math
+import time
+import threading
+import functools
+from . import utils
+
+
+def get_percentile(durations, percent):
+    """
+    Parameters:
+        durations (list): Measured durations.
+        percent (float): Percentile between 0 and 100.
+
+    Returns:
+        float: The duration at this percentile (nearest rank), 0.0 without durations.
+    """
+    if not durations:
+        return 0.0
+    durations = sorted(durations)
+    rank = math.ceil(percent / 100.0 * len(durations))
+    return durations[min(len(durations), max(1, rank)) - 1]
+
+
+class ProfileNode():
+    """
+    Statistics of one profiled stage, at one place of the stage tree.
+    """
+
+    def __init__(self, name, parent=None):
+        self.name = name
+        self.parent = parent
+        self.children = {}
+        self.count = 0
+        self.total_time = 0.0
+        self.durations = []
+
+    def get_child(self, name):
+        child = self.children.get(name)
+        if child is None:
+            child = ProfileNode(name, self)
+            self.children[name] = child
+        return child
+
+    def get_self_time(self):
+        """
+        Returns:
+            float: Time spent in this stage, without the time of the child stages.
+        """
+        return self.total_time - sum(child.total_time for child in self.children.values())
+
+    def get_percentile(self, percent):
+        """
+        Parameters:
+            percent (float): Percentile between 0 and 100.
+
+        Returns:
+            float: The duration of one call at this percentile (nearest rank).
+        """
+        return get_percentile(self.durations, percent)
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "count": self.count,
+            "total_time": self.total_time,
+            "self_time": self.get_self_time(),
+            "p50": self.get_percentile(50),
+            "p95": self.get_percentile(95),
+            "max": max(self.durations) if self.durations else 0.0,
+            "children": [child.to_dict() for child in self.children.values()],
+        }
+
+
+class ProfileScope():
+    """
+    Context manager returned by Profiler.scope, times one call of a stage.
+    """
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.node = None
+        self.timer = None
+
+    def __enter__(self):
+        stack = self.profiler.get_stack()
+        self.node = stack[-1].get_child(self.name)
+        stack.append(self.node)
+        self.timer = utils.CounterTimer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration = self.timer.get_time()
+        node = self.node
+        node.count += 1
+        node.total_time += duration
+        if len(node.durations) < self.profiler.max_samples:
+            node.durations.append(duration)
+        self.profiler.get_stack().pop()
+        if self.profiler.record_events:
+            self.profiler.add_event(self.name, self.timer.start, duration)
+        return False
+
+
+class DisabledScope():
+    """
+    Shared context manager used when the profiler is disabled, it does nothing.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+disabled_scope = DisabledScope()
+
+
+class Profiler():
+    """
+    Hierarchical profiler: nested stages are timed with "with profiler.scope(name)"
+    or the profiler.profiled() decorator and grouped in a tree by their call stack.
+    When disabled, a scope only costs one attribute test.
+    """
+
+    def __init__(self, name="Profiler", enabled=False, record_events=False, max_samples=100000):
+        self.name = name
+        self.enabled = enabled
+        self.record_events = record_events
+        self.max_samples = max_samples
+        self.local = threading.local()
+        self.reset()
+
+    def reset(self):
+        """
+        Clears the collected statistics and events.
+        """
+        self.root = ProfileNode(self.name)
+        self.events = []
+        self.start_time = time.perf_counter()
+        self.local = threading.local()
+
+    def get_stack(self):
+        stack = getattr(self.local, "stack", None)
+        if stack is None:
+            stack = [self.root]
+            self.local.stack = stack
+        return stack
+
+    def add_event(self, name, start, duration):
+        self.events.append((name, start, duration, threading.get_ident()))
+
+    def scope(self, name):
+        """
+        Returns a context manager that times the stage "name" under the current stage.
+        """
+        if not self.enabled:
+            return disabled_scope
+        return ProfileScope(self, name)
+
+    def profiled(self, name=None):
+        """
+        Decorator that times each call of a function as a stage, named after the function by default.
+        """
+        def decorator(function):
+            stage_name = name or function.__qualname__
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with ProfileScope(self, stage_name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def get_report_lines(self, min_time=0.0):
+        """
+        Formats the stage tree as text lines, one stage per line.
+
+        Parameters:
+            min_time (float): Stages with a smaller total time are not listed.
+
+        Returns:
+            list: The report lines.
+        """
+        lines = [f"{'Stage':<48} {'Count':>8} {'Total':>10} {'Self':>10} {'p50':>10} {'p95':>10}"]
+
+        def add_node_lines(node, depth):
+            for child in sorted(node.children.values(), key=lambda child: child.total_time, reverse=True):
+                if child.total_time < min_time:
+                    continue
+                label = ("  " * depth + child.name)[:48]
+                lines.append(
+                    f"{label:<48} {child.count:>8} "
+                    f"{child.total_time * 1000:>8.2f}ms {child.get_self_time() * 1000:>8.2f}ms "
+                    f"{child.get_percentile(50) * 1000:>8.3f}ms {child.get_percentile(95) * 1000:>8.3f}ms"
+                )
+                add_node_lines(child, depth + 1)
+
+        add_node_lines(self.root, 0)
+        return lines
+
+    def print_tree(self, min_time=0.0):
+        print("\n".join(self.get_report_lines(min_time)))
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "duration": time.perf_counter() - self.start_time,
+            "stages": [child.to_dict() for child in self.root.children.values()],
+        }
+
+    def export_json(self, path):
+        """
+        Saves the stage tree with its statistics as JSON.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=4)
+
+    def export_chrome_trace(self, path):
+        """
+        Saves the recorded events in the Chrome trace format (chrome://tracing, Perfetto).
+        Events are only recorded when record_events is True.
+        """
+        pid = os.getpid()
+        trace_events = []
+        for name, start, duration, thread_id in self.events:
+            trace_events.append({
+                "name": name,
+                "ph": "X",
+                "ts": (start - self.start_time) * 1000000.0,
+                "dur": duration * 1000000.0,
+                "pid": pid,
+                "tid": thread_id,
+            })
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, file)
+
+
+# Default profiler used by the module functions below.
+default_profiler = Profiler()
+
+
+def profile(name):
+    """
+    Times the stage "name" with the default profiler:
+        with profile("filter curves"):
+            ...
+    """
+    if not default_profiler.enabled:
+        return disabled_scope
+    return ProfileScope(default_profiler, name)
+
+
+def profiled(name=None):
+    """
+    Decorator version of profile() using the default profiler.
+    """
+    return default_profiler.profiled(name)
+
+
+def set_profiling_enabled(enabled, record_events=False):
+    default_profiler.enabled = enabled
+    default_profiler.record_events = record_events
@@ -0,0 +1,161 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# Command line launcher for the batch cleanup, runs with any Python 3 (no Blender needed):
+# python batch_cleanup.py P:/Project/Animations --blender "C:/Program Files/Blender/blender.exe" --save
+# Each .blend file is cleaned by a background Blender running batch_cleanup_worker.py,
+# the files are distributed on a pool of Blender instances.
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+import importlib.util
+import concurrent.futures
+
+worker_script_path = os.path.abspath(os.path.join(__file__, '..', 'batch_cleanup_worker.py'))
+
+# Load bbam blender_exec only, the bbam package needs bpy.
+blender_exec_path = os.path.abspath(os.path.join(__file__, '..', '..', 'bbam', 'blender_exec.py'))
+spec = importlib.util.spec_from_file_location("bbam_blender_exec", blender_exec_path)
+blender_exec = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(blender_exec)
+
+
+def find_blend_files(paths, recursive=True):
+    blend_files = []
+    for path in paths:
+        if os.path.isfile(path):
+            if path.lower().endswith(".blend"):
+                blend_files.append(os.path.abspath(path))
+            continue
+        for root, dirs, files in os.walk(path):
+            for file in sorted(files):
+                if file.lower().endswith(".blend"):
+                    blend_files.append(os.path.abspath(os.path.join(root, file)))
+            if not recursive:
+                break
+    return blend_files
+
+
+def cleanup_file(blend_file, result_path, worker_args, blender_executable_path, timeout):
+    """
+    Cleans one .blend file in a background Blender and returns its JSON result.
+    """
+    start_time = time.perf_counter()
+    script_args = ['--output', result_path] + worker_args
+    try:
+        process = blender_exec.run_python_script(
+            blend_file, worker_script_path, script_args, blender_executable_path, timeout
+        )
+        returncode = process.returncode
+        stderr = process.stderr
+    except subprocess.TimeoutExpired:
+        returncode = None
+        stderr = f"Timeout after {timeout}s."
+
+    result = None
+    if os.path.isfile(result_path):
+        try:
+            with open(result_path, "r", encoding="utf-8") as file:
+                result = json.load(file)
+        except (OSError, ValueError) as error:
+            # Worker killed while writing, or a file that can not be read: the file failed.
+            stderr = f"Can not read the worker result: {error}\n{stderr or ''}"
+    if not isinstance(result, dict):
+        result = {"file": blend_file, "success": False, "error": stderr}
+
+    result["file"] = blend_file
+    result["returncode"] = returncode
+    result["total_duration"] = time.perf_counter() - start_time
+    return result
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Clean the actions of .blend files with Graph Curve Filter.")
+    parser.add_argument("paths", nargs="+", help=".blend files or folders to clean.")
+    parser.add_argument("--blender", default="blender", help="Path to the Blender executable.")
+    parser.add_argument("--workers", type=int, default=0, help="Number of Blender instances, 0 for the CPU count.")
+    parser.add_argument("--output", default="batch_cleanup_results.json", help="Path of the JSON report.")
+    parser.add_argument(
+        "--operations", default="static,euler,decimate", help="Comma separated: static, euler, decimate."
+    )
+    parser.add_argument("--static-tolerance", type=float, default=0.0001)
+    parser.add_argument("--decimate-tolerance", type=float, default=0.001)
+    parser.add_argument("--timeout", type=float, default=None, help="Seconds allowed per file.")
+    parser.add_argument("--no-recursive", action="store_true", help="Do not search the sub folders.")
+    parser.add_argument("--save", action="store_true", help="Save the cleaned files, otherwise only report.")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    blend_files = find_blend_files(args.paths, recursive=not args.no_recursive)
+    if not blend_files:
+        print("No .blend file found.")
+        return 1
+
+    worker_count = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    worker_count = min(worker_count, len(blend_files))
+    worker_args = [
+        '--operations', args.operations,
+        '--static-tolerance', str(args.static_tolerance),
+        '--decimate-tolerance', str(args.decimate_tolerance),
+    ]
+    if args.save:
+        worker_args.append('--save')
+
+    print(f"Batch cleanup: {len(blend_files)} files on {worker_count} Blender instances.")
+    start_time = time.perf_counter()
+    results = []
+
+    # Threads are enough: the work is done in the Blender processes.
+    with tempfile.TemporaryDirectory(prefix="gcf_batch_") as temp_dir:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=worker_count) as pool:
+            futures = {}
+            for index, blend_file in enumerate(blend_files):
+                result_path = os.path.join(temp_dir, f"result_{index}.json")
+                future = pool.submit(cleanup_file, blend_file, result_path, worker_args, args.blender, args.timeout)
+                futures[future] = blend_file
+
+            for future in concurrent.futures.as_completed(futures):
+                result = future.result()
+                results.append(result)
+                state = "OK" if result.get("success") else "FAILED"
+                print(f"[{len(results)}/{len(blend_files)}] {state} {result['file']} ({result['total_duration']:.1f}s)")
+
+    results.sort(key=lambda result: result["file"])
+    failed = [result for result in results if not result.get("success")]
+    report = {
+        "duration": time.perf_counter() - start_time,
+        "file_count": len(results),
+        "failed_count": len(failed),
+        "files": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=4)
+
+    print(f"Batch cleanup done in {report['duration']:.1f}s, {len(failed)} failed. Report: {args.output}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# Runs inside Blender, started by batch_cleanup.py:
+# blender -b file.blend --python batch_cleanup_worker.py -- --output result.json [options]
+# Cleans the actions of the opened file and writes the result as JSON.
+
+import os
+import sys
+import json
+import time
+import argparse
+import traceback
+import importlib.util
+import bpy
+
+# Load the addon package without registering it.
+addon_path = os.path.abspath(os.path.join(__file__, '..', '..'))
+module_name = "graph_curve_filter_batch"
+
+spec = importlib.util.spec_from_file_location(
+    module_name,
+    os.path.join(addon_path, '__init__.py'),
+    submodule_search_locations=[addon_path],
+    )
+addon = importlib.util.module_from_spec(spec)
+sys.modules[module_name] = addon
+spec.loader.exec_module(addon)
+
+bbpl = addon.bbpl
+gcf_curve_tools = addon.gcf_curve_tools
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Graph Curve Filter batch cleanup worker.")
+    parser.add_argument("--output", required=True, help="Path of the JSON result file.")
+    parser.add_argument("--operations", default="static,euler,decimate")
+    parser.add_argument("--static-tolerance", type=float, default=0.0001)
+    parser.add_argument("--decimate-tolerance", type=float, default=0.001)
+    parser.add_argument("--save", action="store_true", help="Save the file after the cleanup.")
+    return parser.parse_args(argv)
+
+
+def cleanup_action(action, operations, args, result):
+    fcurves = list(action.fcurves)
+    result["curves_before"] += len(fcurves)
+    result["keys_before"] += sum(len(fcurve.keyframe_points) for fcurve in fcurves)
+
+    if "static" in operations:
+        for fcurve in fcurves[:]:
+            if gcf_curve_tools.is_static_fcurve(fcurve, args.static_tolerance):
+                action.fcurves.remove(fcurve)
+                fcurves.remove(fcurve)
+                result["static_removed"] += 1
+
+    curve_operations = []
+    if "euler" in operations:
+        curve_operations.append(bbpl.fcurve_process.OPERATION_EULER_FILTER)
+    if "decimate" in operations:
+        curve_operations.append(bbpl.fcurve_process.OPERATION_DECIMATE)
+    options = {"tolerance": args.decimate_tolerance}
+
+    for fcurve in fcurves:
+        if fcurve.lock:
+            continue
+        extrapolation = bbpl.fcurve_keys.EXTRAPOLATION_NAMES.get(fcurve.extrapolation, 0)
+        packed_keys = bbpl.anim_utils.get_fcurve_packed_keys(fcurve)
+        changed = False
+        for operation in curve_operations:
+            is_euler = fcurve.data_path.endswith("rotation_euler")
+            if operation == bbpl.fcurve_process.OPERATION_EULER_FILTER and not is_euler:
+                continue
+            new_keys = bbpl.fcurve_process.process_packed_keys(packed_keys, extrapolation, operation, options)
+            if new_keys is not None:
+                packed_keys = new_keys
+                changed = True
+                result["operations"][operation] += 1
+        if changed:
+            bbpl.anim_utils.set_fcurve_packed_keys(fcurve, packed_keys)
+
+    result["curves_after"] += len(fcurves)
+    result["keys_after"] += sum(len(fcurve.keyframe_points) for fcurve in fcurves)
+
+
+def main():
+    args = parse_args()
+    operations = [operation.strip() for operation in args.operations.split(",") if operation.strip()]
+    start_time = time.perf_counter()
+    result = {
+        "file": bpy.data.filepath,
+        "success": False,
+        "actions": 0,
+        "curves_before": 0,
+        "curves_after": 0,
+        "keys_before": 0,
+        "keys_after": 0,
+        "static_removed": 0,
+        "operations": {
+            bbpl.fcurve_process.OPERATION_EULER_FILTER: 0,
+            bbpl.fcurve_process.OPERATION_DECIMATE: 0,
+        },
+        "saved": False,
+        "error": None,
+    }
+
+    try:
+        for action in bpy.data.actions:
+            if action.library is not None:
+                continue
+            cleanup_action(action, operations, args, result)
+            result["actions"] += 1
+
+        if args.save:
+            bpy.ops.wm.save_mainfile()
+            result["saved"] = True
+        result["success"] = True
+    except Exception:
+        result["error"] = traceback.format_exc()
+
+    result["duration"] = time.perf_counter() - start_time
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(result, file, indent=4)
+
+
+main()
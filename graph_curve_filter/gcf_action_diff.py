@@ -0,0 +1,294 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# Difference between two actions, for example two versions of a mocap cleanup.
+# The F-Curves are aligned by (data_path, array_index) and both actions are sampled
+# on the same frames with the numpy evaluator, the deltas are computed on the sample arrays.
+
+import bpy
+import numpy
+from . import bbpl
+from . import gcf_operator_timing
+
+
+if "bpy" in locals():
+    import importlib
+    if "bbpl" in locals():
+        importlib.reload(bbpl)
+    if "gcf_operator_timing" in locals():
+        importlib.reload(gcf_operator_timing)
+
+
+from bpy.props import (
+        StringProperty,
+        FloatProperty,
+        BoolProperty,
+        )
+
+from bpy.types import (
+        Operator,
+        )
+
+
+# Channels listed in the panel after a diff
+MAX_PANEL_CHANNELS = 10
+
+last_diff = None
+
+
+class ActionDiff():
+    """
+    channels: (data_path, array_index) of the channels in both actions.
+    max_deltas, mean_deltas: absolute value difference of each channel over the sample frames.
+    only_in_action / only_in_other: channels of a single action.
+    sorted_rows: (channel, max delta, mean delta) sorted by max delta, largest first, sorted once for the panel.
+    """
+
+    def __init__(self, action_name, other_name, channels, max_deltas, mean_deltas, only_in_action, only_in_other):
+        self.action_name = action_name
+        self.other_name = other_name
+        self.channels = channels
+        self.max_deltas = max_deltas
+        self.mean_deltas = mean_deltas
+        self.only_in_action = only_in_action
+        self.only_in_other = only_in_other
+        order = numpy.argsort(-self.max_deltas, kind="stable")
+        self.sorted_rows = [
+            (self.channels[index], float(self.max_deltas[index]), float(self.mean_deltas[index]))
+            for index in order
+        ]
+
+    def get_changed_channels(self, threshold: float) -> set:
+        """
+        Returns:
+            set: The channels with a max delta above the threshold and the channels of a single action.
+        """
+        changed = {channel for channel, delta in zip(self.channels, self.max_deltas) if delta > threshold}
+        changed.update(self.only_in_action)
+        changed.update(self.only_in_other)
+        return changed
+
+    def get_sorted_rows(self):
+        """
+        Returns:
+            list: (channel, max delta, mean delta) sorted by max delta, largest first.
+        """
+        return self.sorted_rows
+
+
+def get_channel_fcurves(action) -> dict:
+    """
+    Returns:
+        dict: (data_path, array_index) -> FCurve, from the channel table columns.
+    """
+    table = bbpl.channel_table.get_channel_table(action)
+    return dict(zip(zip(table.data_paths, table.array_indices), action.fcurves))
+
+
+def get_diff_frames(fcurves, frame_step: float) -> numpy.ndarray:
+    """
+    Returns:
+        numpy.ndarray: The compared frames, from the first to the last key of the F-Curves.
+            The last key is sampled also when it is not on the grid, the manual frame range of the actions is ignored.
+    """
+    ranges = numpy.array(
+        [fcurve.range() for fcurve in fcurves if len(fcurve.keyframe_points) > 0], dtype=numpy.float64
+    ).reshape(-1, 2)
+    if len(ranges) == 0:
+        return numpy.zeros(1)
+    return bbpl.fcurve_evaluate.get_sample_frames(ranges[:, 0].min(), ranges[:, 1].max(), frame_step)
+
+
+def diff_actions(action, other_action, frame_step=1.0) -> ActionDiff:
+    """
+    Compares two actions on the union of their key ranges.
+    The channels are sampled in chunks of about bbpl.fcurve_stats.MAX_CHUNK_SAMPLES samples,
+    only the deltas of one chunk are in memory at once.
+
+    Args:
+        action (bpy.types.Action): The reference action.
+        other_action (bpy.types.Action): The compared action.
+        frame_step (float): Distance between two compared frames.
+
+    Returns:
+        ActionDiff: The per channel deltas.
+    """
+    fcurves = get_channel_fcurves(action)
+    other_fcurves = get_channel_fcurves(other_action)
+    channels = [channel for channel in fcurves if channel in other_fcurves]
+    only_in_action = [channel for channel in fcurves if channel not in other_fcurves]
+    only_in_other = [channel for channel in other_fcurves if channel not in fcurves]
+
+    if channels:
+        action_fcurves = [fcurves[channel] for channel in channels]
+        other_action_fcurves = [other_fcurves[channel] for channel in channels]
+        frames = get_diff_frames(action_fcurves + other_action_fcurves, frame_step)
+        max_deltas = numpy.zeros(len(channels))
+        mean_deltas = numpy.zeros(len(channels))
+        chunk_size = max(1, bbpl.fcurve_stats.MAX_CHUNK_SAMPLES // len(frames))
+        for start in range(0, len(channels), chunk_size):
+            end = start + chunk_size
+            values = bbpl.anim_utils.evaluate_fcurves_frames(action_fcurves[start:end], frames)
+            other_values = bbpl.anim_utils.evaluate_fcurves_frames(other_action_fcurves[start:end], frames)
+            deltas = numpy.abs(values - other_values)
+            max_deltas[start:end] = deltas.max(axis=1)
+            mean_deltas[start:end] = deltas.mean(axis=1)
+    else:
+        max_deltas = numpy.zeros(0)
+        mean_deltas = numpy.zeros(0)
+
+    return ActionDiff(action.name, other_action.name, channels, max_deltas, mean_deltas, only_in_action, only_in_other)
+
+
+def show_only_channels(action, channels: set) -> int:
+    """
+    Hides the F-Curves of the action that are not in channels, in one foreach_set.
+
+    Returns:
+        int: The number of visible F-Curves.
+    """
+    table = bbpl.channel_table.get_channel_table(action)
+    hide_values = [channel not in channels for channel in zip(table.data_paths, table.array_indices)]
+    action.fcurves.foreach_set("hide", hide_values)
+    return hide_values.count(False)
+
+
+def get_active_action(context):
+    obj = context.active_object
+    if obj is None or obj.animation_data is None:
+        return None
+    return obj.animation_data.action
+
+
+@gcf_operator_timing.timed_operator
+class GCF_OT_DiffActions(Operator):
+    bl_label = "Diff Actions"
+    bl_idname = "object.gcf_diff_actions"
+    bl_description = "Compare the active action with another action, channel by channel"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    other_action: StringProperty(
+        name="Compare With",
+        description="Action compared with the active action",
+        )
+
+    threshold: FloatProperty(
+        name="Threshold",
+        description="Channels with a larger max difference are listed as changed",
+        default=0.001,
+        min=0.0,
+        precision=4,
+        )
+
+    frame_step: FloatProperty(
+        name="Frame Step",
+        description="Distance between two compared frames",
+        default=1.0,
+        min=0.01,
+        )
+
+    show_changed_only: BoolProperty(
+        name="Show Changed Only",
+        description="Hide the curves of the active action that did not change",
+        default=True,
+        )
+
+    @classmethod
+    def poll(cls, context):
+        return get_active_action(context) is not None
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop_search(self, "other_action", bpy.data, "actions")
+        layout.prop(self, "threshold")
+        layout.prop(self, "frame_step")
+        layout.prop(self, "show_changed_only")
+
+    def execute(self, context):
+        global last_diff
+
+        action = get_active_action(context)
+        other_action = bpy.data.actions.get(self.other_action)
+        if other_action is None or other_action == action:
+            self.report({'WARNING'}, "Choose another action to compare with.")
+            return {'CANCELLED'}
+
+        last_diff = diff_actions(action, other_action, self.frame_step)
+        changed_channels = last_diff.get_changed_channels(self.threshold)
+        if self.show_changed_only:
+            show_only_channels(action, changed_channels)
+
+        self.report({'INFO'}, (
+            f"{len(changed_channels)} changed channels, "
+            f"{len(last_diff.only_in_action)} only in {action.name}, "
+            f"{len(last_diff.only_in_other)} only in {other_action.name}."
+        ))
+        return {'FINISHED'}
+
+
+class GCF_PT_ActionDiff(bpy.types.Panel):
+    # Result of the last action diff
+
+    bl_idname = "GCF_PT_ActionDiff"
+    bl_label = "Action Diff"
+    bl_space_type = "GRAPH_EDITOR"
+    bl_region_type = "UI"
+    bl_category = "Curbe Filter"
+    bl_parent_id = "GCF_PT_GraphCurveFilter"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        layout.operator("object.gcf_diff_actions", icon="ARROW_LEFTRIGHT")
+        if last_diff is None:
+            return
+
+        layout.label(text=f"{last_diff.action_name} / {last_diff.other_name}")
+        grid = layout.grid_flow(row_major=True, columns=3, even_columns=False, align=True)
+        for title in ("Channel", "Max", "Mean"):
+            grid.label(text=title)
+        for (data_path, array_index), max_delta, mean_delta in last_diff.get_sorted_rows()[:MAX_PANEL_CHANNELS]:
+            grid.label(text=f"{data_path}[{array_index}]")
+            grid.label(text=f"{max_delta:.4f}")
+            grid.label(text=f"{mean_delta:.4f}")
+
+
+classes = (
+    GCF_OT_DiffActions,
+    GCF_PT_ActionDiff,
+)
+
+
+def register():
+    from bpy.utils import register_class
+
+    for cls in classes:
+        register_class(cls)
+
+
+def unregister():
+    global last_diff
+    from bpy.utils import unregister_class
+
+    last_diff = None
+
+    for cls in reversed(classes):
+        unregister_class(cls)
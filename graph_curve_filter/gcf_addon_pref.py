@@ -25,6 +25,8 @@ from .gcf_basics import *
 from . import gcf_utils
 from .gcf_utils import *
 from . import gcf_ui_utils
+from . import gcf_operator_timing
+from . import gcf_filter_buttons
 from . import languages
 from .languages import *
 
@@ -43,6 +45,10 @@ if "bpy" in locals():
         importlib.reload(gcf_check_potential_error)
     if "gcf_ui_utils" in locals():
         importlib.reload(gcf_ui_utils)
+    if "gcf_operator_timing" in locals():
+        importlib.reload(gcf_operator_timing)
+    if "gcf_filter_buttons" in locals():
+        importlib.reload(gcf_filter_buttons)
     if "languages" in locals():
         importlib.reload(languages)
 
@@ -63,17 +69,147 @@ from bpy.types import (
         )
 
 
+class GCF_PG_UserFilterButton(bpy.types.PropertyGroup):
+    group: StringProperty(
+        name="Group",
+        description="Buttons with the same group are drawn on the same row",
+        default="User",
+        update=gcf_filter_buttons.clear_filter_layout,
+        )
+
+    token: StringProperty(
+        name="Filter",
+        description="Text set as channel name filter",
+        default="",
+        update=gcf_filter_buttons.clear_filter_layout,
+        )
+
+    label: StringProperty(
+        name="Label",
+        description="Text of the button, the filter is used when empty",
+        default="",
+        update=gcf_filter_buttons.clear_filter_layout,
+        )
+
+
+class GCF_OT_AddUserFilterButton(Operator):
+    bl_label = "Add Filter Button"
+    bl_idname = "object.gcf_add_user_filter_button"
+    bl_description = "Add a filter button in the graph editor panel"
+
+    def execute(self, context):
+        addon_prefs = context.preferences.addons[__package__].preferences
+        addon_prefs.user_filter_buttons.add()
+        gcf_filter_buttons.clear_filter_layout()
+        return {'FINISHED'}
+
+
+class GCF_OT_RemoveUserFilterButton(Operator):
+    bl_label = "Remove Filter Button"
+    bl_idname = "object.gcf_remove_user_filter_button"
+    bl_description = "Remove this filter button"
+    index: IntProperty(default=0)
+
+    def execute(self, context):
+        addon_prefs = context.preferences.addons[__package__].preferences
+        addon_prefs.user_filter_buttons.remove(self.index)
+        gcf_filter_buttons.clear_filter_layout()
+        return {'FINISHED'}
+
+
 class GCF_AP_AddonPreferences(bpy.types.AddonPreferences):
     # this must match the addon name, use '__package__'
     # when defining this in a submodule of a python package.
     bl_idname = __package__
 
+    use_operator_timing: BoolProperty(
+        name="Operator Timing",
+        description=(
+            "Measure the duration of the addon operators and of the main library functions, "
+            "saved in a local log with the channel and F-Curve counts and shown in the graph editor panel"
+            ),
+        default=False,
+        update=gcf_operator_timing.update_timing_settings,
+        )
+
+    use_operator_timing_key_counts: BoolProperty(
+        name="Log Key Counts",
+        description=(
+            "Write the key count of the active action in the timing log, "
+            "reads every F-Curve before each operator"
+            ),
+        default=False,
+        update=gcf_operator_timing.update_timing_settings,
+        )
+
+    operator_timing_log_size: IntProperty(
+        name="Log Size (KB)",
+        description="Size of the timing log before it is rotated",
+        default=1024,
+        min=16,
+        update=gcf_operator_timing.update_timing_settings,
+        )
+
+    operator_timing_log_backups: IntProperty(
+        name="Log Backups",
+        description="Number of rotated timing logs kept",
+        default=3,
+        min=0,
+        update=gcf_operator_timing.update_timing_settings,
+        )
+
+    use_profiler: BoolProperty(
+        name="Profiler",
+        description="Time the stages of the addon operators in a tree, exported from the Operator Timing panel",
+        default=False,
+        update=gcf_operator_timing.update_timing_settings,
+        )
+
+    use_profiler_events: BoolProperty(
+        name="Record Trace Events",
+        description="Keep each timed stage as an event for the Chrome trace export, uses more memory",
+        default=False,
+        update=gcf_operator_timing.update_timing_settings,
+        )
+
+    user_filter_buttons: CollectionProperty(
+        type=GCF_PG_UserFilterButton,
+        )
+
     def draw(self, context):
         layout = self.layout
 
+        filter_box = layout.box()
+        filter_box.label(text="User Filter Buttons")
+        for index, button in enumerate(self.user_filter_buttons):
+            button_row = filter_box.row(align=True)
+            button_row.prop(button, "group", text="")
+            button_row.prop(button, "token", text="")
+            button_row.prop(button, "label", text="")
+            button_row.operator("object.gcf_remove_user_filter_button", text="", icon="X").index = index
+        filter_box.operator("object.gcf_add_user_filter_button", icon="ADD")
+
+        timing_box = layout.box()
+        timing_box.prop(self, "use_operator_timing")
+        timing_settings = timing_box.column()
+        timing_settings.enabled = self.use_operator_timing
+        timing_settings.prop(self, "use_operator_timing_key_counts")
+        timing_settings.prop(self, "operator_timing_log_size")
+        timing_settings.prop(self, "operator_timing_log_backups")
+        timing_settings.label(text=gcf_operator_timing.get_timing_log_path(), icon="FILE")
+
+        profiler_box = layout.box()
+        profiler_box.prop(self, "use_profiler")
+        profiler_settings = profiler_box.column()
+        profiler_settings.enabled = self.use_profiler
+        profiler_settings.prop(self, "use_profiler_events")
 
-classes = (
 
+classes = (
+    GCF_PG_UserFilterButton,
+    GCF_OT_AddUserFilterButton,
+    GCF_OT_RemoveUserFilterButton,
+    GCF_AP_AddonPreferences,
 )
 
 
@@ -0,0 +1,200 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# Channel filters by bones: selected pose bones or a bone collection.
+# The dopesheet name filter can not express them, so the other channels are hidden.
+# The bone name of each F-Curve comes from the bbpl channel table of the action.
+
+import bpy
+from . import bbpl
+from . import gcf_operator_timing
+
+
+if "bpy" in locals():
+    import importlib
+    if "bbpl" in locals():
+        importlib.reload(bbpl)
+    if "gcf_operator_timing" in locals():
+        importlib.reload(gcf_operator_timing)
+
+
+from bpy.props import (
+        EnumProperty,
+        BoolProperty,
+        )
+
+from bpy.types import (
+        Operator,
+        )
+
+
+# Blender needs a reference to the strings of dynamic enum items.
+bone_collection_items = []
+
+
+def get_armature_action(obj):
+    if obj is None or obj.type != 'ARMATURE' or obj.animation_data is None:
+        return None
+    return obj.animation_data.action
+
+
+def get_selected_bone_names(obj) -> set:
+    return {pose_bone.name for pose_bone in obj.pose.bones if pose_bone.bone.select}
+
+
+def set_fcurves_hide(action, hide_values):
+    # One RNA call for all the curves
+    action.fcurves.foreach_set("hide", hide_values)
+
+
+def filter_action_bone_channels(action, bone_names: set, show_other_channels=False) -> int:
+    """
+    Shows the F-Curves of the given bones and hides the other ones.
+
+    Returns:
+        int: The number of visible F-Curves.
+    """
+    hide_values = [
+        not show_other_channels if bone_name is None else bone_name not in bone_names
+        for bone_name in bbpl.channel_table.get_channel_table(action).bone_name_column
+    ]
+    set_fcurves_hide(action, hide_values)
+    return hide_values.count(False)
+
+
+def get_bone_collection_items(self, context):
+    bone_collection_items.clear()
+    obj = context.active_object
+    if obj is None or obj.type != 'ARMATURE' or bpy.app.version < (4, 0, 0):
+        return bone_collection_items
+    if bpy.app.version >= (4, 1, 0):
+        collections = obj.data.collections_all
+    else:
+        collections = obj.data.collections
+    bone_collection_items.extend((collection.name, collection.name, "") for collection in collections)
+    return bone_collection_items
+
+
+def armature_action_poll(context):
+    if context.space_data is None or context.space_data.type != 'GRAPH_EDITOR':
+        return False
+    return get_armature_action(context.active_object) is not None
+
+
+@gcf_operator_timing.timed_operator
+class GCF_OT_FilterBoneChannels(Operator):
+    bl_label = "Filter Bone Channels"
+    bl_idname = "object.gcf_filter_bone_channels"
+    bl_description = "Show only the curves of the selected bones or of a bone collection"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    scope: EnumProperty(
+        name="Bones",
+        items=[
+            ('SELECTED', "Selected Bones", "Curves of the selected pose bones"),
+            ('COLLECTION', "Bone Collection", "Curves of the bones in a bone collection"),
+        ],
+        # The collection menu only sets bone_collection
+        default='COLLECTION',
+        options={'SKIP_SAVE'},
+    )
+    bone_collection: EnumProperty(
+        name="Bone Collection",
+        description="Bone collection, the bones of its child collections are included",
+        items=get_bone_collection_items,
+    )
+    show_other_channels: BoolProperty(
+        name="Show Other Channels",
+        description="Keep the curves that are not bone curves visible",
+        default=False,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return armature_action_poll(context)
+
+    def execute(self, context):
+        obj = context.active_object
+        action = get_armature_action(obj)
+        if self.scope == 'COLLECTION':
+            if not self.bone_collection:
+                self.report({'WARNING'}, "No bone collection.")
+                return {'CANCELLED'}
+            bone_names = bbpl.blender_rig.rig_utils.get_bone_collection_bone_names(obj, self.bone_collection)
+        else:
+            bone_names = get_selected_bone_names(obj)
+
+        visible_count = filter_action_bone_channels(action, bone_names, self.show_other_channels)
+        self.report({'INFO'}, f"{visible_count} of {len(action.fcurves)} curves visible.")
+        return {'FINISHED'}
+
+
+class GCF_OT_ShowAllBoneChannels(Operator):
+    bl_label = "Show All Channels"
+    bl_idname = "object.gcf_show_all_bone_channels"
+    bl_description = "Show all the curves of the active armature action"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return armature_action_poll(context)
+
+    def execute(self, context):
+        action = get_armature_action(context.active_object)
+        set_fcurves_hide(action, [False] * len(action.fcurves))
+        return {'FINISHED'}
+
+
+class GCF_PT_BoneFilter(bpy.types.Panel):
+    # Channel filters by bones
+
+    bl_idname = "GCF_PT_BoneFilter"
+    bl_label = "Bone Filter"
+    bl_space_type = "GRAPH_EDITOR"
+    bl_region_type = "UI"
+    bl_category = "Curbe Filter"
+    bl_parent_id = "GCF_PT_GraphCurveFilter"
+
+    def draw(self, context):
+        layout = self.layout
+        row = layout.row()
+        row.operator("object.gcf_filter_bone_channels", text="Selected Bones").scope = 'SELECTED'
+        if bpy.app.version >= (4, 0, 0):
+            row.operator_menu_enum("object.gcf_filter_bone_channels", "bone_collection", text="Collection")
+        layout.operator("object.gcf_show_all_bone_channels", icon="HIDE_OFF")
+
+
+classes = (
+    GCF_OT_FilterBoneChannels,
+    GCF_OT_ShowAllBoneChannels,
+    GCF_PT_BoneFilter,
+)
+
+
+def register():
+    from bpy.utils import register_class
+
+    for cls in classes:
+        register_class(cls)
+
+
+def unregister():
+    from bpy.utils import unregister_class
+
+    for cls in reversed(classes):
+        unregister_class(cls)
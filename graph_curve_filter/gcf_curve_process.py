@@ -0,0 +1,253 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+import os
+import bpy
+import numpy
+import importlib
+import multiprocessing
+import concurrent.futures
+from . import bbpl
+from . import gcf_timer_tasks
+
+
+if "bpy" in locals():
+    if "bbpl" in locals():
+        importlib.reload(bbpl)
+    if "gcf_timer_tasks" in locals():
+        importlib.reload(gcf_timer_tasks)
+
+
+# Process pool shared by all the jobs, created on first use.
+process_pool = None
+process_pool_size = 0
+running_jobs = []
+
+
+def get_worker_package_name():
+    # Unique per addon install, each BleuRaven addon has its own copy of bbpl.
+    return bbpl.__name__.replace(".", "_") + "_worker"
+
+
+def get_worker_module():
+    """
+    Returns bbpl.fcurve_process loaded through the worker package,
+    functions from this module can be sent to the worker processes.
+    """
+    bbpl_path = os.path.dirname(bbpl.__file__)
+    package_name = get_worker_package_name()
+    exec(bbpl.fcurve_process.get_worker_bootstrap_source(package_name, bbpl_path), {})
+    return importlib.import_module(package_name + ".fcurve_process")
+
+
+def get_process_pool(worker_count=0):
+    global process_pool
+    global process_pool_size
+
+    if worker_count <= 0:
+        worker_count = os.cpu_count() or 1
+
+    if process_pool is not None and process_pool_size != worker_count:
+        shutdown_process_pool()
+
+    if process_pool is None:
+        bbpl_path = os.path.dirname(bbpl.__file__)
+        bootstrap_source = bbpl.fcurve_process.get_worker_bootstrap_source(get_worker_package_name(), bbpl_path)
+        # Spawn: forking the Blender process is not safe.
+        process_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=worker_count,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=exec,
+            initargs=(bootstrap_source, {}),
+            )
+        process_pool_size = worker_count
+    return process_pool
+
+
+def shutdown_process_pool():
+    global process_pool
+
+    for job in running_jobs[:]:
+        job.cancel()
+    if process_pool is not None:
+        process_pool.shutdown(wait=False, cancel_futures=True)
+        process_pool = None
+
+
+def get_fcurve_target(fcurve):
+    # FCurve pointers are not safe to keep across updates, find them again by path.
+    return (fcurve.id_data.name, fcurve.data_path, fcurve.array_index)
+
+
+def find_target_fcurve(target):
+    action_name, data_path, array_index = target
+    action = bpy.data.actions.get(action_name)
+    if action is None:
+        return None
+    return action.fcurves.find(data_path, index=array_index)
+
+
+class CurveProcessJob():
+    """
+    Runs a curve operation on many FCurves in worker processes.
+
+    The FCurves are copied in shared memory, the work is split in chunks sent to the
+    process pool and the results are applied on the main thread from a bpy.app.timers callback.
+    The action pointer and the keys hash of each FCurve are kept from the copy:
+    the curves edited, or the actions replaced, while the workers run are skipped.
+    """
+
+    def __init__(self, fcurves, operation: str, options: dict, worker_count=0, label="Curve process"):
+        self.label = label
+        self.targets = [get_fcurve_target(fcurve) for fcurve in fcurves]
+        self.action_pointers = [fcurve.id_data.as_pointer() for fcurve in fcurves]
+        self.keys_hashes = []
+        self.keys_before = 0
+        self.keys_after = 0
+        self.applied_curves = 0
+        self.skipped_curves = 0
+        self.pending_futures = []
+        self.shared_curves = None
+
+        curves = bbpl.anim_utils.get_fcurves_packed_curves(fcurves)
+        if len(curves) == 0:
+            return
+        self.keys_hashes = [
+            bbpl.fcurve_keys.get_packed_keys_hash(curves.get_curve_keys(index), int(curves.extrapolations[index]))
+            for index in range(len(curves))
+        ]
+
+        self.shared_curves = bbpl.fcurve_process.SharedPackedCurves(curves)
+        pool = get_process_pool(worker_count)
+        worker_module = get_worker_module()
+
+        # Several chunks per worker to balance curves of different sizes.
+        chunk_count = min(len(curves), process_pool_size * 4)
+        for chunk in numpy.array_split(numpy.arange(len(curves)), chunk_count):
+            future = pool.submit(
+                worker_module.process_shared_curves,
+                self.shared_curves.description,
+                chunk.tolist(),
+                operation,
+                options,
+                )
+            self.pending_futures.append(future)
+
+    def start(self):
+        if not self.pending_futures:
+            self.finish()
+            return
+        running_jobs.append(self)
+        bpy.app.timers.register(self.timer_update, first_interval=0.1)
+
+    def is_target_changed(self, index, fcurve) -> bool:
+        """
+        Returns:
+            bool: True when the FCurve is not in the copied action or its keys changed since the copy.
+        """
+        if fcurve.id_data.as_pointer() != self.action_pointers[index]:
+            return True
+        packed_keys = bbpl.anim_utils.get_fcurve_packed_keys(fcurve)
+        extrapolation = bbpl.fcurve_keys.EXTRAPOLATION_NAMES[fcurve.extrapolation]
+        return bbpl.fcurve_keys.get_packed_keys_hash(packed_keys, extrapolation) != self.keys_hashes[index]
+
+    def apply_result(self, index, new_keys):
+        fcurve = find_target_fcurve(self.targets[index])
+        if fcurve is None:
+            self.skipped_curves += 1
+            return
+        if new_keys is not None and self.is_target_changed(index, fcurve):
+            self.skipped_curves += 1
+            return
+        key_count = len(fcurve.keyframe_points)
+        self.keys_before += key_count
+        if new_keys is None:
+            self.keys_after += key_count
+            return
+        bbpl.anim_utils.set_fcurve_packed_keys(fcurve, new_keys)
+        self.keys_after += bbpl.fcurve_keys.get_packed_keys_count(new_keys)
+        self.applied_curves += 1
+
+    def timer_update(self):
+        if self not in running_jobs:
+            return None
+
+        still_pending = []
+        for future in self.pending_futures:
+            if not future.done():
+                still_pending.append(future)
+                continue
+            if future.cancelled():
+                continue
+            try:
+                for index, new_keys in future.result():
+                    self.apply_result(index, new_keys)
+            except Exception as e:
+                print(f"{self.label}: a worker failed: {e}")
+        self.pending_futures = still_pending
+
+        if self.applied_curves > 0:
+            gcf_timer_tasks.tag_graph_editors_redraw()
+
+        if self.pending_futures:
+            return 0.1
+
+        self.finish()
+        return None
+
+    def finish(self):
+        if self in running_jobs:
+            running_jobs.remove(self)
+        if self.shared_curves is not None:
+            self.shared_curves.release()
+            self.shared_curves = None
+
+        print(f"{self.label}: {self.keys_before} -> {self.keys_after} keys ({self.applied_curves} curves changed).")
+        if self.skipped_curves > 0:
+            print(f"{self.label}: {self.skipped_curves} curves removed or edited during the process were skipped.")
+        if self.applied_curves > 0:
+            gcf_timer_tasks.push_undo_step(self.label)
+
+    def cancel(self):
+        for future in self.pending_futures:
+            future.cancel()
+        self.pending_futures.clear()
+        self.finish()
+
+
+def start_curve_process_job(
+        fcurves,
+        operation: str,
+        options: dict,
+        worker_count=0,
+        label="Curve process",
+        ) -> CurveProcessJob:
+    """
+    Starts a background curve operation, the results are applied when the workers are done.
+    """
+    job = CurveProcessJob(fcurves, operation, options, worker_count, label)
+    job.start()
+    return job
+
+
+def register():
+    pass
+
+
+def unregister():
+    shutdown_process_pool()
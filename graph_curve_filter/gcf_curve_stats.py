@@ -0,0 +1,267 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# Per channel statistics of the filtered curves, for animation QA.
+# The statistics are computed by bbpl.fcurve_stats on one packed snapshot of the curves,
+# they can be exported to CSV or to a numpy .npz file.
+
+import os
+import csv
+import bpy
+import numpy
+from . import bbpl
+from . import gcf_curve_tools
+from . import gcf_operator_timing
+
+
+if "bpy" in locals():
+    import importlib
+    if "bbpl" in locals():
+        importlib.reload(bbpl)
+    if "gcf_curve_tools" in locals():
+        importlib.reload(gcf_curve_tools)
+    if "gcf_operator_timing" in locals():
+        importlib.reload(gcf_operator_timing)
+
+
+from bpy.props import (
+        StringProperty,
+        FloatProperty,
+        EnumProperty,
+        )
+
+from bpy.types import (
+        Operator,
+        )
+
+
+# Rows listed in the panel
+MAX_PANEL_ROWS = 10
+
+SORT_ITEMS = [
+    ('peak_velocity', "Velocity", "Sort by peak velocity"),
+    ('peak_acceleration', "Acceleration", "Sort by peak acceleration"),
+    ('value_range', "Range", "Sort by value range"),
+    ('key_counts', "Keys", "Sort by key count"),
+]
+
+last_report = None
+
+
+class CurveStatsReport():
+    """
+    action_names, channels: action name and (data_path, array_index) of each curve.
+    stats: bbpl.fcurve_stats.CurveStats, same order.
+    """
+
+    def __init__(self, action_names, channels, stats):
+        self.action_names = action_names
+        self.channels = channels
+        self.stats = stats
+
+    def __len__(self):
+        return len(self.channels)
+
+    def get_sorted_rows(self, stat_name: str, count=None) -> list:
+        """
+        Returns:
+            list: The curve rows sorted by the given statistic, largest first.
+        """
+        order = numpy.argsort(-getattr(self.stats, stat_name), kind="stable")
+        return order[:count].tolist()
+
+
+def compute_fcurves_stats(fcurves, frame_step=1.0) -> CurveStatsReport:
+    """
+    Computes the statistics of the F-Curves, can be called without the interface.
+    The F-Curve modifiers are not evaluated, the statistics use the keys only.
+
+    Args:
+        fcurves (list): The F-Curves, for example gcf_curve_tools.get_filtered_fcurves(context).
+        frame_step (float): Distance between two samples.
+
+    Returns:
+        CurveStatsReport: The statistics of each F-Curve.
+    """
+    fcurves = list(fcurves)
+    curves = bbpl.anim_utils.get_fcurves_packed_curves(fcurves)
+    stats = bbpl.fcurve_stats.get_packed_curves_stats(curves, frame_step)
+    action_names = [fcurve.id_data.name for fcurve in fcurves]
+    channels = [(fcurve.data_path, fcurve.array_index) for fcurve in fcurves]
+    return CurveStatsReport(action_names, channels, stats)
+
+
+def export_curve_stats(report: CurveStatsReport, filepath: str):
+    """
+    Writes the report to a .csv file, or to a .npz file with one array per column.
+    """
+    columns = {name: getattr(report.stats, name) for name in bbpl.fcurve_stats.STAT_NAMES}
+    if os.path.splitext(filepath)[1].lower() == ".npz":
+        numpy.savez(
+            filepath,
+            action_names=numpy.array(report.action_names, dtype=str),
+            data_paths=numpy.array([data_path for data_path, array_index in report.channels], dtype=str),
+            array_indices=numpy.array([array_index for data_path, array_index in report.channels], dtype=numpy.int32),
+            **columns,
+            )
+        return
+
+    with open(filepath, "w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(["action", "data_path", "array_index", *columns])
+        column_values = [column.tolist() for column in columns.values()]
+        for row, (action_name, (data_path, array_index)) in enumerate(zip(report.action_names, report.channels)):
+            writer.writerow([action_name, data_path, array_index, *(values[row] for values in column_values)])
+
+
+@gcf_operator_timing.timed_operator
+class GCF_OT_CurveStats(Operator):
+    bl_label = "Curve Stats"
+    bl_idname = "object.gcf_curve_stats"
+    bl_description = "Compute the value range, peak velocity and peak acceleration of the filtered curves"
+    bl_options = {'REGISTER'}
+
+    frame_step: FloatProperty(
+        name="Frame Step",
+        description="Distance between two samples, velocity and acceleration are per frame",
+        default=1.0,
+        min=0.01,
+        )
+
+    @classmethod
+    def poll(cls, context):
+        return gcf_curve_tools.graph_editor_poll(context)
+
+    def execute(self, context):
+        global last_report
+
+        last_report = compute_fcurves_stats(gcf_curve_tools.get_filtered_fcurves(context), self.frame_step)
+        self.report({'INFO'}, f"Stats of {len(last_report)} curves.")
+        return {'FINISHED'}
+
+
+@gcf_operator_timing.timed_operator
+class GCF_OT_ExportCurveStats(Operator):
+    bl_label = "Export Curve Stats"
+    bl_idname = "object.gcf_export_curve_stats"
+    bl_description = "Write the statistics of the filtered curves to a .csv or .npz file"
+    bl_options = {'REGISTER'}
+
+    filepath: StringProperty(
+        name="File Path",
+        subtype='FILE_PATH',
+        )
+
+    filter_glob: StringProperty(
+        default="*.csv;*.npz",
+        options={'HIDDEN'},
+        )
+
+    frame_step: FloatProperty(
+        name="Frame Step",
+        description="Distance between two samples, velocity and acceleration are per frame",
+        default=1.0,
+        min=0.01,
+        )
+
+    @classmethod
+    def poll(cls, context):
+        return gcf_curve_tools.graph_editor_poll(context)
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = "curve_stats.csv"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        global last_report
+
+        if os.path.splitext(self.filepath)[1].lower() not in (".csv", ".npz"):
+            self.report({'WARNING'}, "Use a .csv or .npz file.")
+            return {'CANCELLED'}
+
+        last_report = compute_fcurves_stats(gcf_curve_tools.get_filtered_fcurves(context), self.frame_step)
+        export_curve_stats(last_report, bpy.path.abspath(self.filepath))
+        self.report({'INFO'}, f"Stats of {len(last_report)} curves exported.")
+        return {'FINISHED'}
+
+
+class GCF_PT_CurveStats(bpy.types.Panel):
+    # Curves with the largest statistics
+
+    bl_idname = "GCF_PT_CurveStats"
+    bl_label = "Curve Stats"
+    bl_space_type = "GRAPH_EDITOR"
+    bl_region_type = "UI"
+    bl_category = "Curbe Filter"
+    bl_parent_id = "GCF_PT_GraphCurveFilter"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        row = layout.row()
+        row.operator("object.gcf_curve_stats", icon="SORTSIZE")
+        row.operator("object.gcf_export_curve_stats", text="Export", icon="EXPORT")
+        if last_report is None:
+            return
+
+        layout.prop(context.scene, "gcf_curve_stats_sort", expand=True)
+        stats = last_report.stats
+        value_range = stats.value_range
+        grid = layout.grid_flow(row_major=True, columns=4, even_columns=False, align=True)
+        for title in ("Channel", "Range", "Velocity", "Acceleration"):
+            grid.label(text=title)
+        for row in last_report.get_sorted_rows(context.scene.gcf_curve_stats_sort, MAX_PANEL_ROWS):
+            data_path, array_index = last_report.channels[row]
+            grid.label(text=f"{data_path}[{array_index}]")
+            grid.label(text=f"{value_range[row]:.4f}")
+            grid.label(text=f"{stats.peak_velocity[row]:.4f}")
+            grid.label(text=f"{stats.peak_acceleration[row]:.4f}")
+
+
+classes = (
+    GCF_OT_CurveStats,
+    GCF_OT_ExportCurveStats,
+    GCF_PT_CurveStats,
+)
+
+
+def register():
+    from bpy.utils import register_class
+
+    for cls in classes:
+        register_class(cls)
+
+    bpy.types.Scene.gcf_curve_stats_sort = EnumProperty(
+        name="Sort",
+        description="Statistic used to sort the curves in the panel",
+        items=SORT_ITEMS,
+        default='peak_velocity',
+        )
+
+
+def unregister():
+    global last_report
+    from bpy.utils import unregister_class
+
+    del bpy.types.Scene.gcf_curve_stats_sort
+    last_report = None
+
+    for cls in reversed(classes):
+        unregister_class(cls)
@@ -0,0 +1,546 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+import bpy
+from . import bpl
+from . import bbpl
+from . import gcf_curve_process
+from . import gcf_timer_tasks
+from . import gcf_operator_timing
+
+
+if "bpy" in locals():
+    import importlib
+    if "bpl" in locals():
+        importlib.reload(bpl)
+    if "bbpl" in locals():
+        importlib.reload(bbpl)
+    if "gcf_curve_process" in locals():
+        importlib.reload(gcf_curve_process)
+    if "gcf_timer_tasks" in locals():
+        importlib.reload(gcf_timer_tasks)
+    if "gcf_operator_timing" in locals():
+        importlib.reload(gcf_operator_timing)
+
+
+from bpy.props import (
+        EnumProperty,
+        FloatProperty,
+        BoolProperty,
+        )
+
+from bpy.types import (
+        Operator,
+        )
+
+
+def get_filtered_fcurves(context):
+    # Visible and editable F-Curves, this follows the graph editor filters.
+    fcurves = getattr(context, "editable_fcurves", None)
+    if fcurves is None:
+        return []
+    return list(fcurves)
+
+
+def graph_editor_poll(context):
+    return context.space_data is not None and context.space_data.type == 'GRAPH_EDITOR'
+
+
+EXECUTION_DIRECT = ('DIRECT', "Direct", "Process all the curves now, the interface waits until it is done")
+EXECUTION_TIMER = ('TIMER', "Interactive", "Process the curves in small chunks, the interface stays responsive")
+EXECUTION_BACKGROUND = (
+    'BACKGROUND',
+    "Background Processes",
+    "Process the curves in worker processes, the result is applied when they are done",
+)
+
+
+def get_all_actions_fcurves():
+    fcurves = []
+    for action in bpy.data.actions:
+        fcurves.extend(action.fcurves)
+    return fcurves
+
+
+def get_action_fcurves(fcurves):
+    # Driver curves are not stored in actions and can not be found again by action name.
+    return [fcurve for fcurve in fcurves if isinstance(fcurve.id_data, bpy.types.Action)]
+
+
+def is_processed_fcurve(fcurve) -> bool:
+    """
+    Returns:
+        bool: False for the curves that Decimate and Resample skip: locked, without keys,
+              or with modifiers that the packed keys can not represent.
+    """
+    if fcurve.lock or len(fcurve.keyframe_points) == 0:
+        return False
+    return all(modifier.mute for modifier in fcurve.modifiers)
+
+
+def get_scene_frame_range(scene):
+    if scene.use_preview_range:
+        return scene.frame_preview_start, scene.frame_preview_end
+    return scene.frame_start, scene.frame_end
+
+
+def get_scene_frame_rate(scene):
+    return scene.render.fps / scene.render.fps_base
+
+
+def resample_fcurve(fcurve, frames, sparse=False, values=None):
+    """
+    Replaces the keys of an FCurve with linear keys sampled at the given frames.
+
+    Args:
+        fcurve (bpy.types.FCurve): The FCurve to resample.
+        frames (numpy.ndarray): The sample frames.
+        sparse (bool): If True, samples inside straight or flat segments are not keyed.
+        values (numpy.ndarray, optional): Already evaluated values at the sample frames.
+
+    Returns:
+        int: The number of keys written.
+    """
+    if values is None:
+        values = bbpl.anim_utils.evaluate_fcurve_frames(fcurve, frames)
+    packed_keys = bbpl.fcurve_keys.new_sampled_packed_keys(frames, values)
+    if sparse:
+        keep_mask = bbpl.fcurve_reduce.get_lossless_keep_mask(packed_keys)
+        packed_keys = bbpl.fcurve_reduce.reduce_packed_keys(packed_keys, keep_mask, use_linear_segments=False)
+    bbpl.anim_utils.set_fcurve_packed_keys(fcurve, packed_keys)
+    return bbpl.fcurve_keys.get_packed_keys_count(packed_keys)
+
+
+def start_curve_timer_task(fcurves, operation: str, options: dict, label="Curve process"):
+    """
+    Runs a curve operation one FCurve per chunk from a timer, see gcf_timer_tasks.
+    """
+    targets = [gcf_curve_process.get_fcurve_target(fcurve) for fcurve in fcurves]
+
+    def process_target(target):
+        fcurve = gcf_curve_process.find_target_fcurve(target)
+        if fcurve is None:
+            return
+        extrapolation = bbpl.fcurve_keys.EXTRAPOLATION_NAMES.get(fcurve.extrapolation, 0)
+        packed_keys = bbpl.anim_utils.get_fcurve_packed_keys(fcurve)
+        new_keys = bbpl.fcurve_process.process_packed_keys(packed_keys, extrapolation, operation, options)
+        if new_keys is not None:
+            bbpl.anim_utils.set_fcurve_packed_keys(fcurve, new_keys)
+
+    generator = gcf_timer_tasks.iter_chunks(targets, process_target)
+    return gcf_timer_tasks.start_timer_task(generator, label)
+
+
+def iter_remove_static_curves(targets, tolerance: float, removed_targets: list):
+    """
+    Generator for a TimerTask: removes the static curves and yields the progress.
+    """
+    count = len(targets)
+    for index, target in enumerate(targets):
+        fcurve = gcf_curve_process.find_target_fcurve(target)
+        if fcurve is not None and is_static_fcurve(fcurve, tolerance):
+            action = fcurve.id_data
+            action.fcurves.remove(fcurve)
+            bbpl.channel_table.clear_channel_table(action)
+            removed_targets.append(target)
+        yield (index + 1) / count
+
+
+def is_static_fcurve(fcurve, tolerance: float) -> bool:
+    for modifier in fcurve.modifiers:
+        if not modifier.mute:
+            return False
+    extrapolation = bbpl.fcurve_keys.EXTRAPOLATION_NAMES.get(fcurve.extrapolation, 0)
+    packed_keys = bbpl.anim_utils.get_fcurve_packed_keys(fcurve)
+    return bbpl.fcurve_reduce.is_static_packed_keys(packed_keys, tolerance, extrapolation)
+
+
+@gcf_operator_timing.timed_operator
+class GCF_OT_DecimateCurves(Operator):
+    bl_label = "Decimate Curves"
+    bl_idname = "object.gcf_decimate_curves"
+    bl_description = "Reduce the keyframes of the filtered curves, locked curves and curves with modifiers are skipped"
+    # No UNDO: the timer and background executions push their undo step when the curves are written.
+    bl_options = {'REGISTER'}
+
+    mode: EnumProperty(
+        name="Mode",
+        items=[
+            (
+                'ERROR',
+                "Error Tolerance",
+                "Remove keys within the error tolerance of the reduced curve, the new segments are linear",
+            ),
+            ('LOSSLESS', "Lossless", "Remove only the keys inside straight or flat segments"),
+        ],
+        default='ERROR',
+        )
+
+    error_tolerance: FloatProperty(
+        name="Error Tolerance",
+        description="Maximum value difference between a removed key and the reduced curve",
+        default=0.001,
+        min=0.0,
+        precision=4,
+        step=0.01,
+        )
+
+    execution: EnumProperty(
+        name="Execution",
+        items=[EXECUTION_DIRECT, EXECUTION_TIMER, EXECUTION_BACKGROUND],
+        default='DIRECT',
+        )
+
+    @classmethod
+    def poll(cls, context):
+        return graph_editor_poll(context)
+
+    def execute(self, context):
+        if self.mode == 'LOSSLESS':
+            operation = bbpl.fcurve_process.OPERATION_LOSSLESS
+        else:
+            operation = bbpl.fcurve_process.OPERATION_DECIMATE
+        options = {"tolerance": self.error_tolerance}
+        fcurves = [fcurve for fcurve in get_filtered_fcurves(context) if is_processed_fcurve(fcurve)]
+
+        if self.execution == 'BACKGROUND':
+            fcurves = get_action_fcurves(fcurves)
+            gcf_curve_process.start_curve_process_job(fcurves, operation, options, label="Decimate")
+            self.report({'INFO'}, f"Decimate: {len(fcurves)} curves sent to background processes.")
+            return {'FINISHED'}
+
+        if self.execution == 'TIMER':
+            fcurves = get_action_fcurves(fcurves)
+            start_curve_timer_task(fcurves, operation, options, label="Decimate")
+            self.report({'INFO'}, f"Decimate: {len(fcurves)} curves processed in the background.")
+            return {'FINISHED'}
+
+        keys_before = 0
+        keys_after = 0
+        curve_count = 0
+
+        profile = bpl.profiler.profile
+        for fcurve in fcurves:
+            with profile("Decimate: read keys"):
+                packed_keys = bbpl.anim_utils.get_fcurve_packed_keys(fcurve)
+            key_count = bbpl.fcurve_keys.get_packed_keys_count(packed_keys)
+            keys_before += key_count
+            extrapolation = bbpl.fcurve_keys.EXTRAPOLATION_NAMES[fcurve.extrapolation]
+
+            with profile("Decimate: reduce"):
+                reduced_keys = bbpl.fcurve_process.process_packed_keys(packed_keys, extrapolation, operation, options)
+            if reduced_keys is None:
+                keys_after += key_count
+                continue
+
+            with profile("Decimate: write keys"):
+                bbpl.anim_utils.set_fcurve_packed_keys(fcurve, reduced_keys)
+            keys_after += bbpl.fcurve_keys.get_packed_keys_count(reduced_keys)
+            curve_count += 1
+
+        gcf_timer_tasks.push_undo_step("Decimate")
+        self.report({'INFO'}, f"Decimate: {keys_before} -> {keys_after} keys ({curve_count} curves changed).")
+        return {'FINISHED'}
+
+
+@gcf_operator_timing.timed_operator
+class GCF_OT_ResampleCurves(Operator):
+    bl_label = "Resample Curves"
+    bl_idname = "object.gcf_resample_curves"
+    bl_description = "Bake the filtered curves on a frame grid, locked curves and curves with modifiers are skipped"
+    # No UNDO: the timer and background executions push their undo step when the curves are written.
+    bl_options = {'REGISTER'}
+
+    frame_rate: FloatProperty(
+        name="Frame Rate",
+        description="Number of samples per second, higher than the scene frame rate for subframe samples",
+        default=24.0,
+        min=0.01,
+        )
+
+    frame_range: EnumProperty(
+        name="Frame Range",
+        items=[
+            ('CURVE', "Curve", "Resample between the first and the last key of each curve"),
+            ('SCENE', "Scene", "Resample the scene frame range (or the preview range)"),
+        ],
+        default='CURVE',
+        )
+
+    key_mode: EnumProperty(
+        name="Keys",
+        items=[
+            ('DENSE', "Dense", "One key per sample"),
+            ('SPARSE', "Sparse", "Skip the samples inside straight or flat segments"),
+        ],
+        default='DENSE',
+        )
+
+    scope: EnumProperty(
+        name="Scope",
+        items=[
+            ('FILTERED', "Filtered Curves", "Curves visible in the graph editor"),
+            ('ALL_ACTIONS', "All Actions", "Every curve of every action in the file"),
+        ],
+        default='FILTERED',
+        )
+
+    execution: EnumProperty(
+        name="Execution",
+        items=[EXECUTION_DIRECT, EXECUTION_TIMER, EXECUTION_BACKGROUND],
+        default='DIRECT',
+        )
+
+    @classmethod
+    def poll(cls, context):
+        return graph_editor_poll(context)
+
+    def invoke(self, context, event):
+        self.frame_rate = get_scene_frame_rate(context.scene)
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        scene = context.scene
+        frame_step = get_scene_frame_rate(scene) / self.frame_rate
+
+        if self.scope == 'ALL_ACTIONS':
+            fcurves = get_all_actions_fcurves()
+        else:
+            fcurves = get_filtered_fcurves(context)
+
+        fcurves = [fcurve for fcurve in fcurves if is_processed_fcurve(fcurve)]
+        sparse = self.key_mode == 'SPARSE'
+        keys_before = sum(len(fcurve.keyframe_points) for fcurve in fcurves)
+        keys_after = 0
+
+        if self.execution in ('TIMER', 'BACKGROUND'):
+            options = {
+                "frame_step": frame_step,
+                "frame_range": get_scene_frame_range(scene) if self.frame_range == 'SCENE' else None,
+                "sparse": sparse,
+                }
+            operation = bbpl.fcurve_process.OPERATION_RESAMPLE
+            fcurves = get_action_fcurves(fcurves)
+            if self.execution == 'TIMER':
+                start_curve_timer_task(fcurves, operation, options, label="Resample")
+            else:
+                gcf_curve_process.start_curve_process_job(fcurves, operation, options, label="Resample")
+            self.report({'INFO'}, f"Resample: {len(fcurves)} curves processed in the background.")
+            return {'FINISHED'}
+
+        if self.frame_range == 'SCENE':
+            # Same frames for all the curves: evaluate them in one call.
+            frames = bbpl.fcurve_evaluate.get_sample_frames(*get_scene_frame_range(scene), frame_step)
+            with bpl.profiler.profile("Resample: evaluate"):
+                all_values = bbpl.anim_utils.evaluate_fcurves_frames(fcurves, frames)
+            with bpl.profiler.profile("Resample: write keys"):
+                for fcurve, values in zip(fcurves, all_values):
+                    keys_after += resample_fcurve(fcurve, frames, sparse, values)
+        else:
+            for fcurve in fcurves:
+                frame_start, frame_end = fcurve.range()
+                frames = bbpl.fcurve_evaluate.get_sample_frames(frame_start, frame_end, frame_step)
+                with bpl.profiler.profile("Resample: curve"):
+                    keys_after += resample_fcurve(fcurve, frames, sparse)
+        curve_count = len(fcurves)
+
+        gcf_timer_tasks.push_undo_step("Resample")
+        self.report({'INFO'}, f"Resample: {curve_count} curves, {keys_before} -> {keys_after} keys.")
+        return {'FINISHED'}
+
+
+@gcf_operator_timing.timed_operator
+class GCF_OT_RemoveStaticCurves(Operator):
+    bl_label = "Remove Static Curves"
+    bl_idname = "object.gcf_remove_static_curves"
+    bl_description = "Remove the curves that keep the same value on all frames"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    tolerance: FloatProperty(
+        name="Tolerance",
+        description="Maximum value difference for a curve to be static",
+        default=0.0001,
+        min=0.0,
+        precision=5,
+        step=0.001,
+        )
+
+    scope: EnumProperty(
+        name="Scope",
+        items=[
+            ('FILTERED', "Filtered Curves", "Curves visible in the graph editor"),
+            ('ALL_ACTIONS', "All Actions", "Every curve of every action in the file"),
+        ],
+        default='FILTERED',
+        )
+
+    execution: EnumProperty(
+        name="Execution",
+        items=[EXECUTION_DIRECT, EXECUTION_TIMER],
+        default='DIRECT',
+        )
+
+    @classmethod
+    def poll(cls, context):
+        return graph_editor_poll(context)
+
+    def execute(self, context):
+        if self.scope == 'ALL_ACTIONS':
+            fcurves = get_all_actions_fcurves()
+        else:
+            fcurves = get_action_fcurves(get_filtered_fcurves(context))
+
+        targets = [gcf_curve_process.get_fcurve_target(fcurve) for fcurve in fcurves]
+        removed_targets = []
+        generator = iter_remove_static_curves(targets, self.tolerance, removed_targets)
+
+        if self.execution == 'TIMER':
+            def on_finish(task):
+                print(f"Remove Static Curves: {len(removed_targets)} of {len(targets)} curves removed.")
+
+            gcf_timer_tasks.start_timer_task(generator, "Remove Static Curves", on_finish=on_finish)
+            self.report({'INFO'}, f"Remove Static Curves: {len(targets)} curves checked in the background.")
+            return {'FINISHED'}
+
+        for progress in generator:
+            pass
+        self.report({'INFO'}, f"Remove Static Curves: {len(removed_targets)} of {len(targets)} curves removed.")
+        return {'FINISHED'}
+
+
+def get_assigned_actions(obj):
+    """
+    Returns the action of the object and the actions of its NLA strips, without duplicates.
+    """
+    anim_data = obj.animation_data
+    if anim_data is None:
+        return []
+    actions = [anim_data.action] if anim_data.action else []
+    for track in anim_data.nla_tracks:
+        for strip in track.strips:
+            if strip.action and strip.action not in actions:
+                actions.append(strip.action)
+    return actions
+
+
+def get_orphan_cleanup_actions(armature, scope: str, min_bone_ratio=0.5):
+    """
+    Returns the actions to clean for the armature.
+
+    Args:
+        armature (bpy.types.Object): The armature object.
+        scope (str): 'ACTIVE_ACTION', 'ASSIGNED_ACTIONS' (action and NLA strips of the armature)
+            or 'MATCHING_ACTIONS' (every action whose animated bones are mostly armature bones).
+        min_bone_ratio (float): For 'MATCHING_ACTIONS', minimum share of the animated bones of an action
+            found in the armature. Rigs often share a few bone names, the actions of other rigs stay below it.
+    """
+    if scope == 'ACTIVE_ACTION':
+        if armature.animation_data and armature.animation_data.action:
+            return [armature.animation_data.action]
+        return []
+    if scope == 'ASSIGNED_ACTIONS':
+        return get_assigned_actions(armature)
+    bone_names = bbpl.basics.get_armature_bone_names(armature)
+    actions = [action for action in bpy.data.actions if action.library is None]
+    matrix = bbpl.basics.get_actions_association_matrix(actions, [bone_names], use_ratio=True)
+    return [action for action, row in zip(actions, matrix) if row[0] >= min_bone_ratio]
+
+
+@gcf_operator_timing.timed_operator
+class GCF_OT_RemoveOrphanCurves(Operator):
+    bl_label = "Remove Orphan Curves"
+    bl_idname = "object.gcf_remove_orphan_curves"
+    bl_description = "Remove the curves of bones that no longer exist in the active armature"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    scope: EnumProperty(
+        name="Scope",
+        items=[
+            ('ACTIVE_ACTION', "Active Action", "Action of the active armature"),
+            ('ASSIGNED_ACTIONS', "Assigned Actions", "Action and NLA strip actions of the active armature"),
+            ('MATCHING_ACTIONS', "Matching Actions",
+                "Every action of the file whose animated bones are mostly bones of the active armature"),
+        ],
+        default='ASSIGNED_ACTIONS',
+        )
+
+    min_bone_ratio: FloatProperty(
+        name="Min Bone Ratio",
+        description="Matching Actions: minimum share of the animated bones of an action found in the armature",
+        default=0.5,
+        min=0.01,
+        max=1.0,
+        subtype='FACTOR',
+        )
+
+    dry_run: BoolProperty(
+        name="Dry Run",
+        description="Only list the orphan curves in the console, nothing is removed",
+        default=True,
+        )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'ARMATURE'
+
+    def execute(self, context):
+        armature = context.active_object
+        bone_names = bbpl.basics.get_armature_bone_names(armature)
+        updater = bbpl.backward_compatibility.RigActionUpdater()
+
+        curve_count = 0
+        key_count = 0
+        action_count = 0
+        for action in get_orphan_cleanup_actions(armature, self.scope, self.min_bone_ratio):
+            orphans = updater.remove_orphan_bone_curves(action, bone_names, self.dry_run)
+            if not orphans:
+                continue
+            action_count += 1
+            curve_count += len(orphans)
+            action_key_count = sum(orphan[2] for orphan in orphans)
+            key_count += action_key_count
+            print(f"{action.name}: {len(orphans)} orphan curves, {action_key_count} keys.")
+            for data_path, array_index, keys in orphans:
+                print(f"    {data_path}[{array_index}] {keys} keys")
+
+        prefix = "Dry run, would remove" if self.dry_run else "Removed"
+        self.report({'INFO'}, f"{prefix} {curve_count} curves and {key_count} keys in {action_count} actions.")
+        return {'FINISHED'}
+
+
+classes = (
+    GCF_OT_DecimateCurves,
+    GCF_OT_ResampleCurves,
+    GCF_OT_RemoveStaticCurves,
+    GCF_OT_RemoveOrphanCurves,
+)
+
+
+def register():
+    from bpy.utils import register_class
+
+    for cls in classes:
+        register_class(cls)
+
+
+def unregister():
+    from bpy.utils import unregister_class
+
+    for cls in reversed(classes):
+        unregister_class(cls)
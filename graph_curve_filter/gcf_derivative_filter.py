@@ -0,0 +1,352 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# Channel filter by peak velocity or acceleration, to find the curves that pop.
+# The peaks of each curve are computed once by bbpl.fcurve_stats and cached by action,
+# moving the threshold only compares the cached arrays and sets the hide flags.
+# The hide flags of an action are saved when the filter first hides its curves and restored when it is disabled.
+
+import bpy
+import numpy
+from . import bbpl
+from . import gcf_operator_timing
+
+
+if "bpy" in locals():
+    import importlib
+    if "bbpl" in locals():
+        importlib.reload(bbpl)
+    if "gcf_operator_timing" in locals():
+        importlib.reload(gcf_operator_timing)
+
+
+from bpy.props import (
+        BoolProperty,
+        FloatProperty,
+        EnumProperty,
+        PointerProperty,
+        )
+
+from bpy.types import (
+        Operator,
+        )
+
+
+# Seconds without action update before the peaks are computed again by the auto refresh.
+AUTO_REFRESH_DELAY = 0.5
+
+# Action pointer -> (F-Curve count, frame step, bbpl.fcurve_stats.CurveStats)
+action_curve_stats = {}
+
+# Action pointer -> (channel table, hide flags before the filter)
+saved_hide_states = {}
+
+# Pointers of the actions whose hide flags were written by the filter,
+# the next depsgraph update of the action only changes the visibility and does not start the auto refresh.
+hide_only_updates = set()
+
+
+def get_action_curve_stats(action, frame_step=1.0):
+    """
+    Returns the statistics of the F-Curves of the action, in the fcurves order.
+    They are computed again when the F-Curve count or the frame step changed,
+    the keys are not read on each call: Refresh and the auto refresh call clear_action_curve_stats().
+    """
+    fcurve_count = len(action.fcurves)
+    cached = action_curve_stats.get(action.as_pointer())
+    if cached is None or cached[0] != fcurve_count or cached[1] != frame_step:
+        curves = bbpl.anim_utils.get_fcurves_packed_curves(list(action.fcurves))
+        stats = bbpl.fcurve_stats.get_packed_curves_stats(curves, frame_step)
+        cached = (fcurve_count, frame_step, stats)
+        action_curve_stats[action.as_pointer()] = cached
+    return cached[2]
+
+
+def clear_action_curve_stats(action=None):
+    if action is None:
+        action_curve_stats.clear()
+    else:
+        action_curve_stats.pop(action.as_pointer(), None)
+
+
+def get_derivative_hide_values(
+        stats,
+        mode: str,
+        velocity_threshold: float,
+        acceleration_threshold: float,
+        ) -> numpy.ndarray:
+    """
+    Returns:
+        numpy.ndarray: True for the curves whose peaks stay below the thresholds of the mode.
+    """
+    fast = numpy.zeros(len(stats.key_counts), dtype=bool)
+    if mode in ('VELOCITY', 'ANY'):
+        fast |= stats.peak_velocity >= velocity_threshold
+    if mode in ('ACCELERATION', 'ANY'):
+        fast |= stats.peak_acceleration >= acceleration_threshold
+    return ~fast
+
+
+def save_hide_state(action):
+    """
+    Saves the hide flags of the action, if they are not saved yet.
+    """
+    if action.as_pointer() in saved_hide_states:
+        return
+    hide_values = [False] * len(action.fcurves)
+    action.fcurves.foreach_get("hide", hide_values)
+    saved_hide_states[action.as_pointer()] = (bbpl.channel_table.get_channel_table(action), hide_values)
+
+
+def restore_hide_states(actions):
+    """
+    Restores the hide flags saved before the filter, all the curves are shown when the channels changed since.
+    """
+    for action in actions:
+        saved = saved_hide_states.pop(action.as_pointer(), None)
+        if saved is None:
+            continue
+        table, hide_values = saved
+        if not table.matches(action.fcurves):
+            hide_values = [False] * len(action.fcurves)
+        action.fcurves.foreach_set("hide", hide_values)
+    saved_hide_states.clear()
+
+
+def set_hide_values(action, hide_values):
+    """
+    Writes the hide flags of the filter, the depsgraph update they cause is ignored by the auto refresh.
+    """
+    hide_only_updates.add(action.as_pointer())
+    action.fcurves.foreach_set("hide", hide_values)
+
+
+def filter_action_derivatives(action, settings) -> int:
+    """
+    Hides the F-Curves of the action that are below the thresholds of the settings.
+
+    Returns:
+        int: The number of visible F-Curves.
+    """
+    save_hide_state(action)
+    stats = get_action_curve_stats(action, settings.frame_step)
+    hide_values = get_derivative_hide_values(
+        stats, settings.mode, settings.velocity_threshold, settings.acceleration_threshold
+    )
+    set_hide_values(action, hide_values.tolist())
+    return len(hide_values) - int(hide_values.sum())
+
+
+def get_active_action(context):
+    obj = context.active_object
+    if obj is None or obj.animation_data is None:
+        return None
+    return obj.animation_data.action
+
+
+def update_derivative_filter(self, context):
+    if not self.use_filter:
+        restore_hide_states(bpy.data.actions)
+        return
+    action = get_active_action(context)
+    if action is not None:
+        filter_action_derivatives(action, self)
+
+
+def auto_refresh_update():
+    # Timer callback: computes the peaks of the active action again after a key edit.
+    context = bpy.context
+    settings = context.scene.gcf_derivative_filter
+    action = get_active_action(context)
+    if not settings.use_filter or not settings.use_auto_refresh or action is None:
+        return None
+    clear_action_curve_stats(action)
+    stats = get_action_curve_stats(action, settings.frame_step)
+    hide_values = get_derivative_hide_values(
+        stats, settings.mode, settings.velocity_threshold, settings.acceleration_threshold
+    ).tolist()
+    current_values = [False] * len(action.fcurves)
+    action.fcurves.foreach_get("hide", current_values)
+    # Setting equal flags would update the action again and restart the refresh.
+    if hide_values != current_values:
+        set_hide_values(action, hide_values)
+    return None
+
+
+@bpy.app.handlers.persistent
+def auto_refresh_depsgraph_update(scene, depsgraph):
+    settings = scene.gcf_derivative_filter
+    if not settings.use_filter or not settings.use_auto_refresh:
+        return
+    action = get_active_action(bpy.context)
+    if action is None:
+        return
+    for update in depsgraph.updates:
+        if update.id.original == action:
+            if action.as_pointer() in hide_only_updates:
+                # Update of the hide flags written by the filter, the keys did not change.
+                hide_only_updates.discard(action.as_pointer())
+                return
+            # Waits the end of the edit, each new update delays the refresh.
+            if bpy.app.timers.is_registered(auto_refresh_update):
+                bpy.app.timers.unregister(auto_refresh_update)
+            bpy.app.timers.register(auto_refresh_update, first_interval=AUTO_REFRESH_DELAY)
+            return
+
+
+class GCF_PG_DerivativeFilter(bpy.types.PropertyGroup):
+    use_filter: BoolProperty(
+        name="Derivative Filter",
+        description="Hide the curves of the active action with a low peak velocity or acceleration",
+        default=False,
+        update=update_derivative_filter,
+        )
+
+    mode: EnumProperty(
+        name="Mode",
+        items=[
+            ('VELOCITY', "Velocity", "Show the curves with a fast value change"),
+            ('ACCELERATION', "Acceleration", "Show the curves with a sudden change of speed"),
+            ('ANY', "Any", "Show the curves above one of the two thresholds"),
+        ],
+        default='VELOCITY',
+        update=update_derivative_filter,
+        )
+
+    velocity_threshold: FloatProperty(
+        name="Velocity",
+        description="Minimum peak value change per frame",
+        default=0.1,
+        min=0.0,
+        soft_max=10.0,
+        precision=4,
+        update=update_derivative_filter,
+        )
+
+    acceleration_threshold: FloatProperty(
+        name="Acceleration",
+        description="Minimum peak velocity change per frame",
+        default=0.1,
+        min=0.0,
+        soft_max=10.0,
+        precision=4,
+        update=update_derivative_filter,
+        )
+
+    frame_step: FloatProperty(
+        name="Frame Step",
+        description="Distance between two samples of the derivatives",
+        default=1.0,
+        min=0.01,
+        update=update_derivative_filter,
+        )
+
+    use_auto_refresh: BoolProperty(
+        name="Auto Refresh",
+        description=(
+            "Compute the peaks again after the keys of the active action are edited, "
+            "otherwise use Refresh. Slow on large actions"
+            ),
+        default=False,
+        update=update_derivative_filter,
+        )
+
+
+@gcf_operator_timing.timed_operator
+class GCF_OT_RefreshDerivativeFilter(Operator):
+    bl_label = "Refresh"
+    bl_idname = "object.gcf_refresh_derivative_filter"
+    bl_description = "Compute the peaks of the active action again, after editing keys"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return get_active_action(context) is not None
+
+    def execute(self, context):
+        action = get_active_action(context)
+        clear_action_curve_stats(action)
+        settings = context.scene.gcf_derivative_filter
+        if settings.use_filter:
+            visible_count = filter_action_derivatives(action, settings)
+            self.report({'INFO'}, f"{visible_count} of {len(action.fcurves)} curves visible.")
+        return {'FINISHED'}
+
+
+class GCF_PT_DerivativeFilter(bpy.types.Panel):
+    # Channel filter by peak velocity or acceleration
+
+    bl_idname = "GCF_PT_DerivativeFilter"
+    bl_label = "Derivative Filter"
+    bl_space_type = "GRAPH_EDITOR"
+    bl_region_type = "UI"
+    bl_category = "Curbe Filter"
+    bl_parent_id = "GCF_PT_GraphCurveFilter"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw_header(self, context):
+        self.layout.prop(context.scene.gcf_derivative_filter, "use_filter", text="")
+
+    def draw(self, context):
+        layout = self.layout
+        settings = context.scene.gcf_derivative_filter
+        layout.active = settings.use_filter
+        layout.prop(settings, "mode", expand=True)
+        if settings.mode in ('VELOCITY', 'ANY'):
+            layout.prop(settings, "velocity_threshold", slider=True)
+        if settings.mode in ('ACCELERATION', 'ANY'):
+            layout.prop(settings, "acceleration_threshold", slider=True)
+        row = layout.row()
+        row.prop(settings, "frame_step")
+        row.operator("object.gcf_refresh_derivative_filter", icon="FILE_REFRESH")
+        layout.prop(settings, "use_auto_refresh")
+        if not settings.use_auto_refresh:
+            layout.label(text="Peaks are not updated after key edits, use Refresh.", icon="INFO")
+
+
+classes = (
+    GCF_PG_DerivativeFilter,
+    GCF_OT_RefreshDerivativeFilter,
+    GCF_PT_DerivativeFilter,
+)
+
+
+def register():
+    from bpy.utils import register_class
+
+    for cls in classes:
+        register_class(cls)
+
+    bpy.types.Scene.gcf_derivative_filter = PointerProperty(type=GCF_PG_DerivativeFilter)
+    bpy.app.handlers.depsgraph_update_post.append(auto_refresh_depsgraph_update)
+
+
+def unregister():
+    from bpy.utils import unregister_class
+
+    if auto_refresh_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(auto_refresh_depsgraph_update)
+    if bpy.app.timers.is_registered(auto_refresh_update):
+        bpy.app.timers.unregister(auto_refresh_update)
+    del bpy.types.Scene.gcf_derivative_filter
+    clear_action_curve_stats()
+    saved_hide_states.clear()
+    hide_only_updates.clear()
+
+    for cls in reversed(classes):
+        unregister_class(cls)
@@ -0,0 +1,201 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# Duplicate curves and actions, found by hashing the packed keys of each F-Curve.
+# Two actions are duplicates when they have the same channels with the same keys
+# and the same action settings: ID type, markers, manual frame range, fake user and custom properties.
+
+import bpy
+import hashlib
+import collections
+from . import bbpl
+from . import gcf_operator_timing
+
+
+if "bpy" in locals():
+    import importlib
+    if "bbpl" in locals():
+        importlib.reload(bbpl)
+    if "gcf_operator_timing" in locals():
+        importlib.reload(gcf_operator_timing)
+
+
+from bpy.props import (
+        BoolProperty,
+        )
+
+from bpy.types import (
+        Operator,
+        )
+
+
+class DuplicateScan():
+    """
+    curve_groups: lists of (action, data_path, array_index) of the curves with the same keys.
+    action_groups: lists of the actions with the same content, linked actions are never in a group.
+    """
+
+    def __init__(self, curve_groups, action_groups):
+        self.curve_groups = curve_groups
+        self.action_groups = action_groups
+
+    def get_redundant_curve_count(self):
+        return sum(len(group) - 1 for group in self.curve_groups)
+
+
+def get_fcurve_hash(fcurve) -> bytes:
+    extrapolation = bbpl.fcurve_keys.EXTRAPOLATION_NAMES.get(fcurve.extrapolation, 0)
+    packed_keys = bbpl.anim_utils.get_fcurve_packed_keys(fcurve)
+    return bbpl.fcurve_keys.get_packed_keys_hash(packed_keys, extrapolation)
+
+
+def get_id_property_text(value) -> str:
+    if hasattr(value, "to_dict"):
+        value = value.to_dict()
+    elif hasattr(value, "to_list"):
+        value = value.to_list()
+    return repr(value)
+
+
+def get_action_settings_text(action) -> str:
+    """
+    Returns:
+        str: The action data that is not in the F-Curves, equal for actions that can replace each other.
+    """
+    settings = [
+        action.id_root,
+        action.use_fake_user,
+        action.use_cyclic,
+        sorted((marker.frame, marker.name) for marker in action.pose_markers),
+        sorted((key, get_id_property_text(action[key])) for key in action.keys()),
+    ]
+    if action.use_frame_range:
+        settings.append((action.frame_start, action.frame_end))
+    return repr(settings)
+
+
+def get_action_hash(action_settings: str, channel_hashes) -> bytes:
+    """
+    Args:
+        action_settings (str): The text of get_action_settings_text().
+        channel_hashes (list): (data_path, array_index, curve hash) of each F-Curve, in any order.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(action_settings.encode())
+    for data_path, array_index, curve_hash in sorted(channel_hashes):
+        hasher.update(f"{data_path}[{array_index}]".encode())
+        hasher.update(curve_hash)
+    return hasher.digest()
+
+
+def is_local_action(action) -> bool:
+    return action.library is None and action.override_library is None
+
+
+def scan_duplicates(actions) -> DuplicateScan:
+    """
+    Reads each F-Curve once and groups the curves and the actions by content hash.
+    Curves without keys are not reported, actions with F-Curve modifiers and linked actions are never duplicates.
+    """
+    curves_by_hash = collections.defaultdict(list)
+    actions_by_hash = collections.defaultdict(list)
+    for action in actions:
+        channel_hashes = []
+        has_modifiers = False
+        for fcurve in action.fcurves:
+            curve_hash = get_fcurve_hash(fcurve)
+            channel_hashes.append((fcurve.data_path, fcurve.array_index, curve_hash))
+            has_modifiers = has_modifiers or len(fcurve.modifiers) > 0
+            if len(fcurve.keyframe_points) > 0:
+                curves_by_hash[curve_hash].append((action, fcurve.data_path, fcurve.array_index))
+        if channel_hashes and not has_modifiers and is_local_action(action):
+            actions_by_hash[get_action_hash(get_action_settings_text(action), channel_hashes)].append(action)
+
+    curve_groups = [group for group in curves_by_hash.values() if len(group) > 1]
+    action_groups = [group for group in actions_by_hash.values() if len(group) > 1]
+    return DuplicateScan(curve_groups, action_groups)
+
+
+def merge_duplicate_actions(action_groups) -> int:
+    """
+    Keeps the first action of each group, the users of the other ones use it instead and they are removed.
+
+    Returns:
+        int: The number of removed actions.
+    """
+    removed_count = 0
+    for actions in action_groups:
+        kept_action = actions[0]
+        for duplicate_action in actions[1:]:
+            duplicate_action.user_remap(kept_action)
+            bpy.data.actions.remove(duplicate_action)
+            removed_count += 1
+    return removed_count
+
+
+@gcf_operator_timing.timed_operator
+class GCF_OT_FindDuplicateCurves(Operator):
+    bl_label = "Find Duplicates"
+    bl_idname = "object.gcf_find_duplicate_curves"
+    bl_description = "List the curves with the same keys and the duplicate actions in the console"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    merge_actions: BoolProperty(
+        name="Merge Duplicate Actions",
+        description="Replace the duplicate actions by the first one of their group and remove them",
+        default=False,
+        )
+
+    def execute(self, context):
+        scan = scan_duplicates(bpy.data.actions)
+
+        for group in scan.curve_groups:
+            print(f"Same keys on {len(group)} curves:")
+            for action, data_path, array_index in group:
+                print(f"    {action.name}: {data_path}[{array_index}]")
+        for group in scan.action_groups:
+            print(f"Duplicate actions: {', '.join(action.name for action in group)}")
+
+        message = (
+            f"{len(scan.curve_groups)} groups of identical curves ({scan.get_redundant_curve_count()} redundant), "
+            f"{len(scan.action_groups)} groups of duplicate actions."
+        )
+        if self.merge_actions:
+            removed_count = merge_duplicate_actions(scan.action_groups)
+            message += f" {removed_count} actions merged."
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+
+classes = (
+    GCF_OT_FindDuplicateCurves,
+)
+
+
+def register():
+    from bpy.utils import register_class
+
+    for cls in classes:
+        register_class(cls)
+
+
+def unregister():
+    from bpy.utils import unregister_class
+
+    for cls in reversed(classes):
+        unregister_class(cls)
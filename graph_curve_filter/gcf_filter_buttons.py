@@ -0,0 +1,137 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# Filter buttons of the graph editor panel.
+# The buttons are described by (group, token, label) tuples: each group is one row,
+# the token is set as dopesheet filter text and the label is the button text.
+# The panel draws a layout model built once from this table and the user groups of the preferences.
+
+import bpy
+from . import bbpl
+
+
+if "bpy" in locals():
+    import importlib
+    if "bbpl" in locals():
+        importlib.reload(bbpl)
+
+
+FILTER_BUTTONS = (
+    ("Location", "Location", "Loc"),
+    ("Location", "X Location", "X"),
+    ("Location", "Y Location", "Y"),
+    ("Location", "Z Location", "Z"),
+    ("Euler", "Euler", "Euler"),
+    ("Euler", "X Euler", "X"),
+    ("Euler", "Y Euler", "Y"),
+    ("Euler", "Z Euler", "Z"),
+    ("Scale", "Scale", "Scale"),
+    ("Scale", "X Scale", "X"),
+    ("Scale", "Y Scale", "Y"),
+    ("Scale", "Z Scale", "Z"),
+    ("Quaternion", "Quaternion", "Quat"),
+    ("Quaternion", "W Quaternion", "W"),
+    ("Quaternion", "X Quaternion", "X"),
+    ("Quaternion", "Y Quaternion", "Y"),
+    ("Quaternion", "Z Quaternion", "Z"),
+    ("All", "", "ALL"),
+    ("All", "XOXOXOXOXOXOXO", "NONE"),
+)
+
+# Groups drawn in the same box.
+FILTER_BOXES = (
+    ("Location", "Euler", "Scale"),
+    ("Quaternion",),
+    ("All",),
+)
+
+filter_layout = None
+
+
+class FilterLayout():
+    """
+    What the panel draws, computed once:
+    boxes is a tuple of boxes, a box is a tuple of rows and a row a tuple of (token, label).
+    """
+
+    def __init__(self, boxes, version_str):
+        self.boxes = boxes
+        self.version_str = version_str
+
+
+def get_version_str():
+    if bpy.app.version >= (4, 2, 0):
+        return 'Version ' + str(bbpl.blender_extension.extension_utils.get_package_version())
+    return 'Version ' + bbpl.blender_addon.addon_utils.get_addon_version_str("Unreal Engine Assets Exporter")
+
+
+def get_filter_rows(filter_buttons):
+    """
+    Parameters:
+        filter_buttons (iterable): (group, token, label) tuples.
+
+    Returns:
+        dict: Group name -> tuple of (token, label), in the order of the first use of each group.
+    """
+    rows = {}
+    for group, token, label in filter_buttons:
+        rows.setdefault(group, []).append((token, label))
+    return {group: tuple(buttons) for group, buttons in rows.items()}
+
+
+def build_filter_layout(user_filter_buttons=()):
+    """
+    Parameters:
+        user_filter_buttons (iterable): (group, token, label) tuples of the user groups,
+            drawn in their own box after the default ones.
+
+    Returns:
+        FilterLayout: The layout model of the panel.
+    """
+    rows = get_filter_rows(FILTER_BUTTONS)
+    boxes = [tuple(rows[group] for group in box_groups) for box_groups in FILTER_BOXES]
+
+    user_rows = get_filter_rows(
+        (group or "User", token, label or token) for group, token, label in user_filter_buttons
+    )
+    if user_rows:
+        boxes.append(tuple(user_rows.values()))
+
+    return FilterLayout(tuple(boxes), get_version_str())
+
+
+def get_user_filter_buttons():
+    addon = bpy.context.preferences.addons.get(__package__)
+    if addon is None:
+        return ()
+    return [(button.group, button.token, button.label) for button in addon.preferences.user_filter_buttons]
+
+
+def get_filter_layout():
+    global filter_layout
+    if filter_layout is None:
+        filter_layout = build_filter_layout(get_user_filter_buttons())
+    return filter_layout
+
+
+def clear_filter_layout(self=None, context=None):
+    """
+    Rebuilds the layout model on the next draw, also used as update callback of the user filter buttons.
+    """
+    global filter_layout
+    filter_layout = None
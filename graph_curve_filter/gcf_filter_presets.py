@@ -0,0 +1,303 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# User filter presets, saved in the scene and edited with the bbpl template list.
+# The presets are compiled once in a list by index, the first presets can be applied with Alt+1..9.
+# The channels matched by a preset are cached per action until its channel table changes.
+
+import re
+import bpy
+import fnmatch
+import functools
+from . import bbpl
+from . import gcf_operator_timing
+
+
+if "bpy" in locals():
+    import importlib
+    if "bbpl" in locals():
+        importlib.reload(bbpl)
+    if "gcf_operator_timing" in locals():
+        importlib.reload(gcf_operator_timing)
+
+
+from bpy.props import (
+        StringProperty,
+        BoolProperty,
+        IntProperty,
+        PointerProperty,
+        )
+
+from bpy.types import (
+        Operator,
+        )
+
+
+HOTKEY_TYPES = ("ONE", "TWO", "THREE", "FOUR", "FIVE", "SIX", "SEVEN", "EIGHT", "NINE")
+
+ARRAY_INDEX_NAMES = {
+    "rotation_quaternion": "WXYZ",
+    "rotation_axis_angle": "WXYZ",
+    "color": "RGBA",
+}
+
+compiled_presets = None
+matched_channels = {}
+addon_keymaps = []
+
+
+class CompiledFilter():
+    """
+    Same matching as the channel name filter of the graph editor: case insensitive "*text*".
+    """
+
+    def __init__(self, filter_text: str, use_filter_invert: bool):
+        self.filter_text = filter_text
+        self.use_filter_invert = use_filter_invert
+        self.pattern = re.compile(fnmatch.translate(f"*{filter_text}*"), re.IGNORECASE)
+
+    def match(self, channel_name: str) -> bool:
+        return (self.pattern.match(channel_name) is not None) != self.use_filter_invert
+
+
+@functools.lru_cache(maxsize=65536)
+def get_channel_name(data_path: str, array_index: int) -> str:
+    """
+    Returns the channel name shown in the graph editor, like "X Location (Bone)".
+    """
+    channel_path = bbpl.channel_table.parse_data_path(data_path)
+    if channel_path.owner_kind == bbpl.channel_table.OWNER_CUSTOM_PROPERTY or channel_path.property.startswith("["):
+        return data_path
+
+    prop = channel_path.property
+    rna_type = bpy.types.PoseBone if channel_path.owner_kind == bbpl.channel_table.OWNER_BONE else bpy.types.Object
+    rna_property = rna_type.bl_rna.properties.get(prop) if hasattr(rna_type, "bl_rna") else None
+    prop_name = rna_property.name if rna_property else prop
+
+    index_names = ARRAY_INDEX_NAMES.get(prop, "XYZW")
+    name = f"{index_names[array_index]} {prop_name}" if array_index < len(index_names) else prop_name
+    if channel_path.owner_name:
+        name += f" ({channel_path.owner_name})"
+    return name
+
+
+def get_scene_presets(scene):
+    return scene.gcf_filter_presets.get_template_collection()
+
+
+def clear_compiled_presets(self=None, context=None):
+    """
+    Compiles the presets again on next use, also used as update callback of the preset properties.
+    """
+    global compiled_presets
+    compiled_presets = None
+    matched_channels.clear()
+
+
+def get_compiled_presets(scene):
+    """
+    Reads all the presets to check the cache, the panel calls it once per draw and the rows use compiled_presets.
+
+    Returns:
+        list: The CompiledFilter of each preset, in the list order. Names can be duplicated,
+              the presets are found by index.
+    """
+    global compiled_presets
+    presets = get_scene_presets(scene)
+    # The template list buttons add, duplicate, move and remove items without update callback.
+    signature = (scene.name, tuple((preset.filter_text, preset.use_filter_invert) for preset in presets))
+    if compiled_presets is None or compiled_presets[0] != signature:
+        compiled = [CompiledFilter(filter_text, use_filter_invert) for filter_text, use_filter_invert in signature[1]]
+        compiled_presets = (signature, compiled)
+        matched_channels.clear()
+    return compiled_presets[1]
+
+
+def get_active_action(context):
+    obj = context.active_object
+    if obj is None or obj.animation_data is None:
+        return None
+    return obj.animation_data.action
+
+
+def get_matched_channels(preset_index: int, compiled_filter: CompiledFilter, action):
+    """
+    Returns:
+        frozenset: (data_path, array_index) of the action channels matched by the preset,
+                   cached until the filter or the channel table of the action changes.
+    """
+    key = (preset_index, compiled_filter.filter_text, compiled_filter.use_filter_invert, action.as_pointer())
+    table = bbpl.channel_table.get_channel_table(action)
+    cached = matched_channels.get(key)
+    if cached is None or cached[0] is not table:
+        channels = frozenset(
+            channel
+            for channel in zip(table.data_paths, table.array_indices)
+            if compiled_filter.match(get_channel_name(*channel))
+        )
+        cached = (table, channels)
+        matched_channels[key] = cached
+    return cached[1]
+
+
+def apply_filter(context, compiled_filter: CompiledFilter):
+    dopesheet = context.space_data.dopesheet
+    dopesheet.filter_text = compiled_filter.filter_text
+    dopesheet.use_filter_invert = compiled_filter.use_filter_invert
+
+
+class GCF_PG_FilterPreset(bpy.types.PropertyGroup):
+    name: StringProperty(
+        name="Name",
+        default="Preset",
+        )
+
+    filter_text: StringProperty(
+        name="Filter",
+        description="Text set as channel name filter",
+        default="",
+        update=clear_compiled_presets,
+        )
+
+    use_filter_invert: BoolProperty(
+        name="Invert",
+        description="Show the channels that do not match the filter",
+        default=False,
+        update=clear_compiled_presets,
+        )
+
+
+class GCF_UL_FilterPresetDraw(bpy.types.UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        index_text = row.row()
+        index_text.alignment = 'LEFT'
+        index_text.label(text=str(index + 1))
+        row.prop(item, "name", text="", emboss=False)
+        row.prop(item, "filter_text", text="")
+        row.prop(item, "use_filter_invert", text="", icon="ARROW_LEFTRIGHT")
+
+        action = get_active_action(context)
+        # Compiled by the panel draw, before the rows
+        compiled = compiled_presets[1] if compiled_presets is not None else ()
+        if action is not None and index < len(compiled):
+            count_text = row.row()
+            count_text.alignment = 'RIGHT'
+            count_text.label(text=str(len(get_matched_channels(index, compiled[index], action))))
+
+        row.operator("object.gcf_apply_filter_preset", text="", icon="FILTER").preset_number = index + 1
+
+
+GCF_PG_FilterPresetList = bbpl.blender_layout.layout_template_list.types.create_template_list_class(
+    GCF_PG_FilterPreset,
+    GCF_UL_FilterPresetDraw
+    )
+GCF_PG_FilterPresetList.__name__ = "GCF_PG_FilterPresetList"
+GCF_PG_FilterPresetList.template_collection_uilist_class_name = "GCF_UL_FilterPresetDraw"
+
+
+@gcf_operator_timing.timed_operator
+class GCF_OT_ApplyFilterPreset(Operator):
+    bl_label = "Apply Filter Preset"
+    bl_idname = "object.gcf_apply_filter_preset"
+    bl_description = "Set the channel filter of the graph editor from a preset"
+    preset_number: IntProperty(default=1, min=1, description="Number of the preset in the list")
+
+    @classmethod
+    def poll(cls, context):
+        return context.space_data is not None and context.space_data.type == 'GRAPH_EDITOR'
+
+    def execute(self, context):
+        compiled = get_compiled_presets(context.scene)
+        preset_index = self.preset_number - 1
+        if preset_index >= len(compiled):
+            return {'CANCELLED'}
+        compiled_filter = compiled[preset_index]
+        apply_filter(context, compiled_filter)
+
+        action = get_active_action(context)
+        if action is not None:
+            preset_name = get_scene_presets(context.scene)[preset_index].name
+            channel_count = len(get_matched_channels(preset_index, compiled_filter, action))
+            self.report({'INFO'}, f"{preset_name}: {channel_count} channels in {action.name}")
+        return {'FINISHED'}
+
+
+class GCF_PT_FilterPresets(bpy.types.Panel):
+    # User filter presets
+
+    bl_idname = "GCF_PT_FilterPresets"
+    bl_label = "Filter Presets"
+    bl_space_type = "GRAPH_EDITOR"
+    bl_region_type = "UI"
+    bl_category = "Curbe Filter"
+    bl_parent_id = "GCF_PT_GraphCurveFilter"
+
+    def draw(self, context):
+        layout = self.layout
+        get_compiled_presets(context.scene)
+        context.scene.gcf_filter_presets.draw(layout)
+        layout.label(text="Alt+1 to Alt+9 apply the first presets.", icon="INFO")
+
+
+classes = (
+    GCF_PG_FilterPreset,
+    GCF_UL_FilterPresetDraw,
+    GCF_PG_FilterPresetList,
+    GCF_OT_ApplyFilterPreset,
+    GCF_PT_FilterPresets,
+)
+
+
+def register_keymaps():
+    keyconfig = bpy.context.window_manager.keyconfigs.addon
+    if keyconfig is None:
+        # Background mode
+        return
+    keymap = keyconfig.keymaps.new(name="Graph Editor", space_type='GRAPH_EDITOR')
+    for number, key_type in enumerate(HOTKEY_TYPES, start=1):
+        keymap_item = keymap.keymap_items.new("object.gcf_apply_filter_preset", key_type, 'PRESS', alt=True)
+        keymap_item.properties.preset_number = number
+        addon_keymaps.append((keymap, keymap_item))
+
+
+def unregister_keymaps():
+    for keymap, keymap_item in addon_keymaps:
+        keymap.keymap_items.remove(keymap_item)
+    addon_keymaps.clear()
+
+
+def register():
+    from bpy.utils import register_class
+
+    for cls in classes:
+        register_class(cls)
+
+    bpy.types.Scene.gcf_filter_presets = PointerProperty(type=GCF_PG_FilterPresetList)
+    register_keymaps()
+
+
+def unregister():
+    from bpy.utils import unregister_class
+
+    unregister_keymaps()
+    del bpy.types.Scene.gcf_filter_presets
+    clear_compiled_presets()
+
+    for cls in reversed(classes):
+        unregister_class(cls)
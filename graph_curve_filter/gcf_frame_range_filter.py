@@ -0,0 +1,271 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# Channel filter by frame range: only the curves with keys, or value changes,
+# in the visible graph editor range or in the scene (preview) range stay visible.
+# The key times of each action are indexed once by bbpl.fcurve_key_times,
+# a new range is two searchsorted calls, so the filter can follow the view while it pans.
+
+import bpy
+from . import bbpl
+from . import gcf_curve_tools
+from . import gcf_operator_timing
+
+
+if "bpy" in locals():
+    import importlib
+    if "bbpl" in locals():
+        importlib.reload(bbpl)
+    if "gcf_curve_tools" in locals():
+        importlib.reload(gcf_curve_tools)
+    if "gcf_operator_timing" in locals():
+        importlib.reload(gcf_operator_timing)
+
+
+from bpy.props import (
+        BoolProperty,
+        EnumProperty,
+        PointerProperty,
+        )
+
+from bpy.types import (
+        Operator,
+        )
+
+
+# Seconds between two checks of the visible range when the filter follows the view.
+FOLLOW_VIEW_INTERVAL = 0.1
+
+# Action pointer -> (F-Curve count, bbpl.fcurve_key_times.KeyTimeIndex)
+action_key_times = {}
+
+# Last range applied by the follow view timer
+followed_range = None
+
+
+def get_action_key_times(action):
+    """
+    Returns the key time index of the action, built again when its F-Curve count changed.
+    The keys are not read on each call: code that moves keys must call clear_action_key_times().
+    """
+    fcurve_count = len(action.fcurves)
+    cached = action_key_times.get(action.as_pointer())
+    if cached is None or cached[0] != fcurve_count:
+        curves = bbpl.anim_utils.get_fcurves_packed_curves(list(action.fcurves))
+        cached = (fcurve_count, bbpl.fcurve_key_times.KeyTimeIndex(curves))
+        action_key_times[action.as_pointer()] = cached
+    return cached[1]
+
+
+def clear_action_key_times(action=None):
+    if action is None:
+        action_key_times.clear()
+    else:
+        action_key_times.pop(action.as_pointer(), None)
+
+
+def filter_action_frame_range(action, frame_start: float, frame_end: float, use_value_changes=False) -> int:
+    """
+    Hides the F-Curves of the action without keys (or without value changes) in the frame range.
+
+    Returns:
+        int: The number of visible F-Curves.
+    """
+    key_times = get_action_key_times(action)
+    if use_value_changes:
+        visible = key_times.get_curves_with_changes(frame_start, frame_end)
+    else:
+        visible = key_times.get_curves_with_keys(frame_start, frame_end)
+    action.fcurves.foreach_set("hide", (~visible).tolist())
+    return int(visible.sum())
+
+
+def get_view_frame_range(area):
+    """
+    Returns:
+        tuple: The first and last frames visible in the main region of a graph editor area, None without region.
+    """
+    for region in area.regions:
+        if region.type == 'WINDOW':
+            frame_start = region.view2d.region_to_view(0, 0)[0]
+            frame_end = region.view2d.region_to_view(region.width, 0)[0]
+            return frame_start, frame_end
+    return None
+
+
+def get_filter_frame_range(context, source: str):
+    if source == 'VIEW':
+        if context.area is None or context.area.type != 'GRAPH_EDITOR':
+            return None
+        return get_view_frame_range(context.area)
+    return gcf_curve_tools.get_scene_frame_range(context.scene)
+
+
+def get_active_action(context):
+    obj = context.active_object
+    if obj is None or obj.animation_data is None:
+        return None
+    return obj.animation_data.action
+
+
+def follow_view_update():
+    # Timer callback: filters again when the range of a graph editor changed.
+    global followed_range
+
+    context = bpy.context
+    settings = context.scene.gcf_frame_range_filter
+    if not settings.use_follow_view:
+        followed_range = None
+        return None
+
+    action = get_active_action(context)
+    if action is None:
+        return FOLLOW_VIEW_INTERVAL
+    # The first graph editor drives the filter
+    graph_areas = (
+        area for window in context.window_manager.windows for area in window.screen.areas
+        if area.type == 'GRAPH_EDITOR'
+    )
+    area = next(graph_areas, None)
+    frame_range = None if area is None else get_view_frame_range(area)
+    if frame_range is not None and frame_range != followed_range:
+        followed_range = frame_range
+        filter_action_frame_range(action, *frame_range, settings.use_value_changes)
+    return FOLLOW_VIEW_INTERVAL
+
+
+def update_follow_view(self, context):
+    global followed_range
+
+    followed_range = None
+    if self.use_follow_view and not bpy.app.timers.is_registered(follow_view_update):
+        bpy.app.timers.register(follow_view_update, first_interval=FOLLOW_VIEW_INTERVAL)
+
+
+@bpy.app.handlers.persistent
+def follow_view_load_post(*args):
+    # Timers do not survive a file load, start the follow view timer again when the loaded scene uses it.
+    scene = bpy.context.scene
+    if scene is not None and scene.gcf_frame_range_filter.use_follow_view:
+        update_follow_view(scene.gcf_frame_range_filter, bpy.context)
+
+
+class GCF_PG_FrameRangeFilter(bpy.types.PropertyGroup):
+    use_value_changes: BoolProperty(
+        name="Value Changes",
+        description="Keep the curves whose value changes in the range, not only the curves with keys in it",
+        default=False,
+        update=update_follow_view,
+        )
+
+    use_follow_view: BoolProperty(
+        name="Follow View",
+        description="Filter again when the graph editor view pans or zooms",
+        default=False,
+        update=update_follow_view,
+        )
+
+
+@gcf_operator_timing.timed_operator
+class GCF_OT_FilterFrameRange(Operator):
+    bl_label = "Filter Frame Range"
+    bl_idname = "object.gcf_filter_frame_range"
+    bl_description = "Show only the curves of the active action with keys in a frame range"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    source: EnumProperty(
+        name="Range",
+        items=[
+            ('VIEW', "Visible Range", "Frames visible in the graph editor"),
+            ('SCENE', "Scene Range", "Scene frame range, or preview range when it is used"),
+        ],
+        default='VIEW',
+        )
+
+    @classmethod
+    def poll(cls, context):
+        return gcf_curve_tools.graph_editor_poll(context) and get_active_action(context) is not None
+
+    def execute(self, context):
+        frame_range = get_filter_frame_range(context, self.source)
+        if frame_range is None:
+            self.report({'WARNING'}, "No graph editor view.")
+            return {'CANCELLED'}
+
+        action = get_active_action(context)
+        # Keys may have moved since the last filter
+        clear_action_key_times(action)
+        settings = context.scene.gcf_frame_range_filter
+        visible_count = filter_action_frame_range(action, *frame_range, settings.use_value_changes)
+        self.report({'INFO'}, f"{visible_count} of {len(action.fcurves)} curves visible.")
+        return {'FINISHED'}
+
+
+class GCF_PT_FrameRangeFilter(bpy.types.Panel):
+    # Channel filter by frame range
+
+    bl_idname = "GCF_PT_FrameRangeFilter"
+    bl_label = "Frame Range Filter"
+    bl_space_type = "GRAPH_EDITOR"
+    bl_region_type = "UI"
+    bl_category = "Curbe Filter"
+    bl_parent_id = "GCF_PT_GraphCurveFilter"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        settings = context.scene.gcf_frame_range_filter
+        row = layout.row()
+        row.operator("object.gcf_filter_frame_range", text="Visible Range").source = 'VIEW'
+        row.operator("object.gcf_filter_frame_range", text="Scene Range").source = 'SCENE'
+        row = layout.row()
+        row.prop(settings, "use_value_changes")
+        row.prop(settings, "use_follow_view")
+
+
+classes = (
+    GCF_PG_FrameRangeFilter,
+    GCF_OT_FilterFrameRange,
+    GCF_PT_FrameRangeFilter,
+)
+
+
+def register():
+    from bpy.utils import register_class
+
+    for cls in classes:
+        register_class(cls)
+
+    bpy.types.Scene.gcf_frame_range_filter = PointerProperty(type=GCF_PG_FrameRangeFilter)
+    bpy.app.handlers.load_post.append(follow_view_load_post)
+
+
+def unregister():
+    global followed_range
+    from bpy.utils import unregister_class
+
+    if follow_view_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(follow_view_load_post)
+    if bpy.app.timers.is_registered(follow_view_update):
+        bpy.app.timers.unregister(follow_view_update)
+    del bpy.types.Scene.gcf_frame_range_filter
+    clear_action_key_times()
+    followed_range = None
+
+    for cls in reversed(classes):
+        unregister_class(cls)
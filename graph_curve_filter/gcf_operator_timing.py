@@ -0,0 +1,421 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+import os
+import bpy
+import json
+import time
+import logging
+import logging.handlers
+import functools
+import collections
+from . import bpl
+from . import bbpl
+
+
+if "bpy" in locals():
+    import importlib
+    if "bpl" in locals():
+        importlib.reload(bpl)
+    if "bbpl" in locals():
+        importlib.reload(bbpl)
+
+
+from bpy.props import (
+        StringProperty,
+        EnumProperty,
+        )
+
+from bpy.types import (
+        Operator,
+        )
+
+
+# Opt-in, set from the addon preferences (use_operator_timing).
+# The hierarchical profiler, bpl.profiler.default_profiler, is enabled by use_profiler.
+timing_enabled = False
+
+# Opt-in as well (use_operator_timing_key_counts): counting the keys of the action reads every F-Curve.
+timing_key_counts_enabled = False
+
+# Durations of the current session per operator, for the panel.
+MAX_SESSION_SAMPLES = 1000
+session_durations = collections.defaultdict(lambda: collections.deque(maxlen=MAX_SESSION_SAMPLES))
+
+# Library functions timed with the operators when timing is enabled: (module, function name).
+# The module attribute is replaced, the callers must use module.function.
+TIMED_FUNCTIONS = (
+    (bbpl.anim_utils, "get_fcurves_packed_curves"),
+    (bbpl.anim_utils, "set_fcurve_packed_keys"),
+    (bbpl.anim_utils, "evaluate_fcurves_frames"),
+    (bbpl.channel_table, "build_channel_table"),
+    (bbpl.fcurve_evaluate, "evaluate_samples"),
+    (bbpl.fcurve_stats, "get_packed_curves_stats"),
+    (bbpl.fcurve_reduce, "get_decimate_keep_mask"),
+    (bbpl.fcurve_process, "process_packed_keys"),
+)
+
+# (module, function name) -> function, the original functions of the wrapped TIMED_FUNCTIONS.
+original_functions = {}
+
+# Function name -> [count, total duration] of the timed functions called by the running operator,
+# written in the operator record. None when no timed operator is running.
+operator_function_timings = None
+
+timing_logger = logging.getLogger(__package__ + ".operator_timing")
+timing_logger.propagate = False
+timing_logger.setLevel(logging.INFO)
+
+
+def get_addon_prefs():
+    addon = bpy.context.preferences.addons.get(__package__)
+    if addon is None:
+        return None
+    return addon.preferences
+
+
+def get_timing_log_path():
+    """
+    Returns:
+        str: Path of the JSON lines log, in the user folder of the addon.
+    """
+    folder = None
+    if bpy.app.version >= (4, 2, 0):
+        try:
+            folder = bpy.utils.extension_path_user(__package__, path="logs", create=True)
+        except ValueError:
+            # Legacy addon installed in the scripts folder, not an extension
+            folder = None
+    if folder is None:
+        folder = bpy.utils.user_resource('CONFIG', path=os.path.join(__package__, "logs"), create=True)
+    if not folder:
+        folder = os.path.join(bpy.app.tempdir, __package__, "logs")
+    return os.path.join(folder, "operator_timing.jsonl")
+
+
+def close_timing_log():
+    for handler in timing_logger.handlers[:]:
+        timing_logger.removeHandler(handler)
+        handler.close()
+
+
+def open_timing_log(max_size_kb=1024, backup_count=3):
+    close_timing_log()
+    handler = logging.handlers.RotatingFileHandler(
+        get_timing_log_path(),
+        maxBytes=max_size_kb * 1024,
+        backupCount=backup_count,
+        encoding="utf-8",
+        delay=True,
+        )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    timing_logger.addHandler(handler)
+
+
+def update_timing_settings(addon_prefs=None, context=None):
+    """
+    Applies the timing preferences, also used as update callback of the preferences properties.
+    """
+    global timing_enabled
+    global timing_key_counts_enabled
+
+    if addon_prefs is None:
+        addon_prefs = get_addon_prefs()
+    if addon_prefs is None:
+        return
+
+    bpl.profiler.set_profiling_enabled(addon_prefs.use_profiler, addon_prefs.use_profiler_events)
+    timing_enabled = addon_prefs.use_operator_timing
+    timing_key_counts_enabled = addon_prefs.use_operator_timing_key_counts
+    if timing_enabled:
+        open_timing_log(addon_prefs.operator_timing_log_size, addon_prefs.operator_timing_log_backups)
+        wrap_timed_functions()
+    else:
+        unwrap_timed_functions()
+        close_timing_log()
+
+
+def get_context_sizes(context, use_key_counts=False) -> dict:
+    """
+    Returns:
+        dict: Size of the data an operator works on: channels of the graph editor,
+              F-Curves of the active action and its keys when use_key_counts is True.
+    """
+    sizes = {}
+    editable_fcurves = getattr(context, "editable_fcurves", None)
+    if editable_fcurves is not None:
+        sizes["channels"] = len(editable_fcurves)
+    obj = getattr(context, "active_object", None)
+    if obj is not None and obj.animation_data is not None and obj.animation_data.action is not None:
+        fcurves = obj.animation_data.action.fcurves
+        sizes["action_fcurves"] = len(fcurves)
+        if use_key_counts:
+            sizes["action_keys"] = sum(len(fcurve.keyframe_points) for fcurve in fcurves)
+    return sizes
+
+
+def add_timing(name, duration, result=None, sizes=None, functions=None):
+    """
+    Adds the duration of an operator to the session statistics and writes one record to the log.
+
+    Args:
+        name (str): Operator idname.
+        duration (float): Duration in seconds.
+        result (set): Result of the operator.
+        sizes (dict): Sizes of the processed data, written in the record.
+        functions (dict): Function name -> [count, total duration] of the timed functions called by the operator.
+    """
+    session_durations[name].append(duration)
+    record = {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "operator": name,
+        "duration": round(duration, 6),
+    }
+    if result is not None:
+        record["result"] = sorted(result) if isinstance(result, set) else str(result)
+    if sizes:
+        record.update(sizes)
+    if functions:
+        record["functions"] = {
+            function_name: [count, round(total, 6)] for function_name, (count, total) in functions.items()
+        }
+    timing_logger.info(json.dumps(record))
+
+
+def timed_operator(cls):
+    """
+    Class decorator for operators: when timing is enabled, the execute duration
+    is logged with the sizes of the context and added to the session statistics.
+    When the profiler is enabled, execute is the root stage of the profiled stages.
+    """
+    execute = cls.execute
+
+    def run_execute(self, context):
+        global operator_function_timings
+
+        if not timing_enabled:
+            return execute(self, context)
+        # Sizes before execute: the input of the operator.
+        sizes = get_context_sizes(context, timing_key_counts_enabled)
+        parent_function_timings = operator_function_timings
+        operator_function_timings = {}
+        timer = bpl.utils.CounterTimer()
+        try:
+            result = execute(self, context)
+        finally:
+            function_timings = operator_function_timings
+            operator_function_timings = parent_function_timings
+        add_timing(cls.bl_idname, timer.get_time(), result, sizes, function_timings)
+        return result
+
+    @functools.wraps(execute)
+    def timed_execute(self, context):
+        with bpl.profiler.profile(cls.bl_idname):
+            return run_execute(self, context)
+
+    cls.execute = timed_execute
+    return cls
+
+
+def get_timed_function(function, name):
+    @functools.wraps(function)
+    def timed_function(*args, **kwargs):
+        timer = bpl.utils.CounterTimer()
+        result = function(*args, **kwargs)
+        duration = timer.get_time()
+        session_durations[name].append(duration)
+        # Summed in the record of the running operator, not written once per call.
+        if operator_function_timings is not None:
+            timing = operator_function_timings.setdefault(name, [0, 0.0])
+            timing[0] += 1
+            timing[1] += duration
+        return result
+    return timed_function
+
+
+def wrap_timed_functions():
+    for module, function_name in TIMED_FUNCTIONS:
+        if (module, function_name) in original_functions:
+            continue
+        function = getattr(module, function_name)
+        original_functions[(module, function_name)] = function
+        name = f"{module.__name__.rsplit('.', 1)[-1]}.{function_name}"
+        setattr(module, function_name, get_timed_function(function, name))
+
+
+def unwrap_timed_functions():
+    for (module, function_name), function in original_functions.items():
+        setattr(module, function_name, function)
+    original_functions.clear()
+
+
+def get_session_stats():
+    """
+    Returns:
+        list: (operator idname or function name, count, p50, p95) for each timed operator and function,
+              slowest p95 first.
+    """
+    stats = []
+    for operator_idname, durations in session_durations.items():
+        stats.append((
+            operator_idname,
+            len(durations),
+            bpl.profiler.get_percentile(durations, 50),
+            bpl.profiler.get_percentile(durations, 95),
+        ))
+    stats.sort(key=lambda stat: stat[3], reverse=True)
+    return stats
+
+
+class GCF_PT_OperatorTiming(bpy.types.Panel):
+    # Operator timing statistics, visible when enabled in the addon preferences
+
+    bl_idname = "GCF_PT_OperatorTiming"
+    bl_label = "Operator Timing"
+    bl_space_type = "GRAPH_EDITOR"
+    bl_region_type = "UI"
+    bl_category = "Curbe Filter"
+    bl_parent_id = "GCF_PT_GraphCurveFilter"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return timing_enabled or bpl.profiler.default_profiler.enabled
+
+    def draw(self, context):
+        layout = self.layout
+        if bpl.profiler.default_profiler.enabled:
+            row = layout.row()
+            row.operator("object.gcf_export_profile", icon="EXPORT")
+            row.operator("object.gcf_reset_profile", icon="TRASH")
+        if not timing_enabled:
+            return
+
+        stats = get_session_stats()
+        if not stats:
+            layout.label(text="No operator timed in this session.")
+            return
+
+        grid = layout.grid_flow(row_major=True, columns=4, even_columns=False, align=True)
+        for title in ("Operator", "Count", "p50", "p95"):
+            grid.label(text=title)
+        for operator_idname, count, p50, p95 in stats:
+            grid.label(text=operator_idname.split(".")[-1])
+            grid.label(text=str(count))
+            grid.label(text=f"{p50 * 1000:.1f} ms")
+            grid.label(text=f"{p95 * 1000:.1f} ms")
+        layout.operator("object.gcf_clear_operator_timing", icon="TRASH")
+
+
+class GCF_OT_ClearOperatorTiming(Operator):
+    bl_label = "Clear Timing"
+    bl_idname = "object.gcf_clear_operator_timing"
+    bl_description = "Clear the operator timing statistics of this session (the log file is kept)"
+
+    def execute(self, context):
+        session_durations.clear()
+        return {'FINISHED'}
+
+
+class GCF_OT_ExportProfile(Operator):
+    bl_label = "Export Profile"
+    bl_idname = "object.gcf_export_profile"
+    bl_description = "Write the profiled stages to a JSON file, as a stage tree or as a Chrome trace"
+
+    filepath: StringProperty(
+        name="File Path",
+        subtype='FILE_PATH',
+        )
+
+    filter_glob: StringProperty(
+        default="*.json",
+        options={'HIDDEN'},
+        )
+
+    export_format: EnumProperty(
+        name="Format",
+        items=[
+            ('TREE', "Stage Tree", "Count, total, self time and percentiles of each stage"),
+            ('CHROME_TRACE', "Chrome Trace", "Recorded events for chrome://tracing or Perfetto"),
+        ],
+        default='TREE',
+        )
+
+    @classmethod
+    def poll(cls, context):
+        return bpl.profiler.default_profiler.enabled
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = "graph_curve_filter_profile.json"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        profiler = bpl.profiler.default_profiler
+        filepath = bpy.path.abspath(self.filepath)
+        if self.export_format == 'CHROME_TRACE':
+            if not profiler.record_events:
+                self.report({'WARNING'}, "Enable Record Trace Events in the addon preferences.")
+                return {'CANCELLED'}
+            profiler.export_chrome_trace(filepath)
+        else:
+            profiler.export_json(filepath)
+        profiler.print_tree()
+        self.report({'INFO'}, f"Profile exported to {filepath}.")
+        return {'FINISHED'}
+
+
+class GCF_OT_ResetProfile(Operator):
+    bl_label = "Reset Profile"
+    bl_idname = "object.gcf_reset_profile"
+    bl_description = "Clear the profiled stages and trace events"
+
+    def execute(self, context):
+        bpl.profiler.default_profiler.reset()
+        return {'FINISHED'}
+
+
+classes = (
+    GCF_PT_OperatorTiming,
+    GCF_OT_ClearOperatorTiming,
+    GCF_OT_ExportProfile,
+    GCF_OT_ResetProfile,
+)
+
+
+def register():
+    from bpy.utils import register_class
+
+    for cls in classes:
+        register_class(cls)
+
+    update_timing_settings()
+
+
+def unregister():
+    from bpy.utils import unregister_class
+
+    global timing_enabled
+    timing_enabled = False
+    bpl.profiler.set_profiling_enabled(False)
+    unwrap_timed_functions()
+    close_timing_log()
+
+    for cls in reversed(classes):
+        unregister_class(cls)
@@ -0,0 +1,209 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+import bpy
+import time
+
+from bpy.types import (
+        Operator,
+        )
+
+
+# Tasks currently executed by the timer, the first one drives the progress cursor.
+running_tasks = []
+
+# Seconds of work per timer tick, the interface stays responsive between ticks.
+DEFAULT_TIME_BUDGET = 0.02
+TICK_INTERVAL = 0.01
+
+
+def push_undo_step(message: str):
+    """
+    Pushes an undo step for work done outside of an operator with the UNDO option.
+    """
+    try:
+        bpy.ops.ed.undo_push(message=message)
+    except RuntimeError:
+        pass
+
+
+class TimerTask():
+    """
+    Runs a generator in small chunks from a bpy.app.timers callback.
+
+    The generator does one unit of work per iteration and yields its progress (0.0 to 1.0).
+    Each timer tick resumes the generator until the time budget is used,
+    then gives the hand back to Blender so the user can keep working.
+    """
+
+    def __init__(self, generator, label="Task", time_budget=DEFAULT_TIME_BUDGET, on_finish=None, undo_push=True):
+        self.generator = generator
+        self.label = label
+        self.time_budget = time_budget
+        self.on_finish = on_finish
+        self.undo_push = undo_push
+        self.progress = 0.0
+        self.cancelled = False
+        self.start_time = 0.0
+
+    def start(self):
+        if not running_tasks:
+            begin_progress()
+        running_tasks.append(self)
+        self.start_time = time.perf_counter()
+        bpy.app.timers.register(self.timer_update, first_interval=TICK_INTERVAL)
+
+    def timer_update(self):
+        if self not in running_tasks:
+            return None
+
+        tick_end = time.perf_counter() + self.time_budget
+        try:
+            while time.perf_counter() < tick_end:
+                progress = next(self.generator)
+                if progress is not None:
+                    self.progress = progress
+        except StopIteration:
+            self.finish()
+            return None
+        except Exception as e:
+            print(f"{self.label}: failed: {e}")
+            self.finish()
+            return None
+
+        update_progress()
+        tag_graph_editors_redraw()
+        return TICK_INTERVAL
+
+    def finish(self):
+        if self in running_tasks:
+            running_tasks.remove(self)
+        if not running_tasks:
+            end_progress()
+        tag_graph_editors_redraw()
+
+        duration = time.perf_counter() - self.start_time
+        state = "cancelled" if self.cancelled else "done"
+        print(f"{self.label}: {state} in {duration:.2f}s.")
+
+        if self.on_finish is not None:
+            self.on_finish(self)
+        if self.undo_push:
+            push_undo_step(self.label)
+
+    def cancel(self):
+        # The work done by the previous chunks is kept.
+        if self not in running_tasks:
+            return
+        self.cancelled = True
+        self.generator.close()
+        self.finish()
+
+
+def begin_progress():
+    window_manager = bpy.context.window_manager
+    if window_manager is not None:
+        window_manager.progress_begin(0, 100)
+
+
+def update_progress():
+    window_manager = bpy.context.window_manager
+    if window_manager is not None and running_tasks:
+        window_manager.progress_update(int(running_tasks[0].progress * 100))
+
+
+def end_progress():
+    window_manager = bpy.context.window_manager
+    if window_manager is not None:
+        window_manager.progress_end()
+
+
+def tag_graph_editors_redraw():
+    window_manager = bpy.context.window_manager
+    if window_manager is None:
+        return
+    for window in window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'GRAPH_EDITOR':
+                area.tag_redraw()
+
+
+def iter_chunks(items, process_item):
+    """
+    Generator for a TimerTask: calls process_item on each item and yields the progress.
+    """
+    count = len(items)
+    for index, item in enumerate(items):
+        process_item(item)
+        yield (index + 1) / count
+
+
+def start_timer_task(
+        generator,
+        label="Task",
+        time_budget=DEFAULT_TIME_BUDGET,
+        on_finish=None,
+        undo_push=True,
+        ) -> TimerTask:
+    """
+    Starts a generator as a TimerTask, see TimerTask.
+    """
+    task = TimerTask(generator, label, time_budget, on_finish, undo_push)
+    task.start()
+    return task
+
+
+def cancel_timer_tasks():
+    for task in running_tasks[:]:
+        task.cancel()
+
+
+class GCF_OT_CancelTimerTasks(Operator):
+    bl_label = "Cancel Tasks"
+    bl_idname = "object.gcf_cancel_timer_tasks"
+    bl_description = "Stop the running curve tasks, the curves already processed are kept"
+
+    @classmethod
+    def poll(cls, context):
+        return len(running_tasks) > 0
+
+    def execute(self, context):
+        task_count = len(running_tasks)
+        cancel_timer_tasks()
+        self.report({'INFO'}, f"{task_count} task(s) cancelled.")
+        return {'FINISHED'}
+
+
+classes = (
+    GCF_OT_CancelTimerTasks,
+)
+
+
+def register():
+    from bpy.utils import register_class
+
+    for cls in classes:
+        register_class(cls)
+
+
+def unregister():
+    from bpy.utils import unregister_class
+
+    cancel_timer_tasks()
+    for cls in reversed(classes):
+        unregister_class(cls)
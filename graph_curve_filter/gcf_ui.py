@@ -27,6 +27,9 @@ from .gcf_basics import *
 from . import gcf_utils
 from .gcf_utils import *
 from . import gcf_ui_utils
+from . import gcf_timer_tasks
+from . import gcf_operator_timing
+from . import gcf_filter_buttons
 from . import languages
 from .languages import *
 
@@ -39,6 +42,12 @@ if "bpy" in locals():
         importlib.reload(gcf_utils)
     if "gcf_ui_utils" in locals():
         importlib.reload(gcf_ui_utils)
+    if "gcf_timer_tasks" in locals():
+        importlib.reload(gcf_timer_tasks)
+    if "gcf_operator_timing" in locals():
+        importlib.reload(gcf_operator_timing)
+    if "gcf_filter_buttons" in locals():
+        importlib.reload(gcf_filter_buttons)
     if "languages" in locals():
         importlib.reload(languages)
 
@@ -80,6 +89,7 @@ class GCF_PT_GraphCurveFilter(bpy.types.Panel):
                 )
             return {'FINISHED'}
 
+    @gcf_operator_timing.timed_operator
     class GCF_OT_FilterSet(Operator):
         bl_label = "My Filter"
         bl_idname = "object.gcf_filter_set"
@@ -94,21 +104,13 @@ class GCF_PT_GraphCurveFilter(bpy.types.Panel):
             print(self.filter_name)
             return {'FINISHED'}
 
-    def draw(self, contex):
-        scene = bpy.context.scene
-        obj = bpy.context.object
-        addon_prefs = bpy.context.preferences.addons[__package__].preferences
+    def draw(self, context):
         layout = self.layout
-
-        # Extension details
-        if bpy.app.version >= (4, 2, 0):
-            version_str = 'Version '+ str(bbpl.blender_extension.extension_utils.get_package_version())
-        else:
-            version_str = 'Version '+ bbpl.blender_addon.addon_utils.get_addon_version_str("Unreal Engine Assets Exporter")
+        filter_layout = gcf_filter_buttons.get_filter_layout()
 
         credit_box = layout.box()
         credit_box.label(text=languages.ti('intro'))
-        credit_box.label(text=version_str)
+        credit_box.label(text=filter_layout.version_str)
         bbpl.blender_layout.layout_doc_button.functions.add_doc_page_operator(
             layout = layout,
             url = "https://github.com/xavier150/Blender-For-UnrealEngine-Addons",
@@ -116,44 +118,33 @@ class GCF_PT_GraphCurveFilter(bpy.types.Panel):
             icon="HELP"
             )
 
-        def AddFilter(layout, filter_name: str, visual_text: str, full_text: str):
-            new_filter = layout.operator("object.gcf_filter_set", text=visual_text)
-            new_filter.filter_name = filter_name
-
-        filter_group_transform = layout.box()
-
-        loc_filter = filter_group_transform.row()
-        AddFilter(loc_filter, "Location", "Loc", "Location")
-        AddFilter(loc_filter, "X Location", "X", "X Location")
-        AddFilter(loc_filter, "Y Location", "Y", "Y Location")
-        AddFilter(loc_filter, "Z Location", "Z", "Z Location")
-
-        euler_filter = filter_group_transform.row()
-        AddFilter(euler_filter, "Euler", "Euler", "Euler")
-        AddFilter(euler_filter, "X Euler", "X", "X Euler")
-        AddFilter(euler_filter, "Y Euler", "Y", "Y Euler")
-        AddFilter(euler_filter, "Z Euler", "Z", "Z Euler")
-
-        scale_filter = filter_group_transform.row()
-        AddFilter(scale_filter, "Scale", "Scale", "Scale")
-        AddFilter(scale_filter, "X Scale", "X", "X Scale")
-        AddFilter(scale_filter, "Y Scale", "Y", "Y Scale")
-        AddFilter(scale_filter, "Z Scale", "Z", "Z Scale")
-
-        filter_group_quat = layout.box()
-
-        quat_filter = filter_group_quat.row()
-        AddFilter(quat_filter, "Quaternion", "Quat", "Quaternion")
-        AddFilter(quat_filter, "W Quaternion", "W", "W Quaternion")
-        AddFilter(quat_filter, "X Quaternion", "X", "X Quaternion")
-        AddFilter(quat_filter, "Y Quaternion", "Y", "Y Quaternion")
-        AddFilter(quat_filter, "Z Quaternion", "Z", "Z Quaternion")
-
-        filter_group_all = layout.box()
-
-        all_filter = filter_group_all.row()
-        AddFilter(all_filter, "", "ALL", "ALL")
-        AddFilter(all_filter, "XOXOXOXOXOXOXO", "NONE", "NONE")
+        for box_rows in filter_layout.boxes:
+            filter_box = layout.box()
+            for row_buttons in box_rows:
+                filter_row = filter_box.row()
+                for token, label in row_buttons:
+                    filter_row.operator("object.gcf_filter_set", text=label).filter_name = token
+
+        curve_tools = layout.box()
+
+        decimate_row = curve_tools.row()
+        decimate = decimate_row.operator("object.gcf_decimate_curves", text="Decimate")
+        decimate.mode = 'ERROR'
+        decimate_lossless = decimate_row.operator("object.gcf_decimate_curves", text="Lossless")
+        decimate_lossless.mode = 'LOSSLESS'
+
+        resample_row = curve_tools.row()
+        resample_row.operator("object.gcf_resample_curves", text="Resample")
+        resample_row.operator("object.gcf_remove_static_curves", text="Remove Static")
+        cleanup_row = curve_tools.row()
+        cleanup_row.operator("object.gcf_remove_orphan_curves", text="Remove Orphans")
+        cleanup_row.operator("object.gcf_find_duplicate_curves", text="Find Duplicates")
+
+        if gcf_timer_tasks.running_tasks:
+            task_box = layout.box()
+            for task in gcf_timer_tasks.running_tasks:
+                task_box.label(text=f"{task.label}: {int(task.progress * 100)}%", icon="SORTTIME")
+            task_box.operator("object.gcf_cancel_timer_tasks", icon="CANCEL")
 
 
 classes = (
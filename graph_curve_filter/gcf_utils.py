@@ -28,6 +28,7 @@ if "bpy" in locals():
     import importlib
     if "gcf_basics" in locals():
         importlib.reload(gcf_basics)
+from . import bpl
 from . import gcf_basics
 from .gcf_basics import *
 
@@ -263,16 +264,14 @@ def SafeModeSet(target_mode='OBJECT', obj=None):
     return False
 
 
-class CounterTimer():
-
-    def __init__(self):
-        self.start = time.perf_counter()
+class CounterTimer(bpl.utils.CounterTimer):
+    # Legacy names of bpl.utils.CounterTimer.
 
     def ResetTime(self):
-        self.start = time.perf_counter()
+        self.reset_time()
 
     def GetTime(self):
-        return time.perf_counter()-self.start
+        return self.get_time()
 
 
 def update_progress(job_title, progress, time=None):
@@ -35,6 +35,7 @@ def UpdateDict(local, tooltips=True, interface=True, new_data=True):
 
 
 def InitLanguages(locale):
+    global current_language
     prefs = bpy.context.preferences
     view = prefs.view
 
@@ -0,0 +1,31 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# Tests of the bpy-free modules, run with a plain Python: python -m pytest tests
+# The addon package imports bpy at package level, so the fake bpy of the benchmarks is installed first.
+
+import os
+import sys
+
+tests_path = os.path.dirname(os.path.abspath(__file__))
+root_path = os.path.dirname(tests_path)
+sys.path.insert(0, os.path.join(root_path, "benchmarks"))
+sys.path.insert(0, root_path)
+
+import fake_bpy
+fake_bpy.install()
@@ -0,0 +1,77 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+
+import os
+from graph_curve_filter.bbam import build_cache
+
+
+BUILD_NAME = "default"
+
+
+def new_manifest_data(exclude_paths=()):
+    # A generate method without generated text, only the files and the configuration are hashed.
+    return {"builds": {BUILD_NAME: {"generate_method": "NONE", "exclude_paths": list(exclude_paths)}}}
+
+
+def write_file(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(text)
+
+
+def test_cache_round_trip(tmp_path):
+    addon_path = str(tmp_path / "addon")
+    assert build_cache.load_build_cache(addon_path) == {}
+    build_cache.save_build_cache(addon_path, {BUILD_NAME: {"hash": "abc"}})
+    assert build_cache.load_build_cache(addon_path) == {BUILD_NAME: {"hash": "abc"}}
+
+
+def test_unreadable_cache(tmp_path):
+    addon_path = str(tmp_path / "addon")
+    write_file(build_cache.get_build_cache_path(addon_path), "{not json")
+    assert build_cache.load_build_cache(addon_path) == {}
+
+
+def test_cached_build_file(tmp_path):
+    zip_file = str(tmp_path / "build.zip")
+    cache = {BUILD_NAME: {"hash": "abc", "zip_file": zip_file}}
+    # The file was removed since
+    assert build_cache.get_cached_build_file(cache, BUILD_NAME, "abc") is None
+    write_file(zip_file, "zip")
+    assert build_cache.get_cached_build_file(cache, BUILD_NAME, "abc") == zip_file
+    assert build_cache.get_cached_build_file(cache, BUILD_NAME, "other") is None
+    assert build_cache.get_cached_build_file(cache, "other_build", "abc") is None
+
+
+def test_build_hash_follows_included_files(tmp_path):
+    addon_path = str(tmp_path / "addon")
+    write_file(os.path.join(addon_path, "__init__.py"), "bl_info = {}")
+    write_file(os.path.join(addon_path, "docs", "notes.md"), "notes")
+    manifest_data = new_manifest_data(["docs/"])
+    build_hash = build_cache.get_build_hash(addon_path, manifest_data, BUILD_NAME)
+
+    # Excluded files and python caches do not change the hash
+    write_file(os.path.join(addon_path, "docs", "notes.md"), "new notes")
+    write_file(os.path.join(addon_path, "__pycache__", "module.pyc"), "cache")
+    assert build_cache.get_build_hash(addon_path, manifest_data, BUILD_NAME) == build_hash
+
+    write_file(os.path.join(addon_path, "__init__.py"), "bl_info = {'name': 'Addon'}")
+    assert build_cache.get_build_hash(addon_path, manifest_data, BUILD_NAME) != build_hash
+    # The build configuration is part of the hash
+    assert build_cache.get_build_hash(addon_path, new_manifest_data(), BUILD_NAME) != build_hash
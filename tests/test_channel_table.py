@@ -0,0 +1,87 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+
+import fake_bpy
+from graph_curve_filter.bbpl import channel_table
+from graph_curve_filter.bbpl.channel_table import ChannelPath
+
+
+def test_parse_bone_channels():
+    assert channel_table.parse_data_path('pose.bones["Arm.L"].location') == ChannelPath(
+        channel_table.OWNER_BONE, "Arm.L", "location")
+    assert channel_table.parse_data_path('pose.bones["Arm"]["weight"]') == ChannelPath(
+        channel_table.OWNER_BONE, "Arm", '["weight"]')
+
+
+def test_parse_escaped_quotes():
+    data_path = 'pose.bones["Say \\"Hi\\""].rotation_euler'
+    assert channel_table.parse_data_path(data_path) == ChannelPath(
+        channel_table.OWNER_BONE, 'Say "Hi"', "rotation_euler")
+    data_path = 'pose.bones["back\\\\slash"].scale'
+    assert channel_table.parse_data_path(data_path).owner_name == "back\\slash"
+    assert channel_table.parse_data_path('["my \\"prop\\""]') == ChannelPath(
+        channel_table.OWNER_CUSTOM_PROPERTY, 'my "prop"', 'my "prop"')
+
+
+def test_parse_other_owners():
+    assert channel_table.parse_data_path('key_blocks["Smile"].value') == ChannelPath(
+        channel_table.OWNER_SHAPE_KEY, "Smile", "value")
+    assert channel_table.parse_data_path("location") == ChannelPath(channel_table.OWNER_OBJECT, "", "location")
+
+
+def new_action(data_paths):
+    action = fake_bpy.Action("action")
+    for data_path, array_index in data_paths:
+        action.fcurves.new(data_path, index=array_index)
+    return action
+
+
+def test_table_columns():
+    action = new_action([('pose.bones["A"].location', 0), ('pose.bones["B"].scale', 2), ("location", 1)])
+    table = channel_table.ChannelTable(action.fcurves)
+    assert len(table) == 3
+    assert table.array_indices == [0, 2, 1]
+    assert table.bone_name_column == ["A", "B", None]
+    assert table.get_bone_names() == {"A", "B"}
+    assert table.get_orphan_bone_rows({"A"}) == [1]
+
+
+def test_table_cache_follows_the_action():
+    channel_table.clear_channel_table()
+    action = new_action([('pose.bones["A"].location', 0), ('pose.bones["A"].location', 1)])
+    table = channel_table.get_channel_table(action)
+    # A renamed action keeps its table
+    action.name = "renamed"
+    assert channel_table.get_channel_table(action) is table
+    # Same F-Curve count, new data path or order: the table is kept until the writer clears it
+    action.fcurves[0].data_path = 'pose.bones["B"].location'
+    assert channel_table.get_channel_table(action) is table
+    assert not table.matches(action.fcurves)
+    channel_table.clear_channel_table(action)
+    new_table = channel_table.get_channel_table(action)
+    assert new_table is not table
+    assert new_table.bone_name_column == ["B", "A"]
+    # A new F-Curve parses the table again
+    action.fcurves.new('pose.bones["C"].scale', index=0)
+    assert channel_table.get_channel_table(action).bone_name_column == ["B", "A", "C"]
+    # Two actions with the same name have their own tables
+    other_action = new_action([("location", 0)])
+    other_action.name = action.name
+    assert channel_table.get_channel_table(other_action).data_paths == ["location"]
+    channel_table.clear_channel_table()
@@ -0,0 +1,102 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+
+import types
+import fake_bpy
+from graph_curve_filter import gcf_derivative_filter
+
+
+def new_action(curve_values):
+    # One linear F-Curve per value list, one key per frame.
+    action = fake_bpy.Action("action")
+    for index, values in enumerate(curve_values):
+        fcurve = action.fcurves.new("location", index=index)
+        for frame, value in enumerate(values):
+            fcurve.keyframe_points.insert(float(frame), value).interpolation = 'LINEAR'
+    return action
+
+
+def new_settings(mode='VELOCITY', velocity_threshold=1.0, acceleration_threshold=1.0):
+    return types.SimpleNamespace(
+        mode=mode,
+        velocity_threshold=velocity_threshold,
+        acceleration_threshold=acceleration_threshold,
+        frame_step=1.0,
+    )
+
+
+def get_hide_values(action):
+    return [fcurve.hide for fcurve in action.fcurves]
+
+
+def test_hide_values_by_mode():
+    # Flat, steady ramp of 2 per frame, single jump of 2 in one frame
+    action = new_action([[0.0, 0.0, 0.0], [0.0, 2.0, 4.0], [0.0, 0.0, 2.0]])
+    stats = gcf_derivative_filter.get_action_curve_stats(action)
+    hide_values = gcf_derivative_filter.get_derivative_hide_values(stats, 'VELOCITY', 1.0, 1.0)
+    assert hide_values.tolist() == [True, False, False]
+    hide_values = gcf_derivative_filter.get_derivative_hide_values(stats, 'ACCELERATION', 1.0, 1.0)
+    assert hide_values.tolist() == [True, True, False]
+    hide_values = gcf_derivative_filter.get_derivative_hide_values(stats, 'ANY', 3.0, 1.0)
+    assert hide_values.tolist() == [True, True, False]
+    gcf_derivative_filter.clear_action_curve_stats()
+
+
+def test_stats_cache():
+    action = new_action([[0.0, 1.0], [0.0, 0.0]])
+    stats = gcf_derivative_filter.get_action_curve_stats(action)
+    # Moving a key keeps the stats until they are cleared
+    action.fcurves[1].keyframe_points[1].co[1] = 5.0
+    assert gcf_derivative_filter.get_action_curve_stats(action) is stats
+    assert gcf_derivative_filter.get_action_curve_stats(action, frame_step=0.5) is not stats
+    gcf_derivative_filter.clear_action_curve_stats(action)
+    assert gcf_derivative_filter.get_action_curve_stats(action).value_max.tolist() == [1.0, 5.0]
+    # A new F-Curve computes the stats again
+    action.fcurves.new("scale")
+    assert len(gcf_derivative_filter.get_action_curve_stats(action).key_counts) == 3
+    gcf_derivative_filter.clear_action_curve_stats()
+
+
+def test_restore_hide_flags():
+    action = new_action([[0.0, 0.0], [0.0, 4.0], [0.0, 0.0]])
+    action.fcurves[2].hide = True
+    visible_count = gcf_derivative_filter.filter_action_derivatives(action, new_settings())
+    assert visible_count == 1
+    assert get_hide_values(action) == [True, False, True]
+    assert action.as_pointer() in gcf_derivative_filter.hide_only_updates
+    # Moving the threshold keeps the flags saved before the first filter
+    gcf_derivative_filter.filter_action_derivatives(action, new_settings(velocity_threshold=10.0))
+    assert get_hide_values(action) == [True, True, True]
+    gcf_derivative_filter.restore_hide_states([action])
+    assert get_hide_values(action) == [False, False, True]
+    assert not gcf_derivative_filter.saved_hide_states
+    gcf_derivative_filter.clear_action_curve_stats()
+    gcf_derivative_filter.hide_only_updates.clear()
+
+
+def test_restore_after_channel_change():
+    action = new_action([[0.0, 0.0], [0.0, 4.0]])
+    action.fcurves[0].hide = True
+    gcf_derivative_filter.filter_action_derivatives(action, new_settings())
+    action.fcurves[0].data_path = "scale"
+    # The saved flags belong to other channels, all the curves are shown
+    gcf_derivative_filter.restore_hide_states([action])
+    assert get_hide_values(action) == [False, False]
+    gcf_derivative_filter.clear_action_curve_stats()
+    gcf_derivative_filter.hide_only_updates.clear()
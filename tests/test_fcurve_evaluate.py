@@ -0,0 +1,191 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# Evaluator values against the results of Blender (FCurve.evaluate) on a segment
+# from (0, 0) to (10, 10): the easing values are at frame 5, with the default
+# back, amplitude and period of new keys.
+
+import math
+import numpy
+import pytest
+from graph_curve_filter.bbpl import fcurve_keys
+from graph_curve_filter.bbpl import fcurve_evaluate
+
+
+def new_keys(points, interpolation=fcurve_keys.INTERPOLATION_LINEAR, easing=fcurve_keys.EASING_AUTO):
+    packed_keys = fcurve_keys.new_packed_keys(len(points))
+    packed_keys["co"][:] = points
+    packed_keys["handle_left"][:] = points
+    packed_keys["handle_right"][:] = points
+    packed_keys["interpolation"][:] = interpolation
+    packed_keys["easing"][:] = easing
+    packed_keys["back"][:] = fcurve_keys.DEFAULT_BACK
+    packed_keys["amplitude"][:] = fcurve_keys.DEFAULT_AMPLITUDE
+    packed_keys["period"][:] = fcurve_keys.DEFAULT_PERIOD
+    return packed_keys
+
+
+def evaluate(packed_keys, frames, extrapolation=fcurve_keys.EXTRAPOLATION_CONSTANT):
+    return fcurve_evaluate.evaluate_packed_keys(packed_keys, numpy.array(frames, dtype=float), extrapolation)
+
+
+SEGMENT = [(0.0, 0.0), (10.0, 10.0)]
+
+EXPO_IN = 10.0 * (2.0 ** -5 - 2.0 ** -10) / (1.0 - 2.0 ** -10)
+
+EASING_VALUES = [
+    (fcurve_keys.INTERPOLATION_QUAD, fcurve_keys.EASING_IN, 2.5),
+    (fcurve_keys.INTERPOLATION_QUAD, fcurve_keys.EASING_OUT, 7.5),
+    (fcurve_keys.INTERPOLATION_QUAD, fcurve_keys.EASING_IN_OUT, 5.0),
+    (fcurve_keys.INTERPOLATION_CUBIC, fcurve_keys.EASING_IN, 1.25),
+    (fcurve_keys.INTERPOLATION_CUBIC, fcurve_keys.EASING_OUT, 8.75),
+    (fcurve_keys.INTERPOLATION_CUBIC, fcurve_keys.EASING_IN_OUT, 5.0),
+    (fcurve_keys.INTERPOLATION_QUART, fcurve_keys.EASING_IN, 0.625),
+    (fcurve_keys.INTERPOLATION_QUART, fcurve_keys.EASING_OUT, 9.375),
+    (fcurve_keys.INTERPOLATION_QUINT, fcurve_keys.EASING_IN, 0.3125),
+    (fcurve_keys.INTERPOLATION_QUINT, fcurve_keys.EASING_OUT, 9.6875),
+    (fcurve_keys.INTERPOLATION_SINE, fcurve_keys.EASING_IN, 10.0 * (1.0 - math.cos(math.pi / 4.0))),
+    (fcurve_keys.INTERPOLATION_SINE, fcurve_keys.EASING_OUT, 10.0 * math.sin(math.pi / 4.0)),
+    (fcurve_keys.INTERPOLATION_SINE, fcurve_keys.EASING_IN_OUT, 5.0),
+    (fcurve_keys.INTERPOLATION_CIRC, fcurve_keys.EASING_IN, 10.0 * (1.0 - math.sqrt(0.75))),
+    (fcurve_keys.INTERPOLATION_CIRC, fcurve_keys.EASING_OUT, 10.0 * math.sqrt(0.75)),
+    (fcurve_keys.INTERPOLATION_CIRC, fcurve_keys.EASING_IN_OUT, 5.0),
+    (fcurve_keys.INTERPOLATION_EXPO, fcurve_keys.EASING_IN, EXPO_IN),
+    (fcurve_keys.INTERPOLATION_EXPO, fcurve_keys.EASING_OUT, 10.0 - EXPO_IN),
+    (fcurve_keys.INTERPOLATION_EXPO, fcurve_keys.EASING_IN_OUT, 5.0),
+    (fcurve_keys.INTERPOLATION_BACK, fcurve_keys.EASING_IN, -0.876975),
+    (fcurve_keys.INTERPOLATION_BACK, fcurve_keys.EASING_OUT, 10.876975),
+    (fcurve_keys.INTERPOLATION_BACK, fcurve_keys.EASING_IN_OUT, 5.0),
+    (fcurve_keys.INTERPOLATION_BOUNCE, fcurve_keys.EASING_IN, 2.34375),
+    (fcurve_keys.INTERPOLATION_BOUNCE, fcurve_keys.EASING_OUT, 7.65625),
+    (fcurve_keys.INTERPOLATION_BOUNCE, fcurve_keys.EASING_IN_OUT, 5.0),
+    (fcurve_keys.INTERPOLATION_ELASTIC, fcurve_keys.EASING_OUT, 9.995240222270883),
+    # Auto easing: ease in for the polynomial modes, ease out for back, bounce and elastic.
+    (fcurve_keys.INTERPOLATION_QUAD, fcurve_keys.EASING_AUTO, 2.5),
+    (fcurve_keys.INTERPOLATION_BOUNCE, fcurve_keys.EASING_AUTO, 7.65625),
+]
+
+
+@pytest.mark.parametrize("interpolation, easing, expected", EASING_VALUES)
+def test_easing(interpolation, easing, expected):
+    packed_keys = new_keys(SEGMENT, interpolation, easing)
+    values = evaluate(packed_keys, [0.0, 5.0, 10.0])
+    assert values == pytest.approx([0.0, expected, 10.0], abs=1e-5)
+
+
+def test_constant():
+    packed_keys = new_keys(SEGMENT, fcurve_keys.INTERPOLATION_CONSTANT)
+    assert evaluate(packed_keys, [0.0, 5.0, 9.99, 10.0]) == pytest.approx([0.0, 0.0, 0.0, 10.0])
+
+
+def test_linear_near_keys():
+    # Frames near a key are only snapped inside the 0.0001 search threshold.
+    packed_keys = new_keys(SEGMENT, fcurve_keys.INTERPOLATION_LINEAR)
+    values = evaluate(packed_keys, [0.005, 0.00005, 5.0, 9.995, 9.99995])
+    assert values == pytest.approx([0.005, 0.0, 5.0, 9.995, 10.0], abs=1e-9)
+
+
+def get_bezier_reference(frame, points):
+    # Scalar bisection on x(t), the handles of the test do not overlap.
+    def bezier(t, index):
+        u = 1.0 - t
+        weights = (u ** 3, 3 * u * u * t, 3 * u * t * t, t ** 3)
+        return sum(weight * point[index] for weight, point in zip(weights, points))
+    low, high = 0.0, 1.0
+    for _ in range(100):
+        middle = (low + high) * 0.5
+        if bezier(middle, 0) < frame:
+            low = middle
+        else:
+            high = middle
+    return bezier(low, 1)
+
+
+def test_bezier():
+    packed_keys = new_keys(SEGMENT, fcurve_keys.INTERPOLATION_BEZIER)
+    packed_keys["handle_left"][:] = [(-3.0, 0.0), (7.0, 10.0)]
+    packed_keys["handle_right"][:] = [(3.0, 0.0), (13.0, 10.0)]
+    points = [(0.0, 0.0), (3.0, 0.0), (7.0, 10.0), (10.0, 10.0)]
+    frames = [1.0, 2.5, 5.0, 8.0]
+    expected = [get_bezier_reference(frame, points) for frame in frames]
+    assert evaluate(packed_keys, frames) == pytest.approx(expected, abs=1e-5)
+    assert expected[2] == pytest.approx(5.0)
+
+
+def test_bezier_linear_handles():
+    packed_keys = new_keys(SEGMENT, fcurve_keys.INTERPOLATION_BEZIER)
+    packed_keys["handle_left"][:] = [(-10.0 / 3.0, -10.0 / 3.0), (20.0 / 3.0, 20.0 / 3.0)]
+    packed_keys["handle_right"][:] = [(10.0 / 3.0, 10.0 / 3.0), (40.0 / 3.0, 40.0 / 3.0)]
+    assert evaluate(packed_keys, [0.05, 2.5, 7.5]) == pytest.approx([0.05, 2.5, 7.5], abs=1e-4)
+
+
+def test_constant_extrapolation():
+    packed_keys = new_keys(SEGMENT, fcurve_keys.INTERPOLATION_LINEAR)
+    assert evaluate(packed_keys, [-5.0, 15.0]) == pytest.approx([0.0, 10.0])
+
+
+def test_linear_extrapolation_of_linear_keys():
+    # Linear keys extend the slope to the neighbor key.
+    packed_keys = new_keys([(0.0, 0.0), (10.0, 5.0)], fcurve_keys.INTERPOLATION_LINEAR)
+    values = evaluate(packed_keys, [-4.0, 14.0], fcurve_keys.EXTRAPOLATION_LINEAR)
+    assert values == pytest.approx([-2.0, 7.0])
+
+
+def test_linear_extrapolation_of_bezier_keys():
+    # Bezier keys extend the slope of their outer handle.
+    packed_keys = new_keys(SEGMENT, fcurve_keys.INTERPOLATION_BEZIER)
+    packed_keys["handle_left"][:] = [(-2.0, -1.0), (8.0, 10.0)]
+    packed_keys["handle_right"][:] = [(2.0, 1.0), (12.0, 16.0)]
+    values = evaluate(packed_keys, [-4.0, 11.0], fcurve_keys.EXTRAPOLATION_LINEAR)
+    assert values == pytest.approx([-2.0, 13.0])
+
+
+def test_constant_keys_ignore_linear_extrapolation():
+    packed_keys = new_keys(SEGMENT, fcurve_keys.INTERPOLATION_CONSTANT)
+    values = evaluate(packed_keys, [-4.0, 14.0], fcurve_keys.EXTRAPOLATION_LINEAR)
+    assert values == pytest.approx([0.0, 10.0])
+
+
+def test_single_key():
+    packed_keys = new_keys([(3.0, 2.0)])
+    assert evaluate(packed_keys, [0.0, 3.0, 9.0], fcurve_keys.EXTRAPOLATION_LINEAR) == pytest.approx([2.0, 2.0, 2.0])
+
+
+def test_packed_curves_match_single_curves():
+    first = new_keys(SEGMENT, fcurve_keys.INTERPOLATION_LINEAR)
+    second = new_keys([(2.0, 1.0), (4.0, 3.0), (8.0, -1.0)], fcurve_keys.INTERPOLATION_QUAD)
+    curves = fcurve_evaluate.PackedCurves([first, second], [fcurve_keys.EXTRAPOLATION_LINEAR, 0])
+    frames = numpy.linspace(-2.0, 12.0, 29)
+    values = fcurve_evaluate.evaluate_packed_curves(curves, frames)
+    assert values[0] == pytest.approx(evaluate(first, frames, fcurve_keys.EXTRAPOLATION_LINEAR))
+    assert values[1] == pytest.approx(evaluate(second, frames))
+
+
+def test_sample_frames_on_grid():
+    assert fcurve_evaluate.get_sample_frames(0.0, 4.0, 2.0).tolist() == [0.0, 2.0, 4.0]
+    assert fcurve_evaluate.get_sample_frames(0.0, 1.0, 0.1)[-1] == 1.0
+    assert len(fcurve_evaluate.get_sample_frames(0.0, 1.0, 0.1)) == 11
+
+
+def test_sample_frames_keep_fractional_last_key():
+    # The last key is between two grid frames: it is sampled, the resampled curve keeps its value.
+    assert fcurve_evaluate.get_sample_frames(0.0, 4.5, 2.0).tolist() == [0.0, 2.0, 4.0, 4.5]
+    packed_keys = new_keys([(0.0, 0.0), (2.0, 4.0), (4.5, -1.0)])
+    frames = fcurve_evaluate.get_sample_frames(0.0, 4.5, 1.0)
+    resampled_keys = fcurve_keys.new_sampled_packed_keys(frames, evaluate(packed_keys, frames))
+    assert resampled_keys["co"][-1].tolist() == [4.5, -1.0]
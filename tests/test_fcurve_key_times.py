@@ -0,0 +1,87 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+
+import numpy
+from graph_curve_filter.bbpl import fcurve_keys
+from graph_curve_filter.bbpl import fcurve_evaluate
+from graph_curve_filter.bbpl import fcurve_key_times
+
+
+def new_keys(frames, values):
+    packed_keys = fcurve_keys.new_packed_keys(len(frames))
+    packed_keys["co"][:, 0] = frames
+    packed_keys["co"][:, 1] = values
+    return packed_keys
+
+
+def new_index(*keys_list):
+    curves = fcurve_evaluate.PackedCurves(list(keys_list), [fcurve_keys.EXTRAPOLATION_CONSTANT] * len(keys_list))
+    return fcurve_key_times.KeyTimeIndex(curves)
+
+
+def test_curves_with_keys():
+    index = new_index(
+        new_keys([0.0, 10.0], [0.0, 1.0]),
+        new_keys([], []),
+        new_keys([4.0, 5.0, 6.0], [0.0, 0.0, 0.0]),
+        new_keys([20.0], [1.0]),
+    )
+    assert index.get_curves_with_keys(0.0, 3.0).tolist() == [True, False, False, False]
+    assert index.get_curves_with_keys(1.0, 3.0).tolist() == [False, False, False, False]
+    # Range bounds are included
+    assert index.get_curves_with_keys(6.0, 10.0).tolist() == [True, False, True, False]
+    assert index.get_curves_with_keys(-100.0, 100.0).tolist() == [True, False, True, True]
+    assert index.get_curves_with_keys(30.0, 40.0).tolist() == [False, False, False, False]
+
+
+def test_curves_with_changes():
+    index = new_index(
+        new_keys([0.0, 10.0], [0.0, 1.0]),
+        new_keys([0.0, 10.0], [1.0, 1.0]),
+        new_keys([0.0, 5.0, 10.0], [0.0, 0.0, 2.0]),
+        new_keys([], []),
+    )
+    # A range between two keys sees the change of the segment around it.
+    assert index.get_curves_with_changes(2.0, 3.0).tolist() == [True, False, False, False]
+    assert index.get_curves_with_changes(6.0, 7.0).tolist() == [True, False, True, False]
+    assert index.get_curves_with_changes(-5.0, 20.0).tolist() == [True, False, True, False]
+    # Outside of the keys the curves are constant
+    assert index.get_curves_with_changes(11.0, 20.0).tolist() == [False, False, False, False]
+
+
+def test_matches_brute_force():
+    random = numpy.random.default_rng(7)
+    keys_list = []
+    for curve_index in range(30):
+        count = int(random.integers(0, 8))
+        frames = numpy.sort(random.choice(numpy.arange(-20.0, 40.0, 0.5), count, replace=False))
+        keys_list.append(new_keys(frames, random.integers(0, 2, count).astype(float)))
+    index = new_index(*keys_list)
+    for frame_start, frame_end in [(-30.0, -25.0), (-5.0, 2.5), (0.25, 0.75), (10.0, 10.0), (35.0, 60.0)]:
+        expected = [
+            bool(numpy.any((keys["co"][:, 0] >= frame_start) & (keys["co"][:, 0] <= frame_end)))
+            for keys in keys_list
+        ]
+        assert index.get_curves_with_keys(frame_start, frame_end).tolist() == expected
+
+
+def test_no_keys():
+    index = new_index(new_keys([], []), new_keys([], []))
+    assert index.get_curves_with_keys(0.0, 10.0).tolist() == [False, False]
+    assert index.get_curves_with_changes(0.0, 10.0).tolist() == [False, False]
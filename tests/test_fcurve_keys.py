@@ -0,0 +1,58 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+
+import numpy
+from graph_curve_filter.bbpl import fcurve_keys
+
+
+def test_new_packed_keys_shapes():
+    packed_keys = fcurve_keys.new_packed_keys(3)
+    assert set(packed_keys) == set(fcurve_keys.KEYFRAME_ATTRIBUTES)
+    assert packed_keys["co"].shape == (3, 2)
+    assert packed_keys["interpolation"].shape == (3,)
+    assert fcurve_keys.get_packed_keys_count(packed_keys) == 3
+
+
+def test_sampled_keys():
+    packed_keys = fcurve_keys.new_sampled_packed_keys(numpy.array([0.0, 1.0]), numpy.array([2.0, 3.0]))
+    assert packed_keys["co"].tolist() == [[0.0, 2.0], [1.0, 3.0]]
+    assert packed_keys["handle_left"].tolist() == packed_keys["co"].tolist()
+    assert packed_keys["interpolation"].tolist() == [fcurve_keys.INTERPOLATION_LINEAR] * 2
+    assert packed_keys["handle_right_type"].tolist() == [fcurve_keys.HANDLE_AUTO_CLAMPED] * 2
+    assert packed_keys["back"][0] == numpy.float32(fcurve_keys.DEFAULT_BACK)
+
+
+def test_hash():
+    packed_keys = fcurve_keys.new_sampled_packed_keys(numpy.arange(4.0), numpy.arange(4.0))
+    same_keys = {attr: values.copy() for attr, values in packed_keys.items()}
+    assert fcurve_keys.get_packed_keys_hash(packed_keys) == fcurve_keys.get_packed_keys_hash(same_keys)
+    assert fcurve_keys.get_packed_keys_hash(packed_keys) != fcurve_keys.get_packed_keys_hash(
+        packed_keys, fcurve_keys.EXTRAPOLATION_LINEAR)
+    same_keys["easing"][2] = fcurve_keys.EASING_OUT
+    assert fcurve_keys.get_packed_keys_hash(packed_keys) != fcurve_keys.get_packed_keys_hash(same_keys)
+
+
+def test_select_and_concatenate():
+    packed_keys = fcurve_keys.new_sampled_packed_keys(numpy.arange(4.0), numpy.arange(4.0) * 2.0)
+    selected = fcurve_keys.select_packed_keys(packed_keys, numpy.array([True, False, False, True]))
+    assert selected["co"].tolist() == [[0.0, 0.0], [3.0, 6.0]]
+    joined = fcurve_keys.concatenate_packed_keys([selected, packed_keys])
+    assert fcurve_keys.get_packed_keys_count(joined) == 6
+    assert joined["co"][:, 0].tolist() == [0.0, 3.0, 0.0, 1.0, 2.0, 3.0]
+    assert fcurve_keys.get_packed_keys_count(fcurve_keys.concatenate_packed_keys([])) == 0
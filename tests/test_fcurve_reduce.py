@@ -0,0 +1,118 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+
+import numpy
+import pytest
+from graph_curve_filter.bbpl import fcurve_keys
+from graph_curve_filter.bbpl import fcurve_reduce
+from graph_curve_filter.bbpl import fcurve_evaluate
+
+
+def new_keys(frames, values, interpolation=fcurve_keys.INTERPOLATION_LINEAR):
+    packed_keys = fcurve_keys.new_packed_keys(len(frames))
+    packed_keys["co"][:, 0] = frames
+    packed_keys["co"][:, 1] = values
+    packed_keys["handle_left"][:] = packed_keys["co"]
+    packed_keys["handle_right"][:] = packed_keys["co"]
+    packed_keys["interpolation"][:] = interpolation
+    return packed_keys
+
+
+def new_bezier_keys(frames, values):
+    # Handles at one third of the neighbor segments, with the slope of the neighbor keys.
+    packed_keys = new_keys(frames, values, fcurve_keys.INTERPOLATION_BEZIER)
+    slopes = numpy.gradient(values, frames)
+    step = numpy.gradient(frames) / 3.0
+    packed_keys["handle_left"][:, 0] = frames - step
+    packed_keys["handle_left"][:, 1] = values - slopes * step
+    packed_keys["handle_right"][:, 0] = frames + step
+    packed_keys["handle_right"][:, 1] = values + slopes * step
+    packed_keys["handle_left_type"][:] = fcurve_keys.HANDLE_AUTO_CLAMPED
+    packed_keys["handle_right_type"][:] = fcurve_keys.HANDLE_AUTO_CLAMPED
+    return packed_keys
+
+
+def test_rdp_keeps_ends_and_removes_straight_keys():
+    frames = numpy.arange(5.0)
+    keep = fcurve_reduce.get_rdp_keep_mask(frames, frames * 2.0, 0.001)
+    assert keep.tolist() == [True, False, False, False, True]
+
+
+def test_rdp_keeps_peak():
+    frames = numpy.arange(5.0)
+    values = numpy.array([0.0, 0.0, 1.0, 0.0, 0.0])
+    assert fcurve_reduce.get_rdp_keep_mask(frames, values, 0.5).tolist() == [True, False, True, False, True]
+    assert fcurve_reduce.get_rdp_keep_mask(frames, values, 1.5).tolist() == [True, False, False, False, True]
+
+
+def test_rdp_empty_and_single_key():
+    assert fcurve_reduce.get_rdp_keep_mask(numpy.zeros(0), numpy.zeros(0), 0.1).tolist() == []
+    assert fcurve_reduce.get_rdp_keep_mask(numpy.zeros(1), numpy.zeros(1), 0.1).tolist() == [True]
+
+
+def test_lossless_linear_and_flat_keys():
+    frames = [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    values = [0.0, 1.0, 2.0, 5.0, 5.0, 5.0, 0.0]
+    keep = fcurve_reduce.get_lossless_keep_mask(new_keys(frames, values))
+    assert keep.tolist() == [True, False, True, True, False, True, True]
+
+
+def test_lossless_keeps_bezier_keys_with_slopes():
+    frames = numpy.arange(4.0)
+    keep = fcurve_reduce.get_lossless_keep_mask(new_bezier_keys(frames, frames * 2.0))
+    assert keep.all()
+
+
+def test_decimate_keeps_stepped_keys():
+    packed_keys = new_keys([0.0, 1.0, 2.0, 3.0], [0.0, 0.0, 0.0, 0.0], fcurve_keys.INTERPOLATION_CONSTANT)
+    assert fcurve_reduce.get_decimate_keep_mask(packed_keys, 1.0).all()
+
+
+@pytest.mark.parametrize("tolerance", [0.001, 0.05, 0.3])
+def test_decimate_error_bound(tolerance):
+    # The reduced curve stays within the tolerance at every removed key.
+    frames = numpy.arange(0.0, 120.0)
+    values = numpy.sin(frames * 0.1) + 0.3 * numpy.sin(frames * 0.37)
+    packed_keys = new_bezier_keys(frames, values)
+
+    keep = fcurve_reduce.get_decimate_keep_mask(packed_keys, tolerance)
+    reduced_keys = fcurve_reduce.reduce_packed_keys(packed_keys, keep)
+    assert 2 < fcurve_keys.get_packed_keys_count(reduced_keys) < len(frames)
+
+    reduced_values = fcurve_evaluate.evaluate_packed_keys(reduced_keys, frames)
+    assert numpy.abs(reduced_values - values).max() <= tolerance + 1e-6
+
+
+def test_decimate_keeps_unchanged_segments():
+    # Segments between two kept neighbor keys keep their bezier shape.
+    frames = numpy.arange(0.0, 8.0)
+    values = numpy.array([0.0, 0.0, 0.0, 0.0, 2.0, -1.0, 3.0, 0.0])
+    packed_keys = new_bezier_keys(frames, values)
+    keep = fcurve_reduce.get_decimate_keep_mask(packed_keys, 0.01)
+    assert keep.tolist() == [True, False, False, True, True, True, True, True]
+
+    reduced_keys = fcurve_reduce.reduce_packed_keys(packed_keys, keep)
+    interpolation = reduced_keys["interpolation"].tolist()
+    assert interpolation[:2] == [fcurve_keys.INTERPOLATION_LINEAR, fcurve_keys.INTERPOLATION_BEZIER]
+    assert reduced_keys["handle_right_type"][:2].tolist() == [fcurve_keys.HANDLE_FREE, fcurve_keys.HANDLE_FREE]
+    assert reduced_keys["handle_right_type"][2] == fcurve_keys.HANDLE_AUTO_CLAMPED
+
+    unchanged_frames = numpy.linspace(3.0, 7.0, 41)
+    original = fcurve_evaluate.evaluate_packed_keys(packed_keys, unchanged_frames)
+    assert fcurve_evaluate.evaluate_packed_keys(reduced_keys, unchanged_frames) == pytest.approx(original)
@@ -0,0 +1,94 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+
+
+import pytest
+from graph_curve_filter.bbpl import fcurve_keys
+from graph_curve_filter.bbpl import fcurve_stats
+from graph_curve_filter.bbpl import fcurve_evaluate
+
+
+def new_keys(frames, values, interpolation=fcurve_keys.INTERPOLATION_LINEAR):
+    packed_keys = fcurve_keys.new_packed_keys(len(frames))
+    packed_keys["co"][:, 0] = frames
+    packed_keys["co"][:, 1] = values
+    packed_keys["handle_left"][:] = packed_keys["co"]
+    packed_keys["handle_right"][:] = packed_keys["co"]
+    packed_keys["interpolation"][:] = interpolation
+    return packed_keys
+
+
+def get_stats(keys_list, frame_step=1.0):
+    curves = fcurve_evaluate.PackedCurves(keys_list, [fcurve_keys.EXTRAPOLATION_CONSTANT] * len(keys_list))
+    return fcurve_stats.get_packed_curves_stats(curves, frame_step)
+
+
+def test_linear_ramp():
+    stats = get_stats([new_keys([0.0, 10.0], [0.0, 20.0])])
+    assert stats.key_counts.tolist() == [2]
+    assert stats.value_min[0] == 0.0
+    assert stats.value_max[0] == 20.0
+    assert stats.value_mean[0] == pytest.approx(10.0)
+    assert stats.peak_velocity[0] == pytest.approx(2.0)
+    assert stats.peak_acceleration[0] == pytest.approx(0.0)
+
+
+def test_fractional_last_key_is_sampled():
+    stats = get_stats([new_keys([0.0, 10.5], [0.0, 21.0])])
+    assert stats.value_max[0] == 21.0
+    # The last interval is half a frame, the velocity stays the slope of the segment.
+    assert stats.peak_velocity[0] == pytest.approx(2.0)
+    assert stats.peak_acceleration[0] == pytest.approx(0.0, abs=1e-9)
+
+
+def test_fractional_key_between_samples_is_in_range():
+    stats = get_stats([new_keys([0.0, 2.5, 5.0], [0.0, 10.0, 0.0])])
+    assert stats.value_max[0] == 10.0
+
+
+def test_sample_counts():
+    curves = fcurve_evaluate.PackedCurves(
+        [new_keys([0.0, 10.0], [0.0, 1.0]), new_keys([], []), new_keys([2.0, 4.5], [0.0, 1.0])],
+        [fcurve_keys.EXTRAPOLATION_CONSTANT] * 3,
+    )
+    frame_starts, frame_ends, sample_counts = fcurve_stats.get_curve_sample_counts(curves, 1.0)
+    assert frame_starts.tolist() == [0.0, 0.0, 2.0]
+    assert frame_ends.tolist() == [10.0, 0.0, 4.5]
+    assert sample_counts.tolist() == [11, 0, 4]
+
+
+def test_constant_step_velocity_and_empty_curve():
+    stats = get_stats([
+        new_keys([0.0, 2.0, 4.0], [0.0, 1.0, 1.0], fcurve_keys.INTERPOLATION_CONSTANT),
+        new_keys([], []),
+    ])
+    assert stats.peak_velocity.tolist() == [1.0, 0.0]
+    assert stats.value_range.tolist() == [1.0, 0.0]
+    # Samples 0, 0, 1, 1, 1 at frames 0 to 4
+    assert stats.value_mean.tolist() == [0.6, 0.0]
+
+
+def test_curves_do_not_mix_in_chunks(monkeypatch):
+    monkeypatch.setattr(fcurve_stats, "MAX_CHUNK_SAMPLES", 4)
+    keys_list = [new_keys([0.0, 10.0], [0.0, float(index)]) for index in range(5)]
+    stats = get_stats(keys_list)
+    assert stats.value_max.tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert stats.value_mean == pytest.approx([index / 2.0 for index in range(5)])
+    assert stats.peak_velocity == pytest.approx([index / 10.0 for index in range(5)])
+    assert stats.peak_acceleration == pytest.approx([0.0] * 5, abs=1e-9)
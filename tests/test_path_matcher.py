@@ -0,0 +1,78 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+
+import pytest
+from graph_curve_filter.bbam import path_matcher
+
+
+@pytest.mark.parametrize("rule, path, excluded", [
+    # Folder name at any depth
+    ("bbam/", "bbam/config.py", True),
+    ("bbam/", "lib/bbam/config.py", True),
+    ("bbam/", "bbam", False),
+    ("bbam/", "bbam_tools/config.py", False),
+    # Rule with a "/" is relative to the addon root
+    ("docs/api/", "docs/api/index.html", True),
+    ("docs/api/", "lib/docs/api/index.html", False),
+    ("/build", "build/out.zip", True),
+    ("/build", "src/build/out.zip", False),
+    # File name patterns
+    ("*.pyc", "module.pyc", True),
+    ("*.pyc", "package/sub/module.pyc", True),
+    ("*.pyc", "module.py", False),
+    ("module?.py", "module1.py", True),
+    ("module?.py", "module10.py", False),
+    ("[ab].txt", "a.txt", True),
+    ("[ab].txt", "c.txt", False),
+    # "**" matches any number of folders, "*" stays in one
+    ("**/*.blend1", "a.blend1", True),
+    ("**/*.blend1", "scenes/old/a.blend1", True),
+    ("tests/*.py", "tests/sub/test.py", False),
+    ("tests/**", "tests/sub/test.py", True),
+    # A file or folder name matches everything inside
+    ("README.md", "README.md", True),
+    ("README.md", "docs/README.md", True),
+    ("README.md", "README.md.bak", False),
+    ("tests", "tests/test_a.py", True),
+])
+def test_exclude_rules(rule, path, excluded):
+    assert path_matcher.PathMatcher([rule]).is_file_excluded(path) == excluded
+
+
+def test_include_rules_win():
+    matcher = path_matcher.PathMatcher(["*.txt", "docs/"], ["LICENSE.txt", "docs/manual/"])
+    assert matcher.is_file_excluded("notes.txt")
+    assert not matcher.is_file_excluded("LICENSE.txt")
+    assert matcher.is_file_excluded("docs/index.md")
+    assert not matcher.is_file_excluded("docs/manual/index.md")
+
+
+def test_folder_exclusion():
+    matcher = path_matcher.PathMatcher(["__pycache__/", "*.pyc"])
+    assert matcher.is_folder_excluded("__pycache__")
+    assert matcher.is_folder_excluded("bbpl/__pycache__")
+    assert not matcher.is_folder_excluded("bbpl")
+    # With include rules a folder is walked, one of its files may be included
+    assert not path_matcher.PathMatcher(["docs/"], ["docs/a.md"]).is_folder_excluded("docs")
+    assert not path_matcher.PathMatcher([]).is_folder_excluded("docs")
+
+
+def test_windows_separators():
+    matcher = path_matcher.PathMatcher(["docs\\api/"])
+    assert matcher.is_file_excluded("docs/api/index.html")